@@ -0,0 +1,1191 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the SSA data pipeline and dashboard.
+
+Each sub-command times one stage and prints a small table, e.g.:
+
+    python scripts/benchmarks.py ingest            # Excel ingestion on downloads/
+    python scripts/benchmarks.py stream --rows 20000   # eager vs streaming load
+    python scripts/benchmarks.py convert               # DataFrame -> SSAData objects
+    python scripts/benchmarks.py records               # retained memory per record
+    python scripts/benchmarks.py categorical           # object vs category columns
+    python scripts/benchmarks.py mapping               # column mapping: detect vs cached
+    python scripts/benchmarks.py dates                 # date diagnostics: iterrows vs masks
+    python scripts/benchmarks.py parse-dates           # 'Emitida Em': to_datetime vs fixed layout
+    python scripts/benchmarks.py validator             # validator scaling (quadratic vs linear)
+    python scripts/benchmarks.py rules                 # rule engine: per-row checks vs masks
+    python scripts/benchmarks.py filter                # filter_ssas: linear scan vs indexes
+    python scripts/benchmarks.py diagnostics           # loader log volume per diagnostics level
+    python scripts/benchmarks.py dashboard-filters     # filter callback: copy+masks vs bitmaps
+    python scripts/benchmarks.py callback-cache        # memoized filter callback (hit ratio, latency)
+    python scripts/benchmarks.py bar-charts            # bar chart SSA lists: masks vs one groupby
+    python scripts/benchmarks.py drilldown             # callback bytes: embedded SSA lists vs bar ids
+    python scripts/benchmarks.py filter-callbacks      # per-output latency via a scripted Dash client
+    python scripts/benchmarks.py table                 # ssa-table: all rows vs server-side pages
+    python scripts/benchmarks.py table-records         # ssa-table rows: iterrows vs columnar builder
+    python scripts/benchmarks.py modal                 # drill-down modal: whole SSA list vs pages
+"""
+from __future__ import annotations
+import sys
+import glob
+import time
+import argparse
+import logging
+import statistics
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+# Allow running from repo root
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CLASS_DIR = REPO_ROOT / "src" / "dashboard" / "Class"
+# Ensure the 'Class' package root is on sys.path so 'src.*' inside it resolves
+if str(CLASS_DIR) not in sys.path:
+    sys.path.insert(0, str(CLASS_DIR))
+
+import pandas as pd  # noqa: E402
+
+from src.data.data_loader import DataLoader  # type: ignore  # noqa: E402
+from src.data.ssa_columns import SSAColumns  # type: ignore  # noqa: E402
+from src.data.ssa_data import SSAData  # type: ignore  # noqa: E402
+
+
+def timeit(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Return the median wall time (seconds) of ``repeat`` calls to ``fn``."""
+    samples = []
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def print_table(headers: list[str], rows: list[list]) -> None:
+    widths = [
+        max(len(str(h)), *(len(str(r[i])) for r in rows)) if rows else len(str(h))
+        for i, h in enumerate(headers)
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for r in rows:
+        print("  ".join(str(v).ljust(w) for v, w in zip(r, widths)))
+
+
+def excel_files(path: str) -> list[str]:
+    base = Path(path)
+    if base.is_dir():
+        return sorted(glob.glob(str(base / "*.xlsx")))
+    if base.is_file():
+        return [str(base)]
+    return sorted(glob.glob(path))
+
+
+# ---------------------------------------------------------------------------
+# ingest: legacy multi-read ingestion vs single-parse grid
+# ---------------------------------------------------------------------------
+def _ingest_legacy(path: str) -> pd.DataFrame:
+    """Reproduce the previous I/O pattern: header probe + full read."""
+    loader = DataLoader(path)
+    header_row = loader._detect_header_row()  # read_excel(header=None, nrows=25)
+    return pd.read_excel(path, header=header_row)
+
+
+def _ingest_single(path: str) -> pd.DataFrame:
+    loader = DataLoader(path)
+    grid = loader._read_raw_grid()
+    header_row = loader._detect_header_row(grid=grid)
+    return loader._frame_from_grid(grid, header_row)
+
+
+def bench_ingest(args) -> None:
+    files = excel_files(args.path)
+    if not files:
+        print("No Excel files found for given path.", file=sys.stderr)
+        return
+    rows = []
+    total_before = total_after = 0.0
+    for f in files:
+        before = timeit(lambda: _ingest_legacy(f), args.repeat)
+        after = timeit(lambda: _ingest_single(f), args.repeat)
+        total_before += before
+        total_after += after
+        rows.append(
+            [Path(f).name, f"{before * 1000:.1f}", f"{after * 1000:.1f}", f"{before / after:.2f}x"]
+        )
+    rows.append(
+        ["TOTAL", f"{total_before * 1000:.1f}", f"{total_after * 1000:.1f}", f"{total_before / total_after:.2f}x"]
+    )
+    print_table(["file", "before_ms", "after_ms", "speedup"], rows)
+
+
+# ---------------------------------------------------------------------------
+# stream: eager load vs chunked streaming load (time + peak Python memory)
+# ---------------------------------------------------------------------------
+def _build_large_export(source: str, rows: int, dest: str) -> None:
+    """Tile the data rows of ``source`` until ``rows`` rows, keeping title/header."""
+    from openpyxl import Workbook, load_workbook
+
+    src = load_workbook(source, read_only=True, data_only=True)
+    grid = [list(r) for r in src.worksheets[0].iter_rows(values_only=True)]
+    src.close()
+    top, body = grid[:2], [r for r in grid[2:] if any(v is not None for v in r)]
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for r in top:
+        ws.append(r)
+    for i in range(rows):
+        ws.append(body[i % len(body)])
+    wb.save(dest)
+
+
+def _peak_and_time(fn: Callable[[], object]) -> tuple[float, float]:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def bench_stream(args) -> None:
+    files = excel_files(args.source)
+    if not files:
+        print("No Excel files found for given path.", file=sys.stderr)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        big = str(Path(tmp) / "large_export.xlsx")
+        _build_large_export(files[0], args.rows, big)
+        size_mb = Path(big).stat().st_size / (1024 * 1024)
+        print(f"Synthetic export: {args.rows} rows, {size_mb:.1f} MiB")
+        rows = []
+        t, peak = _peak_and_time(lambda: DataLoader(big).load_data())
+        rows.append(["eager", f"{t:.2f}", f"{peak:.1f}"])
+        for chunk in args.chunk_rows:
+            t, peak = _peak_and_time(
+                lambda: DataLoader(big, streaming=True, chunk_rows=chunk).load_data()
+            )
+            rows.append([f"streaming ({chunk})", f"{t:.2f}", f"{peak:.1f}"])
+    print_table(["mode", "seconds", "peak_MiB"], rows)
+
+
+# ---------------------------------------------------------------------------
+# convert: iterrows + SSAData(...) vs vectorized columns + from_trusted
+# ---------------------------------------------------------------------------
+def synthetic_canonical_frame(rows: int, source: str | None = None) -> pd.DataFrame:
+    """Canonical DataFrame with ``rows`` rows, tiled from a real export if given."""
+    if source:
+        base = DataLoader(source).load_data().reset_index(drop=True)
+    else:
+        base = pd.DataFrame(
+            {
+                idx: (
+                    pd.to_datetime(["01/09/2025 10:00:00"] * 4, dayfirst=True)
+                    if idx == SSAColumns.EMITIDA_EM
+                    else [f"v{idx}-{i}" for i in range(4)]
+                )
+                for idx in SSAColumns.COLUMN_NAMES
+            }
+        )
+    reps = -(-rows // len(base))
+    df = pd.concat([base] * reps, ignore_index=True).iloc[:rows].copy()
+    df[SSAColumns.NUMERO_SSA] = [f"SSA-{i}" for i in range(rows)]
+    return df
+
+
+def _loader_for(df: pd.DataFrame) -> DataLoader:
+    loader = DataLoader("<synthetic>")
+    loader.df = df
+    loader._col_labels = {idx: idx for idx in SSAColumns.COLUMN_NAMES}
+    return loader
+
+
+def _convert_legacy(loader: DataLoader) -> list:
+    """Previous per-row conversion (iterrows + closure + validating constructor)."""
+    out = []
+    for idx, row in loader.df.iterrows():
+        def gv(i):
+            lbl = loader._get_label(i)
+            if lbl is None:
+                return None
+            return row[lbl] if (lbl in row.index or lbl in row) else None
+
+        raw_resp = gv(SSAColumns.RESPONSAVEL_EXECUCAO)
+        responsavel = str(raw_resp).strip() if raw_resp is not None else ""
+        responsavel = None if responsavel.lower() in ["nan", "none", ""] else responsavel.upper()
+        raw_prog = gv(SSAColumns.RESPONSAVEL_PROGRAMACAO)
+        resp_prog = str(raw_prog).strip() if raw_prog is not None else ""
+        resp_prog = None if resp_prog.lower() in ["nan", "none", ""] else resp_prog.upper()
+        try:
+            out.append(
+                SSAData(
+                    numero=str(gv(SSAColumns.NUMERO_SSA) or "").strip(),
+                    situacao=str(gv(SSAColumns.SITUACAO) or "").strip(),
+                    derivada=(str(gv(SSAColumns.DERIVADA) or "").strip() or None),
+                    localizacao=str(gv(SSAColumns.LOCALIZACAO) or "").strip(),
+                    desc_localizacao=str(gv(SSAColumns.DESC_LOCALIZACAO) or "").strip(),
+                    equipamento=str(gv(SSAColumns.EQUIPAMENTO) or "").strip(),
+                    semana_cadastro=str(gv(SSAColumns.SEMANA_CADASTRO) or "").strip(),
+                    emitida_em=(gv(SSAColumns.EMITIDA_EM) if pd.notna(gv(SSAColumns.EMITIDA_EM)) else None),
+                    descricao=str(gv(SSAColumns.DESC_SSA) or "").strip(),
+                    setor_emissor=str(gv(SSAColumns.SETOR_EMISSOR) or "").strip(),
+                    setor_executor=str(gv(SSAColumns.SETOR_EXECUTOR) or "").strip(),
+                    solicitante=str(gv(SSAColumns.SOLICITANTE) or "").strip(),
+                    servico_origem=str(gv(SSAColumns.SERVICO_ORIGEM) or "").strip(),
+                    prioridade_emissao=str(gv(SSAColumns.GRAU_PRIORIDADE_EMISSAO) or "").strip().upper(),
+                    prioridade_planejamento=(str(gv(SSAColumns.GRAU_PRIORIDADE_PLANEJAMENTO) or "").strip() or None),
+                    execucao_simples=str(gv(SSAColumns.EXECUCAO_SIMPLES) or "").strip(),
+                    responsavel_programacao=resp_prog,
+                    semana_programada=(str(gv(SSAColumns.SEMANA_PROGRAMADA) or "").strip() or None),
+                    responsavel_execucao=responsavel,
+                    descricao_execucao=(str(gv(SSAColumns.DESCRICAO_EXECUCAO) or "").strip() or None),
+                    sistema_origem=str(gv(SSAColumns.SISTEMA_ORIGEM) or "").strip(),
+                    anomalia=(str(gv(SSAColumns.ANOMALIA) or "").strip() or None),
+                )
+            )
+        except ValueError:
+            continue
+    return out
+
+
+def bench_convert(args) -> None:
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        loader = _loader_for(df)
+        if n <= args.legacy_max:
+            before = timeit(lambda: _convert_legacy(loader), args.repeat)
+            legacy = [o.to_dict() for o in _convert_legacy(loader)]
+        else:
+            before, legacy = None, None
+        after = timeit(lambda: loader.get_ssa_objects().materialize(), args.repeat)
+        if legacy is not None:
+            current = [o.to_dict() for o in loader.get_ssa_objects().materialize()]
+            assert legacy == current, "outputs differ"
+        rows.append(
+            [
+                n,
+                f"{before:.3f}" if before is not None else "-",
+                f"{after:.3f}",
+                f"{before / after:.1f}x" if before is not None else "-",
+            ]
+        )
+    print_table(["rows", "before_s", "after_s", "speedup"], rows)
+
+
+# ---------------------------------------------------------------------------
+# records: memory retained by the loaded SSA sequence (on top of the DataFrame)
+# ---------------------------------------------------------------------------
+def _retained_bytes(build: Callable[[], object]) -> int:
+    """Bytes still allocated (tracemalloc) while the built object is alive."""
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    obj = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return current - base
+
+
+def _fresh(value):
+    """Independent copy of a string (as produced by parsing row by row)."""
+    return value.encode().decode() if isinstance(value, str) else value
+
+
+def bench_records(args) -> None:
+    from src.data.ssa_table import SSATable  # type: ignore
+
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        dicts = [r.to_dict() for r in SSATable(df)]
+        for d in dicts:
+            d["emitida_em"] = pd.Timestamp(d["emitida_em"]) if d["emitida_em"] else None
+        variants = {
+            "SSAData(...) per row": lambda: [
+                SSAData(**{k: _fresh(v) for k, v in d.items()}) for d in dicts
+            ],
+            "list[SSAData] bulk": lambda: SSATable(df).materialize(),
+            "SSATable": lambda: SSATable(df),
+        }
+        for name, build in variants.items():
+            size = _retained_bytes(build)
+            rows.append([n, name, f"{size / (1024 * 1024):.1f}", f"{size / n:.0f}"])
+    print_table(["rows", "representation", "retained_MiB", "bytes_per_record"], rows)
+
+
+def bench_categorical(args) -> None:
+    from src.data.categoricals import CATEGORICAL_COLUMNS, to_categorical  # type: ignore
+
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        obj = synthetic_canonical_frame(n, files[0] if files else None)
+        cat = to_categorical(obj.copy())
+        for name, df in (("object", obj), ("category", cat)):
+            setor = df[SSAColumns.SETOR_EXECUTOR]
+            value = setor.iloc[0]
+            ops = {
+                "filter ==": lambda: df[setor == value],
+                "value_counts": lambda: df[SSAColumns.SITUACAO].value_counts(),
+                "groupby size": lambda: df.groupby(
+                    [SSAColumns.SETOR_EXECUTOR, SSAColumns.GRAU_PRIORIDADE_EMISSAO],
+                    observed=True,
+                ).size(),
+            }
+            mem = df[list(CATEGORICAL_COLUMNS)].memory_usage(deep=True, index=False).sum()
+            timings = [f"{timeit(fn, args.repeat) * 1000:.2f}" for fn in ops.values()]
+            rows.append([n, name, f"{mem / (1024 * 1024):.1f}", *timings])
+    print_table(
+        ["rows", "dtype", "cat_cols_MiB", "filter_ms", "value_counts_ms", "groupby_ms"],
+        rows,
+    )
+
+
+def bench_mapping(args) -> None:
+    files = excel_files(args.source)
+    if not files:
+        print("No Excel files found.", file=sys.stderr)
+        return
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        headerless = str(Path(tmp) / "headerless.xlsx")
+        pd.read_excel(files[0], header=None, skiprows=2).to_excel(
+            headerless, header=False, index=False
+        )
+        cache_dir = str(Path(tmp) / "cache")
+        mappings = Path(cache_dir) / "column_mappings.json"
+
+        def load(path: str, cold: bool) -> None:
+            if cold and mappings.exists():
+                mappings.unlink()
+            loader = DataLoader(path, cache_dir=cache_dir)
+            loader.cache = None  # só o cache de layouts; sem snapshots
+            loader.load_data()
+
+        for name, path in (("header", files[0]), ("headerless", headerless)):
+            cold = timeit(lambda: load(path, True), args.repeat)
+            warm = timeit(lambda: load(path, False), args.repeat)
+            rows.append([name, f"{cold * 1000:.1f}", f"{warm * 1000:.1f}", f"{(cold - warm) * 1000:+.1f}"])
+    print_table(["layout", "load_ms (detect)", "load_ms (cached map)", "saved_ms"], rows)
+
+
+def _diagnose_dates_legacy(df: pd.DataFrame, col: int) -> list:
+    """Previous diagnose_dates row loop (returns the problem reasons only)."""
+    from datetime import datetime
+
+    reasons = []
+    for idx, row in df.iterrows():
+        value = row.iloc[col]
+        if pd.isna(value):
+            reasons.append("Valor nulo ou NaN")
+            row.to_dict()
+        elif isinstance(value, str):
+            try:
+                pd.to_datetime(value, dayfirst=True)
+            except Exception as e:
+                reasons.append(f"Erro na conversão: {str(e)}")
+                row.to_dict()
+        elif not isinstance(value, (pd.Timestamp, datetime)):
+            reasons.append(f"Tipo inválido: {type(value)}")
+            row.to_dict()
+        else:
+            now = pd.Timestamp.now()
+            if not (now - pd.DateOffset(years=30) <= value <= now + pd.DateOffset(years=1)):
+                reasons.append("Data fora do intervalo esperado")
+                row.to_dict()
+    return reasons
+
+
+def bench_dates(args) -> None:
+    import warnings
+    from src.utils.date_utils import diagnose_dates  # type: ignore
+
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        # Coluna como sai do Excel (antes de _convert_dates): strings dd/mm/aaaa
+        df = synthetic_canonical_frame(n, files[0] if files else None).astype(object)
+        col = SSAColumns.EMITIDA_EM
+        df[col] = df[col].map(
+            lambda v: v.strftime("%d/%m/%Y %H:%M:%S") if pd.notna(v) else None
+        )
+        df.iloc[::97, col] = "invalida"
+        df.iloc[::89, col] = None
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            if n <= args.legacy_max:
+                before = timeit(lambda: _diagnose_dates_legacy(df, col), args.repeat)
+                legacy = _diagnose_dates_legacy(df, col)
+                report = diagnose_dates(df, col, max_rows=None)
+                assert legacy == [r["reason"] for r in report["problematic_rows"]]
+            else:
+                before = None
+            after = timeit(lambda: diagnose_dates(df, col), args.repeat)
+        rows.append(
+            [
+                n,
+                f"{before:.3f}" if before is not None else "-",
+                f"{after * 1000:.1f}",
+                f"{before / after:.0f}x" if before is not None else "-",
+            ]
+        )
+    print_table(["rows", "before_s", "after_ms", "speedup"], rows)
+
+
+def bench_parse_dates(args) -> None:
+    from src.utils.date_utils import SAM_DATETIME_FORMAT, parse_sam_datetimes  # type: ignore
+
+    def general(s: pd.Series) -> pd.Series:
+        return pd.to_datetime(
+            s, format=SAM_DATETIME_FORMAT, errors="coerce", dayfirst=True
+        ).astype("datetime64[ns]")
+
+    columns = []
+    for path in excel_files(args.source):
+        loader = DataLoader(path)
+        grid = loader._read_raw_grid()
+        loader.df = loader._frame_from_grid(grid, loader._detect_header_row(grid=grid))
+        loader._build_column_mapping()
+        label = loader._get_label(SSAColumns.EMITIDA_EM)
+        if label in loader.df.columns:
+            columns.append((Path(path).name[-22:], loader.df[label]))
+    stamps = pd.date_range("2020-01-01", periods=args.rows, freq="37s")
+    synthetic = pd.Series(stamps.strftime("%d/%m/%Y %H:%M:%S"), dtype=object)
+    synthetic.iloc[::1000] = "invalida"
+    columns.append((f"synthetic {args.rows:,}", synthetic))
+
+    rows = []
+    for name, col in columns:
+        before = timeit(lambda: general(col), args.repeat)
+        after = timeit(lambda: parse_sam_datetimes(col), args.repeat)
+        pd.testing.assert_series_equal(general(col), parse_sam_datetimes(col))
+        rows.append([name, len(col), f"{before * 1000:.2f}", f"{after * 1000:.2f}",
+                     f"{before / after:.1f}x"])
+    print_table(["column", "rows", "to_datetime_ms", "fixed_ms", "speedup"], rows)
+
+
+def _validator_legacy(objs: list) -> None:
+    """Hot loops of the previous SSADataValidator (consistency + integrity)."""
+    from datetime import datetime
+
+    resp_counts: dict = {}
+    for ssa in objs:
+        if ssa.responsavel_execucao:
+            resp_counts[ssa.responsavel_execucao] = resp_counts.get(ssa.responsavel_execucao, 0) + 1
+    for resp in resp_counts:
+        [s for s in objs if s.responsavel_execucao == resp]
+    [s.numero for s in objs if s.responsavel_execucao and not s.setor_executor]
+    [s.numero for s in objs if not all([s.numero, s.situacao, s.prioridade_emissao])]
+    [s.numero for s in objs if s.emitida_em and s.emitida_em > datetime.now()]
+    numeros = [s.numero for s in objs]
+    set([n for n in numeros if numeros.count(n) > 1])
+
+
+def bench_validator(args) -> None:
+    from src.data.ssa_table import SSATable  # type: ignore
+    from src.utils.data_validator import SSADataValidator  # type: ignore
+
+    files = excel_files(args.source) if args.source else []
+    validator = SSADataValidator()
+
+    def run(table):
+        validator.validate_data_consistency(table)
+        validator.verify_data_integrity(table)
+
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        table = SSATable(df)
+        before = None
+        if n <= args.legacy_max:
+            objs = table.materialize()
+            before = timeit(lambda: _validator_legacy(objs), args.repeat)
+        after = timeit(lambda: run(table), args.repeat)
+        rows.append(
+            [
+                n,
+                f"{before:.3f}" if before is not None else "-",
+                f"{before / n * 1e6:.1f}" if before is not None else "-",
+                f"{after:.3f}",
+                f"{after / n * 1e6:.2f}",
+            ]
+        )
+    print_table(["rows", "before_s", "before_us/row", "after_s", "after_us/row"], rows)
+
+
+def _rules_rowwise(df: pd.DataFrame, now) -> list:
+    """Same checks as DEFAULT_RULES, one row at a time (reference for the masks)."""
+    import re
+    from collections import Counter
+
+    week = re.compile(r"^\d{4}(0[1-9]|[1-4]\d|5[0-3])$")
+    C = SSAColumns
+
+    def text(v):
+        return "" if v is None or (not isinstance(v, str) and pd.isna(v)) else str(v).strip()
+
+    counts = Counter(text(v) for v in df[C.NUMERO_SSA])
+    issues = []
+    for pos, row in enumerate(df.itertuples(index=False)):
+        numero, situacao = text(row[C.NUMERO_SSA]), text(row[C.SITUACAO])
+        emitida = row[C.EMITIDA_EM]
+        checks = {
+            "numero_vazio": numero == "",
+            "situacao_vazia": situacao == "",
+            "prioridade_vazia": text(row[C.GRAU_PRIORIDADE_EMISSAO]) == "",
+            "data_invalida": pd.isna(emitida),
+            "data_futura": pd.notna(emitida) and emitida > now,
+            "responsavel_sem_setor": text(row[C.RESPONSAVEL_EXECUCAO]).upper()
+            not in ("", "NAN", "NONE")
+            and text(row[C.SETOR_EXECUTOR]) == "",
+            "numero_duplicado": numero != "" and counts[numero] > 1,
+            "semana_cadastro_invalida": text(row[C.SEMANA_CADASTRO]) != ""
+            and not week.match(text(row[C.SEMANA_CADASTRO])),
+            "semana_programada_invalida": text(row[C.SEMANA_PROGRAMADA]) != ""
+            and not week.match(text(row[C.SEMANA_PROGRAMADA])),
+            "situacao_desconhecida": situacao != ""
+            and situacao.upper() not in C.STATE_DESCRIPTIONS,
+        }
+        issues.extend((name, pos) for name, bad in checks.items() if bad)
+    return issues
+
+
+def bench_rules(args) -> None:
+    from src.data.categoricals import to_categorical  # type: ignore
+    from src.utils.validation_rules import DEFAULT_RULES  # type: ignore
+
+    files = excel_files(args.source) if args.source else []
+    now = pd.Timestamp.now()
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        cat = to_categorical(df.copy())
+        before = timeit(lambda: _rules_rowwise(df, now), args.repeat) if n <= args.legacy_max else None
+        after = timeit(lambda: DEFAULT_RULES.evaluate(df, now=now), args.repeat)
+        after_cat = timeit(lambda: DEFAULT_RULES.evaluate(cat, now=now), args.repeat)
+        rows.append(
+            [
+                n,
+                f"{n / before:,.0f}" if before is not None else "-",
+                f"{n / after:,.0f}",
+                f"{n / after_cat:,.0f}",
+                len(DEFAULT_RULES.evaluate(df, now=now)),
+            ]
+        )
+    print_table(["rows", "rowwise_rows/s", "masks_rows/s", "masks_cat_rows/s", "issues"], rows)
+
+
+def _filter_legacy(ssas, setor, prioridade, data_inicio, data_fim) -> list:
+    """Previous filter_ssas body: one list comprehension per criterion."""
+    out = ssas
+    setor, prioridade = setor.strip().upper(), prioridade.strip().upper()
+    out = [s for s in out if s.setor_executor and s.setor_executor.strip().upper() == setor]
+    out = [s for s in out if s.prioridade_emissao and s.prioridade_emissao.strip().upper() == prioridade]
+    out = [s for s in out if s.emitida_em and s.emitida_em >= data_inicio]
+    out = [s for s in out if s.emitida_em and s.emitida_em <= data_fim]
+    return out
+
+
+def bench_filter(args) -> None:
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        loader = _loader_for(df)
+        table = loader.get_ssa_objects()
+        dates = df[SSAColumns.EMITIDA_EM].dropna().sort_values()
+        setor = df[SSAColumns.SETOR_EXECUTOR].mode().iloc[0]
+        prioridade = df[SSAColumns.GRAU_PRIORIDADE_EMISSAO].mode().iloc[0]
+        query = (setor, prioridade, dates.iloc[len(dates) // 4], dates.iloc[3 * len(dates) // 4])
+
+        before = None
+        if n <= args.legacy_max:
+            ssas = list(table)
+            before = timeit(lambda: _filter_legacy(ssas, *query), args.repeat)
+        build = timeit(lambda: setattr(loader, "_ssa_index", None) or loader.get_ssa_index(), 1)
+        after = timeit(lambda: loader.filter_ssas(*query, diagnose=False), args.repeat)
+        hits = len(loader.filter_ssas(*query, diagnose=False)[0])
+        rows.append(
+            [
+                n,
+                hits,
+                f"{before * 1e3:.1f}" if before is not None else "-",
+                f"{build * 1e3:.1f}",
+                f"{after * 1e3:.2f}",
+            ]
+        )
+    print_table(["rows", "hits", "scan_ms", "index_build_ms", "indexed_query_ms"], rows)
+
+
+def bench_diagnostics(args) -> None:
+    import io
+    from src.utils.diagnostics import Diagnostics  # type: ignore
+
+    files = excel_files(args.source) if args.source else []
+    frames = [(n, synthetic_canonical_frame(n, files[0] if files else None)) for n in args.sizes]
+    # Mede a E/S de log real: INFO habilitado, saída só para um buffer em memória
+    root = logging.getLogger()
+    saved = (root.handlers[:], root.level)
+    logging.disable(logging.NOTSET)
+    rows = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for n, df in frames:
+                for level in ("off", "summary", "full"):
+                    buf = io.StringIO()
+                    root.handlers = [logging.StreamHandler(buf)]
+                    root.setLevel(logging.INFO)
+                    path = Path(tmp) / f"diag-{n}-{level}.log"
+
+                    def run():
+                        loader = _loader_for(df)
+                        loader.diagnostics = Diagnostics(level, str(path))
+                        loader._convert_to_objects()
+                        loader.diagnostics.close()
+
+                    t = timeit(run, args.repeat)
+                    detail = path.stat().st_size if path.exists() else 0
+                    rows.append(
+                        [n, level, f"{t * 1e3:.1f}", len(buf.getvalue()) // args.repeat,
+                         detail // args.repeat]
+                    )
+    finally:
+        root.handlers, level = saved
+        root.setLevel(level)
+        logging.disable(logging.CRITICAL)
+    print_table(["rows", "level", "convert_ms", "log_bytes", "detail_file_bytes"], rows)
+
+
+def _filter_combos(df: pd.DataFrame, count: int, seed: int = 0) -> list:
+    """Random dropdown combinations (each filter set with probability 1/2)."""
+    import random
+
+    from src.dashboard.filter_index import FILTER_COLUMNS  # type: ignore
+
+    rnd = random.Random(seed)
+    values = {
+        name: [v for v in df[idx].unique() if isinstance(v, str) and v]
+        for name, idx in FILTER_COLUMNS.items()
+    }
+    return [
+        {name: rnd.choice(vals) if vals and rnd.random() < 0.5 else None
+         for name, vals in values.items()}
+        for _ in range(count)
+    ]
+
+
+def _percentiles(samples: list) -> tuple:
+    ordered = sorted(samples)
+    return ordered[len(ordered) // 2], ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def bench_dashboard_filters(args) -> None:
+    from src.dashboard.filter_index import FILTER_COLUMNS, FilterIndex  # type: ignore
+    from src.dashboard.ssa_dashboard import SSADashboard  # type: ignore
+
+    def legacy_select(df, filters):
+        out = df.copy()
+        for name, value in filters.items():
+            if value:
+                out = out[out.iloc[:, FILTER_COLUMNS[name]] == value]
+        return out
+
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        combos = _filter_combos(df, args.requests)
+        build = timeit(lambda: FilterIndex(df), 1)
+        index = FilterIndex(df)
+        app = SSADashboard(df)
+        app._get_filter_index()
+        samples = {"legacy_select": [], "index_select": [], "callback": []}
+        for filters in combos:
+            for key, fn in (
+                ("legacy_select", lambda: legacy_select(df, filters)),
+                ("index_select", lambda: index.filter(**filters)),
+                ("callback", lambda: app._compute_all_outputs(*filters.values())),
+            ):
+                start = time.perf_counter()
+                fn()
+                samples[key].append(time.perf_counter() - start)
+        row = [n, len(combos), f"{build * 1e3:.1f}"]
+        for key in samples:
+            p50, p95 = _percentiles(samples[key])
+            row += [f"{p50 * 1e3:.2f}", f"{p95 * 1e3:.2f}"]
+        rows.append(row)
+    print_table(
+        ["rows", "requests", "index_build_ms", "legacy_sel_p50", "legacy_sel_p95",
+         "index_sel_p50", "index_sel_p95", "callback_p50", "callback_p95"],
+        rows,
+    )
+
+
+def bench_callback_cache(args) -> None:
+    import random
+
+    from src.dashboard.ssa_dashboard import SSADashboard  # type: ignore
+
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        # Usuários alternando entre poucas combinações de filtros
+        working_set = _filter_combos(df, args.distinct, seed=1)
+        rnd = random.Random(2)
+        replay = [rnd.choice(working_set) for _ in range(args.requests)]
+        for label, budget in (("no cache", 0), ("cache", args.budget_mb * 1024 * 1024)):
+            app = SSADashboard(df, callback_cache_bytes=budget)
+            samples = []
+            for filters in replay:
+                start = time.perf_counter()
+                app._compute_all_outputs(*filters.values())
+                samples.append(time.perf_counter() - start)
+            p50, p95 = _percentiles(samples)
+            stats = app.callback_cache.stats()
+            rows.append(
+                [n, label, len(replay), f"{stats['hit_ratio']:.2f}",
+                 f"{stats['bytes'] / 1e6:.1f}", f"{p50 * 1e3:.1f}", f"{p95 * 1e3:.1f}",
+                 f"{sum(samples):.2f}"]
+            )
+    print_table(
+        ["rows", "mode", "requests", "hit_ratio", "cache_MB", "p50_ms", "p95_ms", "total_s"], rows
+    )
+
+
+def bench_bar_charts(args) -> None:
+    import numpy as np
+
+    from src.dashboard.chart_aggregates import CHART_KEYS, ChartAggregates  # type: ignore
+    from src.data.ssa_columns import SSAColumns  # type: ignore
+
+    def legacy_lists(df, chart_type, categories):
+        column = CHART_KEYS[chart_type][0]
+        return [
+            df[df.iloc[:, column] == cat].iloc[:, SSAColumns.NUMERO_SSA].astype(str).tolist()
+            for cat in categories
+        ]
+
+    def grouped_lists(df, chart_type, categories):
+        aggregates = ChartAggregates(df, chart_type)
+        return [aggregates.ssas(cat) for cat in categories]
+
+    files = excel_files(args.source) if args.source else []
+    rng = np.random.default_rng(0)
+    rows = []
+    for n in args.sizes:
+        base = synthetic_canonical_frame(n, files[0] if files else None)
+        for people in args.people:
+            df = base.copy()
+            names = np.array([f"RESPONSAVEL {i:04d}" for i in range(people)], dtype=object)
+            df[SSAColumns.RESPONSAVEL_PROGRAMACAO] = names[rng.integers(0, people, n)]
+            df[SSAColumns.RESPONSAVEL_EXECUCAO] = names[rng.integers(0, people, n)]
+            for chart_type in ("resp_prog", "resp_exec"):
+                categories = df.iloc[:, CHART_KEYS[chart_type][0]].value_counts().index.tolist()
+                assert legacy_lists(df, chart_type, categories) == grouped_lists(
+                    df, chart_type, categories
+                )
+                legacy = timeit(lambda: legacy_lists(df, chart_type, categories), args.repeat)
+                grouped = timeit(lambda: grouped_lists(df, chart_type, categories), args.repeat)
+                rows.append(
+                    [n, people, chart_type, f"{legacy * 1e3:.1f}", f"{grouped * 1e3:.1f}",
+                     f"{legacy / grouped:.1f}x"]
+                )
+    print_table(["rows", "responsaveis", "chart", "masks_ms", "groupby_ms", "speedup"], rows)
+
+
+def bench_drilldown(args) -> None:
+    import copy
+
+    from plotly.io.json import to_json_plotly
+
+    from src.dashboard.filter_index import FILTER_COLUMNS  # type: ignore
+    from src.dashboard.ssa_dashboard import SSADashboard  # type: ignore
+
+    # Posição em _compute_all_outputs -> gráfico no DrilldownIndex
+    charts = {1: "resp_prog", 2: "resp_exec", 3: "week_programmed", 4: "week_registration",
+              6: "state", 7: "week_detail", 9: "weeks_in_state"}
+
+    def embedded(app, outputs, values):
+        """Figuras como antes: customdata com a lista completa de SSAs da barra."""
+        figs = []
+        for i, chart in charts.items():
+            fig = copy.deepcopy(outputs[i])
+            for trace in fig.data:
+                if trace.customdata is not None:
+                    trace.customdata = [
+                        app._drilldown_ssas(chart, bar, x, values)
+                        for bar, x in zip(trace.customdata, trace.x)
+                    ]
+            figs.append(fig)
+        return figs
+
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        app = SSADashboard(df)
+        combos = _filter_combos(df, args.requests) + [dict.fromkeys(FILTER_COLUMNS)]
+        legacy_figs = figs_bytes = rest = 0
+        clicks = []
+        for filters in combos:
+            values = tuple(filters.values())
+            outputs = app._compute_all_outputs(*values)
+            figs_bytes += len(to_json_plotly([outputs[i] for i in charts]))
+            legacy_figs += len(to_json_plotly(embedded(app, outputs, values)))
+            rest += len(to_json_plotly([o for i, o in enumerate(outputs) if i not in charts]))
+            # Latência de um clique (índice já no cache)
+            for i in (1, 2):
+                for trace in outputs[i].data:
+                    for bar, x in zip(trace.customdata or [], trace.x):
+                        start = time.perf_counter()
+                        app._drilldown_ssas(charts[i], bar, x, values)
+                        clicks.append(time.perf_counter() - start)
+        legacy, current = legacy_figs + rest, figs_bytes + rest
+        p50, p95 = _percentiles(clicks) if clicks else (0.0, 0.0)
+        rows.append(
+            [n, len(combos), f"{legacy_figs / 1e6:.2f}", f"{figs_bytes / 1e6:.2f}",
+             f"{legacy / 1e6:.2f}", f"{current / 1e6:.2f}", f"{1 - current / legacy:.0%}",
+             f"{p50 * 1e3:.3f}", f"{p95 * 1e3:.3f}"]
+        )
+    print_table(
+        ["rows", "requests", "figs_MB_lists", "figs_MB_ids", "resp_MB_lists", "resp_MB_ids",
+         "saved", "click_p50_ms", "click_p95_ms"],
+        rows,
+    )
+
+
+def bench_filter_callbacks(args) -> None:
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.dashboard.filter_index import FILTER_COLUMNS  # type: ignore
+    from src.dashboard.ssa_dashboard import SSADashboard  # type: ignore
+
+    filter_ids = [f"{name.replace('_', '-')}-filter" for name in FILTER_COLUMNS]
+
+    def outputs_of(key):
+        # "..a.figure...b.figure.." (várias saídas) ou "a.figure"
+        parts = key[2:-2].split("...") if key.startswith("..") else [key]
+        return [dict(zip(("id", "property"), part.rsplit(".", 1))) for part in parts]
+
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        app = SSADashboard(df, **({"chart_workers": args.workers} if args.workers else {}))
+        # Callbacks disparados pelos dropdowns, como o navegador faria
+        callbacks = {
+            key: spec["inputs"] for key, spec in app.app.callback_map.items()
+            if [i["id"] for i in spec["inputs"]][:len(filter_ids)] == filter_ids
+        }
+        latencies = {key: [] for key in callbacks}
+        first, last = [], []
+
+        def post(key, values, start):
+            outputs = outputs_of(key)
+            body = {
+                "output": key,
+                "outputs": outputs if key.startswith("..") else outputs[0],
+                # Demais entradas (ex.: página/ordenação da tabela) no valor inicial
+                "inputs": [
+                    dict(spec, value=v)
+                    for spec, v in zip(callbacks[key], values + [None] * len(callbacks[key]))
+                ],
+                "changedPropIds": [f"{filter_ids[0]}.value"],
+                "state": [],
+            }
+            response = app.app.server.test_client().post(
+                "/_dash-update-component", data=json.dumps(body), content_type="application/json"
+            )
+            assert response.status_code in (200, 204), response.status_code
+            return key, time.perf_counter() - start
+
+        # Uma conexão por callback (o navegador abre até 6 por host)
+        with ThreadPoolExecutor(max_workers=min(6, len(callbacks))) as browser:
+            for filters in _filter_combos(df, args.requests, seed=3):
+                values = list(filters.values())
+                start = time.perf_counter()
+                done = list(browser.map(lambda key: post(key, values, start), callbacks))
+                for key, elapsed in done:
+                    latencies[key].append(elapsed)
+                charts = [elapsed for key, elapsed in done if "figure" in key]
+                first.append(min(charts))
+                last.append(max(elapsed for _, elapsed in done))
+        for key in callbacks:
+            p50, p95 = _percentiles(latencies[key])
+            label = " ".join(dict.fromkeys(o["id"] for o in outputs_of(key)))
+            rows.append([n, label[:60], f"{p50 * 1e3:.0f}", f"{p95 * 1e3:.0f}"])
+        for label, samples in (("first chart", first), ("all outputs", last)):
+            p50, p95 = _percentiles(samples)
+            rows.append([n, f"== {label}", f"{p50 * 1e3:.0f}", f"{p95 * 1e3:.0f}"])
+    print_table(["rows", "callback outputs", "p50_ms", "p95_ms"], rows)
+
+
+def bench_table(args) -> None:
+    import json
+
+    from src.dashboard.ssa_dashboard import SSADashboard  # type: ignore
+
+    files = excel_files(args.source) if args.source else []
+    sort_by = [{"column_id": "resp_exec", "direction": "desc"}, {"column_id": "numero", "direction": "asc"}]
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        app = SSADashboard(df)
+        filters = (None, None, None, None)
+        # Antes: todas as linhas da seleção a cada mudança de filtro
+        start = time.perf_counter()
+        full = app._prepare_table_data(df)
+        rows.append([n, "all rows (native)", f"{(time.perf_counter() - start) * 1e3:.0f}",
+                     f"{len(json.dumps(full, default=str)) / 1e6:.2f}"])
+        steps = [
+            ("page 0", dict()),
+            ("next page", dict(page_current=1)),
+            ("sort 2 columns", dict(sort_by=sort_by)),
+            ("sorted, page 50", dict(page_current=50, sort_by=sort_by)),
+            ("filter contains", dict(filter_query="{descricao} icontains anexo")),
+            ("filter + sort", dict(sort_by=sort_by,
+                                   filter_query="{estado} ne AAD && {data_emissao} >= 01/01/2024")),
+        ]
+        for label, kwargs in steps:
+            start = time.perf_counter()
+            page, _, _ = app._table_page(filters, **kwargs)
+            rows.append([n, label, f"{(time.perf_counter() - start) * 1e3:.0f}",
+                         f"{len(json.dumps(page, default=str)) / 1e6:.3f}"])
+    print_table(["rows", "request", "ms", "payload_MB"], rows)
+
+
+def _table_records_legacy(df: pd.DataFrame) -> list:
+    """Previous SSADashboard._prepare_table_data (iterrows + row.iloc per cell)."""
+    return [
+        {
+            "numero": f"[{row.iloc[SSAColumns.NUMERO_SSA]}](https://osprd.itaipu/SAM_SMA/SSAPublicView.aspx?SerialNumber={row.iloc[SSAColumns.NUMERO_SSA]}&language=pt)",
+            "estado": row.iloc[SSAColumns.SITUACAO],
+            "setor_emissor": row.iloc[SSAColumns.SETOR_EMISSOR],
+            "setor_executor": row.iloc[SSAColumns.SETOR_EXECUTOR],
+            "resp_prog": row.iloc[SSAColumns.RESPONSAVEL_PROGRAMACAO],
+            "resp_exec": row.iloc[SSAColumns.RESPONSAVEL_EXECUCAO],
+            "semana_prog": row.iloc[SSAColumns.SEMANA_PROGRAMADA],
+            "prioridade": row.iloc[SSAColumns.GRAU_PRIORIDADE_EMISSAO],
+            "data_emissao": (
+                row.iloc[SSAColumns.EMITIDA_EM].strftime("%d/%m/%Y %H:%M")
+                if pd.notnull(row.iloc[SSAColumns.EMITIDA_EM])
+                else ""
+            ),
+            "descricao": row.iloc[SSAColumns.DESC_SSA],
+        }
+        for _, row in df.iterrows()
+    ]
+
+
+def bench_table_records(args) -> None:
+    from src.data.categoricals import to_categorical  # type: ignore
+    from src.dashboard.table_records import build_table_records  # type: ignore
+
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        base = synthetic_canonical_frame(n, files[0] if files else None)
+        for layout, df in (("object", base), ("category", to_categorical(base))):
+            legacy = timeit(lambda: _table_records_legacy(df), repeat=1)
+            columnar = timeit(lambda: build_table_records(df), repeat=args.repeat)
+            assert build_table_records(df) == _table_records_legacy(df)
+            rows.append([n, layout, f"{legacy * 1e3:.0f}", f"{columnar * 1e3:.0f}",
+                         f"{legacy / columnar:.0f}x"])
+    print_table(["rows", "columns", "iterrows_ms", "columnar_ms", "speedup"], rows)
+
+
+def bench_modal(args) -> None:
+    from plotly.io.json import to_json_plotly
+    from dash import html
+
+    from src.dashboard.ssa_dashboard import SSADashboard  # type: ignore
+
+    files = excel_files(args.source) if args.source else []
+    rows = []
+    for n in args.sizes:
+        df = synthetic_canonical_frame(n, files[0] if files else None)
+        app = SSADashboard(df)
+        filters = [None, None, None, None]
+        # Maior barra do gráfico por programador (ex.: responsável não atribuído)
+        trace = app._compute_all_outputs(*filters)[1].data[0]
+        bar = max(range(len(trace.x)), key=lambda i: trace.y[i])
+        ref = {"chart": "resp_prog", "bar": trace.customdata[bar], "label": trace.x[bar], "filters": filters}
+        ssas = app._modal_ssas(ref)
+
+        def legacy():
+            # Antes: todos os itens mais a lista escondida para "Copiar todas"
+            body = html.Div([app._create_ssa_list(ssas), html.Div(",".join(ssas))])
+            return to_json_plotly(body)
+
+        def first_page():
+            page = app._modal_ssas(ref)[: app.ssa_list_page_size]
+            return to_json_plotly([app._create_ssa_list(page, len(ssas)), ref])
+
+        def next_page():
+            page = app._modal_ssas(ref)[app.ssa_list_page_size: 2 * app.ssa_list_page_size]
+            return to_json_plotly(app._ssa_list_items(page, app.ssa_list_page_size))
+
+        def copy_all():
+            return to_json_plotly({"text": ",".join(app._modal_ssas(ref)), "count": len(ssas)})
+
+        for label, fn in (("all SSAs (before)", legacy), ("first page", first_page),
+                          ("load more", next_page), ("copy all (on click)", copy_all)):
+            payload = fn()
+            rows.append([n, len(ssas), label, f"{timeit(fn, args.repeat) * 1e3:.1f}",
+                         f"{len(payload) / 1e3:.1f}"])
+    print_table(["rows", "bar_ssas", "response", "ms", "payload_KB"], rows)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="SSA pipeline benchmarks.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("ingest", help="Excel ingestion: legacy reads vs single parse")
+    p.add_argument("path", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_ingest)
+
+    p = sub.add_parser("stream", help="Large export: eager vs streaming load")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--rows", type=int, default=20_000)
+    p.add_argument("--chunk-rows", type=int, nargs="+", default=[5_000, 50_000])
+    p.set_defaults(func=bench_stream)
+
+    p = sub.add_parser("convert", help="DataFrame -> SSAData conversion")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    p.add_argument("--legacy-max", type=int, default=100_000,
+                   help="skip the (slow) legacy loop above this many rows")
+    p.add_argument("--repeat", type=int, default=1)
+    p.set_defaults(func=bench_convert)
+
+    p = sub.add_parser("records", help="Memory retained per loaded SSA record")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    p.set_defaults(func=bench_records)
+
+    p = sub.add_parser("categorical", help="Object vs category low-cardinality columns")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=bench_categorical)
+
+    p = sub.add_parser("mapping", help="Column mapping: detection vs layout cache")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=bench_mapping)
+
+    p = sub.add_parser("dates", help="Date diagnostics: row loop vs column masks")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    p.add_argument("--legacy-max", type=int, default=10_000,
+                   help="skip the (slow) legacy loop above this many rows")
+    p.add_argument("--repeat", type=int, default=1)
+    p.set_defaults(func=bench_dates)
+
+    p = sub.add_parser("parse-dates", help="'Emitida Em' parsing: to_datetime vs fixed layout")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--rows", type=int, default=1_000_000, help="synthetic column size")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_parse_dates)
+
+    p = sub.add_parser("validator", help="SSADataValidator scaling with the number of SSAs")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+",
+                   default=[2_000, 4_000, 8_000, 16_000, 100_000, 1_000_000])
+    p.add_argument("--legacy-max", type=int, default=16_000,
+                   help="skip the (quadratic) legacy checks above this many rows")
+    p.add_argument("--repeat", type=int, default=1)
+    p.set_defaults(func=bench_validator)
+
+    p = sub.add_parser("rules", help="Validation rule engine throughput (rows/s)")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    p.add_argument("--legacy-max", type=int, default=100_000,
+                   help="skip the per-row reference checks above this many rows")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_rules)
+
+    p = sub.add_parser("filter", help="DataLoader.filter_ssas query latency vs dataset size")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    p.add_argument("--legacy-max", type=int, default=100_000,
+                   help="skip the linear scan above this many rows")
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=bench_filter)
+
+    p = sub.add_parser("diagnostics", help="Loader log volume and time per diagnostics level")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_diagnostics)
+
+    p = sub.add_parser("dashboard-filters", help="Filter callback latency (ms) at 10k/100k rows")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    p.add_argument("--requests", type=int, default=20,
+                   help="random filter combinations replayed per size")
+    p.set_defaults(func=bench_dashboard_filters)
+
+    p = sub.add_parser("callback-cache", help="Memoized filter callbacks: hit ratio and latency")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000])
+    p.add_argument("--distinct", type=int, default=6, help="filter combinations in use")
+    p.add_argument("--requests", type=int, default=60)
+    p.add_argument("--budget-mb", type=int, default=64)
+    p.set_defaults(func=bench_callback_cache)
+
+    p = sub.add_parser("bar-charts", help="Bar chart hover/click lists: per-category masks vs groupby")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    p.add_argument("--people", type=int, nargs="+", default=[50, 500],
+                   help="distinct responsaveis in the synthetic frame")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_bar_charts)
+
+    p = sub.add_parser("drilldown", help="Filter callback response bytes: SSA lists vs bar ids")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    p.add_argument("--requests", type=int, default=5,
+                   help="random filter combinations (plus the unfiltered view) per size")
+    p.set_defaults(func=bench_drilldown)
+
+    p = sub.add_parser("filter-callbacks", help="Per-output filter callback latency (scripted client)")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000])
+    p.add_argument("--requests", type=int, default=8, help="distinct filter combinations")
+    p.add_argument("--workers", type=int, default=0, help="chart thread pool size (0: default)")
+    p.set_defaults(func=bench_filter_callbacks)
+
+    p = sub.add_parser("table", help="ssa-table payload and latency: native vs server-side paging")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    p.set_defaults(func=bench_table)
+
+    p = sub.add_parser("table-records", help="ssa-table row records: iterrows vs columnar builder")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[50_000])
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_table_records)
+
+    p = sub.add_parser("modal", help="Drill-down modal payload: whole SSA list vs first page + on demand")
+    p.add_argument("source", nargs="?", default=str(REPO_ROOT / "downloads"))
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_modal)
+
+    args = parser.parse_args(argv)
+    # Logs per linha distorcem as medições
+    logging.disable(logging.CRITICAL)
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,12 +2,23 @@
 """
 Batch-validate all Excel files under downloads/ using the project's DataLoader.
 Outputs a concise validation report at docs/VALIDATION_REPORT.md.
+
+With ``--jobs N`` files are validated in a pool of N worker processes; results
+are printed as they complete and the report is still written sorted by file.
+
+Validation is incremental: results are kept in a sidecar state file keyed by
+the SHA-256 of each workbook, so unchanged files are not parsed again, and
+files with identical content are validated once and reported as aliases. A
+machine-readable copy of the report is written next to the markdown one.
 """
 from __future__ import annotations
 import os
 import sys
 import glob
+import json
+import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 import argparse
 from pathlib import Path
@@ -21,11 +32,16 @@ if str(CLASS_DIR) not in sys.path:
 
 import pandas as pd  # noqa: E402
 
-from src.data.data_loader import DataLoader  # type: ignore  # noqa: E402
+from src.data.data_loader import DataLoader, LOADER_VERSION  # type: ignore  # noqa: E402
+from src.data.snapshot_cache import file_sha256  # type: ignore  # noqa: E402
 from src.data.ssa_columns import SSAColumns  # type: ignore  # noqa: E402
+from src.utils.validation_rules import DEFAULT_RULES  # type: ignore  # noqa: E402
 
+# Bump when validate_file's result fields change; stored results are discarded
+STATE_VERSION = f"2.{LOADER_VERSION}"
 
-def validate_file(path: Path) -> dict:
+
+def validate_file(path: Path, cache_dir: str | None = None) -> dict:
     res = {
         "file": str(path),
         "ok": False,
@@ -35,11 +51,18 @@ def validate_file(path: Path) -> dict:
         "empty_ssa_numbers": 0,
         "priorities": {},
         "setores": {},
+        "issues": {},
+        "rules_rows_per_second": 0.0,
         "errors": None,
+        "cache": None,
+        "seconds": 0.0,
     }
+    start = time.perf_counter()
     try:
-        loader = DataLoader(str(path))
+        loader = DataLoader(str(path), cache_dir=cache_dir)
         df = loader.load_data()
+        if loader.cache is not None:
+            res["cache"] = dict(loader.cache.stats)
         res["rows"] = len(df)
         # Resolve labels robustly via DataLoader mapping
         def lbl(idx: int) -> str | None:
@@ -73,12 +96,140 @@ def validate_file(path: Path) -> dict:
             res["priorities"] = df[pri_label].value_counts().to_dict()
         if set_label and set_label in df.columns:
             res["setores"] = df[set_label].value_counts().head(10).to_dict()
+        # Rule engine over the canonical frame (same rules as the loader/dashboard)
+        issues, rule_stats = DEFAULT_RULES.evaluate(df, return_stats=True)
+        res["issues"] = DEFAULT_RULES.summarize(issues)
+        res["rules_rows_per_second"] = round(rule_stats["rows_per_second"], 1)
         res["ok"] = True
     except Exception:
         res["errors"] = traceback.format_exc()
+    res["seconds"] = time.perf_counter() - start
     return res
 
 
+def _failed_result(path: str, error: str) -> dict:
+    """Result for a file whose worker process died before returning."""
+    return {"file": path, "ok": False, "errors": error, "cache": None, "seconds": 0.0}
+
+
+def _print_progress(res: dict, done: int, total: int) -> None:
+    status = "OK" if res["ok"] else "FAIL"
+    print(
+        f"[{done}/{total}] {status} {os.path.basename(res['file'])} ({res['seconds']:.2f}s)",
+        flush=True,
+    )
+
+
+def validate_files(files: list[str], cache_dir: str | None = None, jobs: int = 1) -> list[dict]:
+    """Validate ``files`` (in parallel when jobs > 1); results come back sorted by file."""
+    total = len(files)
+    results: list[dict] = []
+    if jobs <= 1 or total <= 1:
+        for p in files:
+            results.append(validate_file(Path(p), cache_dir))
+            _print_progress(results[-1], len(results), total)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, total)) as pool:
+            futures = {pool.submit(validate_file, Path(p), cache_dir): p for p in files}
+            for fut in as_completed(futures):
+                try:
+                    res = fut.result()
+                except Exception:
+                    res = _failed_result(futures[fut], traceback.format_exc())
+                results.append(res)
+                _print_progress(res, len(results), total)
+    return sorted(results, key=lambda r: r["file"])
+
+
+def load_state(path: Path) -> dict:
+    """Previous results keyed by content hash (empty if missing, stale or unreadable)."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+        return {}
+    results = data.get("results")
+    return results if isinstance(results, dict) else {}
+
+
+def save_state(path: Path, results: list[dict]) -> None:
+    """Persist successful results by content hash (failures are retried next run)."""
+    entries = {}
+    for r in results:
+        if r["ok"] and r.get("sha256") and not r.get("alias_of"):
+            entries[r["sha256"]] = {
+                k: v for k, v in r.items() if k not in ("file", "cache", "reused", "alias_of")
+            }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        json.dumps({"version": STATE_VERSION, "results": entries}, indent=1, default=str),
+        encoding="utf-8",
+    )
+    os.replace(tmp, path)
+
+
+def _hash_or_none(path: str) -> str | None:
+    try:
+        return file_sha256(path)
+    except OSError:
+        return None
+
+
+def validate_incremental(
+    files: list[str], state: dict, cache_dir: str | None = None, jobs: int = 1
+) -> list[dict]:
+    """Validate only contents not found in ``state``; duplicates become aliases.
+
+    Files are grouped by SHA-256; the first path of each group (sorted) is the
+    primary, validated or restored from ``state``, and the others reuse its
+    result with ``alias_of`` set. Unreadable files (no hash) are validated as is.
+    """
+    groups: dict[str, list[str]] = {}
+    for p in sorted(files):
+        sha = _hash_or_none(p)
+        groups.setdefault(sha or f"unhashed:{p}", []).append(p)
+
+    pending = [paths[0] for sha, paths in groups.items() if sha not in state]
+    fresh = {r["file"]: r for r in validate_files(pending, cache_dir, jobs)}
+
+    results = []
+    for sha, paths in groups.items():
+        primary = paths[0]
+        if primary in fresh:
+            res = dict(fresh[primary], reused=False)
+        else:
+            res = dict(state[sha], file=primary, cache=None, reused=True)
+        res["sha256"] = None if sha.startswith("unhashed:") else sha
+        res["alias_of"] = None
+        results.append(res)
+        for alias in paths[1:]:
+            results.append(
+                dict(res, file=alias, alias_of=primary, cache=None, seconds=0.0)
+            )
+    return sorted(results, key=lambda r: r["file"])
+
+
+def write_json_report(path: Path, results: list[dict], summary: dict) -> None:
+    payload = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "summary": summary,
+        "files": [
+            {
+                **r,
+                "file": os.path.basename(r["file"]),
+                "alias_of": r["alias_of"] and os.path.basename(r["alias_of"]),
+            }
+            for r in results
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(payload, indent=2, ensure_ascii=False, default=str), encoding="utf-8"
+    )
+
+
 def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(description="Batch-validate SSA Excel files.")
     parser.add_argument(
@@ -92,6 +243,38 @@ def main(argv: list[str] | None = None):
         default=str(REPO_ROOT / "docs" / "VALIDATION_REPORT.md"),
         help="Output report path (markdown)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(REPO_ROOT / "cache" / "snapshots"),
+        help="Snapshot cache directory (default: cache/snapshots)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the snapshot cache and always re-parse every file",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1; 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--json-out",
+        default=None,
+        help="Machine-readable report path (default: --out with .json suffix)",
+    )
+    parser.add_argument(
+        "--state",
+        default=str(REPO_ROOT / "cache" / "validation_state.json"),
+        help="Sidecar file with previous results by content hash",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore previous results and re-validate every distinct file",
+    )
     args = parser.parse_args(argv)
 
     base = Path(args.path)
@@ -109,24 +292,76 @@ def main(argv: list[str] | None = None):
         print("No Excel files found for given path.", file=sys.stderr)
         return 2
 
-    results = [validate_file(Path(p)) for p in files]
+    cache_dir = None if args.no_cache else args.cache_dir
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    state_path = Path(args.state)
+    state = {} if args.force else load_state(state_path)
+    started = time.perf_counter()
+    results = validate_incremental(files, state, cache_dir, jobs)
+    elapsed = time.perf_counter() - started
+    save_state(state_path, results)
+
+    ok_count = sum(1 for r in results if r["ok"])
+    primaries = [r for r in results if not r["alias_of"]]
+    rule_totals: dict[str, int] = {}
+    for r in results:
+        for rule, count in (r.get("issues") or {}).items():
+            rule_totals[rule] = rule_totals.get(rule, 0) + count
+    summary = {
+        "files": len(results),
+        "ok": ok_count,
+        "fail": len(results) - ok_count,
+        "unique_contents": len(primaries),
+        "validated": sum(1 for r in primaries if not r["reused"]),
+        "reused": sum(1 for r in primaries if r["reused"]),
+        "aliases": len(results) - len(primaries),
+        "jobs": jobs,
+        "wall_seconds": round(elapsed, 3),
+        "issues": rule_totals,
+    }
 
     # Write report
     lines = []
     lines.append(f"# Validation Report\n")
     lines.append(f"Generated: {datetime.now().isoformat(timespec='seconds')}\n")
-    ok_count = sum(1 for r in results if r["ok"]) 
     lines.append(f"Files scanned: {len(results)} | OK: {ok_count} | FAIL: {len(results)-ok_count}\n")
+    lines.append(
+        f"Distinct contents: {summary['unique_contents']} | Validated: {summary['validated']}"
+        f" | Reused: {summary['reused']} | Aliases: {summary['aliases']}\n"
+    )
+    if cache_dir:
+        hits = sum((r["cache"] or {}).get("hits", 0) for r in results)
+        misses = sum((r["cache"] or {}).get("misses", 0) for r in results)
+        lines.append(f"Snapshot cache: hits: {hits} | misses: {misses}\n")
+    cpu_total = sum(r["seconds"] for r in primaries if not r["reused"])
+    lines.append(
+        f"Wall time: {elapsed:.2f}s | Jobs: {jobs} | Sum of per-file times: {cpu_total:.2f}s\n"
+    )
+    lines.append(f"Rule issues (all files): {rule_totals or 'none'}\n")
+    slowest = sorted(primaries, key=lambda r: (-r["seconds"], r["file"]))[:5]
+    lines.append("\n| Slowest files | Time (s) |\n|---|---|\n")
+    for r in slowest:
+        lines.append(f"| {os.path.basename(r['file'])} | {r['seconds']:.2f} |\n")
 
     for r in results:
         lines.append("\n---\n")
         lines.append(f"## {os.path.basename(r['file'])}\n")
+        if r["alias_of"]:
+            lines.append(f"- Alias of: {os.path.basename(r['alias_of'])} (identical content)\n")
+        elif r["reused"]:
+            lines.append(f"- Time: {r['seconds']:.2f}s (unchanged, result reused)\n")
+        else:
+            lines.append(f"- Time: {r['seconds']:.2f}s\n")
         if r["ok"]:
             lines.append(f"- Rows: {r['rows']}\n")
             lines.append(f"- Valid dates: {r['valid_dates']} ({r['percent_valid_dates']:.1f}%)\n")
             lines.append(f"- Empty SSA numbers: {r['empty_ssa_numbers']}\n")
             lines.append(f"- Top setores (10): {r['setores']}\n")
             lines.append(f"- Priorities: {r['priorities']}\n")
+            lines.append(
+                f"- Rule issues: {r['issues'] or 'none'}"
+                f" ({r['rules_rows_per_second']:,.0f} rows/s)\n"
+            )
         else:
             lines.append("- Status: FAIL\n")
             lines.append("```\n")
@@ -135,7 +370,9 @@ def main(argv: list[str] | None = None):
 
     report_path.parent.mkdir(parents=True, exist_ok=True)
     report_path.write_text("".join(lines), encoding="utf-8")
-    print(f"Wrote {report_path}")
+    json_path = Path(args.json_out) if args.json_out else report_path.with_suffix(".json")
+    write_json_report(json_path, results, summary)
+    print(f"Wrote {report_path} and {json_path}")
     return 0
 
 
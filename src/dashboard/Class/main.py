@@ -130,7 +130,7 @@ def initialize_dashboard(config):
         logger.info(f"Dados carregados com sucesso. Total de SSAs: {len(df)}")
 
         # Cria e configura o dashboard
-        dashboard = SSADashboard(df)
+        dashboard = SSADashboard(df, validation_issues=loader.validation_issues)
 
         return dashboard
 
@@ -124,6 +124,25 @@ def main(argv: list[str] | None = None):
             action="store_true",
             help="Disable Flask/Dash reloader (prevents double-run in background tasks)",
         )
+        parser.add_argument(
+            "--no-cache",
+            dest="no_cache",
+            action="store_true",
+            help="Ignore the on-disk snapshot cache and always re-parse the Excel file",
+        )
+        parser.add_argument(
+            "--categorical",
+            dest="categorical",
+            action="store_true",
+            help="Store low-cardinality columns as pandas categoricals (less memory; tied chart bars may reorder)",
+        )
+        parser.add_argument(
+            "--diagnostics",
+            dest="diagnostics",
+            choices=["off", "summary", "full"],
+            default=None,
+            help="Loader diagnostics: off, summary counters (default) or full detail in logs/ssa_diagnostics.log",
+        )
         args = parser.parse_args(argv)
 
         base_dir = Path.cwd()
@@ -192,12 +211,18 @@ def main(argv: list[str] | None = None):
         )
 
         print("\nIniciando carregamento dos dados...")
-        loader = DataLoader(str(DATA_FILE_PATH))
+        cache_dir = None if args.no_cache else str(base_dir / "cache" / "snapshots")
+        loader = DataLoader(
+            str(DATA_FILE_PATH),
+            cache_dir=cache_dir,
+            categorical=args.categorical,
+            diagnostics=args.diagnostics,
+        )
         df = loader.load_data()
         print(f"Dados carregados com sucesso. Total de SSAs: {len(df)}")
 
         print("\nIniciando dashboard...")
-        app = SSADashboard(df)
+        app = SSADashboard(df, validation_issues=loader.validation_issues)
 
         desired = args.port if args.port else 8080
         port = get_available_port(desired)
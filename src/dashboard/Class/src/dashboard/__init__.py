@@ -5,5 +5,11 @@ Módulo do dashboard do SSA.
 from .ssa_dashboard import SSADashboard
 from .ssa_visualizer import SSAVisualizer
 from .kpi_calculator import KPICalculator
+from .filter_index import FilterIndex
+from .chart_aggregates import ChartAggregates
+from .drilldown import DrilldownIndex
+from .table_query import TableQuery
+from .table_records import build_table_records
+from .user_history import UserHistory
 
-__all__ = ["SSADashboard", "SSAVisualizer", "KPICalculator"]
+__all__ = ["SSADashboard", "SSAVisualizer", "KPICalculator", "FilterIndex", "ChartAggregates", "DrilldownIndex", "TableQuery", "build_table_records", "UserHistory"]
@@ -0,0 +1,128 @@
+# src/dashboard/callback_cache.py
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+from plotly.io.json import to_json_plotly
+
+
+DEFAULT_CALLBACK_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def estimate_bytes(value) -> int:
+    """Tamanho aproximado de uma saída de callback: o JSON que o Dash enviaria.
+
+    Objetos com ``nbytes`` (arrays, índices do servidor) usam o próprio tamanho
+    e DataFrames (seleções filtradas) a memória das colunas.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    try:
+        return len(to_json_plotly(value))
+    except Exception:
+        return 0
+
+
+class CallbackCache:
+    """Memoização LRU das saídas de callbacks, limitada por orçamento de memória.
+
+    As chaves devem incluir a versão do dataset; entradas de versões antigas
+    deixam de ser consultadas e saem pela ordem LRU (ou por ``clear``). O
+    tamanho de cada entrada é estimado pelo JSON das saídas. Seguro para
+    servidores com threads: o cálculo de uma chave ausente é feito fora do
+    lock, e chamadas concorrentes para a mesma chave esperam o primeiro
+    cálculo em vez de repeti-lo.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_CALLBACK_CACHE_BYTES,
+        sizeof: Callable[[object], int] = estimate_bytes,
+    ):
+        self.max_bytes = int(max_bytes)
+        self._sizeof = sizeof
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[object, int]]" = OrderedDict()
+        self._pending: Dict[Hashable, threading.Event] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def known(self, key: Hashable) -> bool:
+        """True se a chave está no cache ou sendo calculada agora."""
+        with self._lock:
+            return key in self._entries or key in self._pending
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], object],
+        sizeof: Optional[Callable[[object], int]] = None,
+    ):
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                waiting = self._pending.get(key)
+                if waiting is None:
+                    self._pending[key] = threading.Event()
+                    self.misses += 1
+                    break
+            # Outra thread já está calculando esta chave
+            waiting.wait()
+        try:
+            value = compute()
+            self.put(key, value, None if sizeof is None else sizeof(value))
+            return value
+        finally:
+            with self._lock:
+                self._pending.pop(key).set()
+
+    def put(self, key: Hashable, value, size: Optional[int] = None) -> None:
+        size = self._sizeof(value) if size is None else int(size)
+        if size > self.max_bytes:
+            logging.debug(f"Saída de callback maior que o orçamento do cache ({size} bytes)")
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
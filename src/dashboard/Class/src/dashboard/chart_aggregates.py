@@ -0,0 +1,79 @@
+# src/dashboard/chart_aggregates.py
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..data.ssa_columns import SSAColumns
+
+
+# Tipo de gráfico -> (coluna da categoria, categoria comparada como str,
+# traces nomeados filtram também pela prioridade de emissão)
+CHART_KEYS: Dict[str, Tuple[int, bool, bool]] = {
+    "resp_prog": (SSAColumns.RESPONSAVEL_PROGRAMACAO, False, False),
+    "resp_exec": (SSAColumns.RESPONSAVEL_EXECUCAO, False, False),
+    "state": (SSAColumns.SITUACAO, False, False),
+    "week_programmed": (SSAColumns.SEMANA_PROGRAMADA, True, True),
+    "week_registration": (SSAColumns.SEMANA_CADASTRO, True, True),
+}
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+class ChartAggregates:
+    """Números de SSA por (categoria, trace) de um gráfico de barras.
+
+    Substitui uma máscara booleana por categoria e trace: as posições de cada
+    grupo saem de um único ``groupby`` sobre a coluna da categoria (mais a
+    prioridade, para traces nomeados dos gráficos de semana). A igualdade
+    segue a comparação anterior (``coluna == categoria``), então valores nulos
+    nunca casam.
+    """
+
+    def __init__(self, df: pd.DataFrame, chart_type: str):
+        self.df = df
+        self.key = CHART_KEYS.get(chart_type)
+        self._numbers: Optional[np.ndarray] = None
+        self._groups: Dict[bool, Dict[object, np.ndarray]] = {}
+
+    @property
+    def supported(self) -> bool:
+        return self.key is not None
+
+    def _group_positions(self, column: int, by_priority: bool) -> Dict[object, np.ndarray]:
+        if by_priority not in self._groups:
+            cols = [self.df.iloc[:, column]]
+            if by_priority:
+                cols.append(self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO])
+            keys = [c.reset_index(drop=True) for c in cols]
+            grouped = pd.Series(np.arange(len(self.df))).groupby(
+                keys if by_priority else keys[0], sort=False, observed=True, dropna=True
+            )
+            self._groups[by_priority] = grouped.indices
+        return self._groups[by_priority]
+
+    def positions(self, category, trace_name=None) -> np.ndarray:
+        """Posições das linhas da categoria/trace, na ordem do DataFrame.
+
+        Tipos de gráfico sem coluna de categoria (``supported`` falso) não
+        têm posições.
+        """
+        if self.key is None:
+            return _EMPTY
+        column, as_str, by_priority = self.key
+        value = str(category) if as_str else category
+        if by_priority and trace_name:
+            positions = self._group_positions(column, True).get((value, trace_name))
+        else:
+            positions = self._group_positions(column, False).get(value)
+        return _EMPTY if positions is None else positions
+
+    def numbers(self, positions) -> List[str]:
+        """Números (str) das SSAs nas posições dadas."""
+        if self._numbers is None:
+            self._numbers = self.df.iloc[:, SSAColumns.NUMERO_SSA].astype(str).to_numpy()
+        return self._numbers[positions].tolist()
+
+    def ssas(self, category, trace_name=None) -> List[str]:
+        """Números (str) das SSAs da categoria/trace, na ordem do DataFrame."""
+        return self.numbers(self.positions(category, trace_name))
@@ -0,0 +1,54 @@
+# src/dashboard/drilldown.py
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..data.ssa_columns import SSAColumns
+
+
+class DrilldownIndex:
+    """Linhas de cada barra clicável dos gráficos de um DataFrame filtrado.
+
+    As figuras levam em ``customdata`` apenas o id da barra (um inteiro por
+    ponto); a lista de SSAs é resolvida no servidor a partir das posições
+    guardadas aqui. O rótulo da barra é conferido na consulta para não
+    devolver dados de outro gráfico/versão.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._bars: Dict[str, List[Tuple[str, np.ndarray]]] = {}
+        self._numbers: Optional[np.ndarray] = None
+
+    def add(self, chart: str, label, positions) -> int:
+        """Registra as posições de uma barra e devolve o id para o customdata."""
+        bars = self._bars.setdefault(chart, [])
+        bars.append((str(label), np.asarray(positions, dtype=np.intp)))
+        return len(bars) - 1
+
+    def numbers(self, positions) -> List[str]:
+        """Números (str) das SSAs nas posições dadas."""
+        if self._numbers is None:
+            self._numbers = self.df.iloc[:, SSAColumns.NUMERO_SSA].astype(str).to_numpy()
+        return self._numbers[positions].tolist()
+
+    def ssas(self, chart: str, bar_id, label=None) -> Optional[List[str]]:
+        """SSAs da barra ``bar_id``; None se a barra não existe ou o rótulo difere."""
+        bars = self._bars.get(chart, [])
+        try:
+            index = int(bar_id)
+        except (TypeError, ValueError):
+            return None
+        if not 0 <= index < len(bars):
+            return None
+        bar_label, positions = bars[index]
+        if label is not None and str(label) != bar_label:
+            return None
+        return self.numbers(positions)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            positions.nbytes + len(label) for bars in self._bars.values() for label, positions in bars
+        )
@@ -0,0 +1,84 @@
+# src/dashboard/filter_index.py
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..data.ssa_columns import SSAColumns
+
+
+# Dropdowns de filtro do dashboard -> coluna do DF canônico
+FILTER_COLUMNS = {
+    "resp_prog": SSAColumns.RESPONSAVEL_PROGRAMACAO,
+    "resp_exec": SSAColumns.RESPONSAVEL_EXECUCAO,
+    "setor_emissor": SSAColumns.SETOR_EMISSOR,
+    "setor_executor": SSAColumns.SETOR_EXECUTOR,
+}
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+class FilterIndex:
+    """Índice invertido das colunas filtráveis, construído uma vez por DataFrame.
+
+    Para cada valor distinto guarda as posições das linhas e um bitmap
+    (``np.packbits``, n/8 bytes). Um filtro isolado devolve direto as
+    posições; combinações viram um AND dos bitmaps. Os valores são comparados
+    exatamente como no filtro antigo (``coluna == valor``).
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: Mapping[str, int] = FILTER_COLUMNS):
+        self.df = df
+        self.n = len(df)
+        self.positions: Dict[str, Dict[object, np.ndarray]] = {}
+        self.bitmaps: Dict[str, Dict[object, np.ndarray]] = {}
+        for name, idx in columns.items():
+            if idx not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[idx], use_na_sentinel=True)
+            order = np.argsort(codes, kind="stable").astype(np.intp)
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            # Códigos -1 (nulos) ficam no início da ordenação
+            start = int((codes < 0).sum())
+            groups = np.split(order[start:], np.cumsum(counts)[:-1]) if len(uniques) else []
+            self.positions[name] = dict(zip(uniques, groups))
+            self.bitmaps[name] = {}
+
+    def _bitmap(self, name: str, value) -> np.ndarray:
+        bitmap = self.bitmaps[name].get(value)
+        if bitmap is None:
+            mask = np.zeros(self.n, dtype=bool)
+            mask[self.positions[name].get(value, _EMPTY)] = True
+            bitmap = self.bitmaps[name][value] = np.packbits(mask)
+        return bitmap
+
+    def select(self, **filters) -> Optional[np.ndarray]:
+        """Posições (crescentes) das linhas que atendem a todos os filtros.
+
+        Filtros vazios/None são ignorados; sem nenhum filtro ativo devolve None
+        (todas as linhas).
+        """
+        active = [(name, value) for name, value in filters.items() if value]
+        if not active:
+            return None
+        for name, _ in active:
+            if name not in self.positions:
+                raise KeyError(f"Coluna de filtro desconhecida: {name}")
+        if len(active) == 1:
+            name, value = active[0]
+            return self.positions[name].get(value, _EMPTY)
+        # Começa pelo valor menos frequente; sem linhas, nada a combinar
+        active.sort(key=lambda item: len(self.positions[item[0]].get(item[1], _EMPTY)))
+        if not len(self.positions[active[0][0]].get(active[0][1], _EMPTY)):
+            return _EMPTY
+        bits = self._bitmap(*active[0]).copy()
+        for name, value in active[1:]:
+            np.bitwise_and(bits, self._bitmap(name, value), out=bits)
+        return np.flatnonzero(np.unpackbits(bits, count=self.n)).astype(np.intp)
+
+    def filter(self, **filters) -> pd.DataFrame:
+        """DataFrame com as linhas selecionadas (o próprio DF quando não há filtros)."""
+        positions = self.select(**filters)
+        if positions is None:
+            return self.df
+        return self.df.take(positions)
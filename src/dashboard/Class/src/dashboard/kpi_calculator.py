@@ -1,6 +1,7 @@
 import pandas as pd
 from datetime import datetime
 from typing import Dict
+from ..data.categoricals import drop_unused_categories
 from ..data.ssa_columns import SSAColumns
 
 
@@ -8,7 +9,7 @@ class KPICalculator:
     """Calcula KPIs e métricas de performance das SSAs."""
 
     def __init__(self, df: pd.DataFrame):
-        self.df = df
+        self.df = drop_unused_categories(df)
 
     def calculate_efficiency_metrics(self) -> Dict:
         """Calcula métricas de eficiência."""
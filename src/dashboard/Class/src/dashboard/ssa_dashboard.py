@@ -1,25 +1,90 @@
 # src/dashboard/ssa_dashboard.py
 import dash
-from dash import Dash, dcc, html, Input, Output, State, MATCH, ALL, dash_table
+from dash import Dash, dcc, html, Input, Output, State, MATCH, ALL, Patch, dash_table
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 import pandas as pd
-import numpy as np
 import logging
-from typing import Any, cast
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, cast
 from datetime import datetime
-from flask import request
+from flask import g, has_request_context, jsonify, request
 from .ssa_visualizer import SSAVisualizer
 from .kpi_calculator import KPICalculator
+from .filter_index import FILTER_COLUMNS, FilterIndex
+from .chart_aggregates import ChartAggregates
+from .drilldown import DrilldownIndex
+from .callback_cache import CallbackCache, DEFAULT_CALLBACK_CACHE_BYTES, estimate_bytes
+from .table_query import DEFAULT_PAGE_SIZE, TableQuery
+from .table_records import build_table_records
+from .user_history import DEFAULT_DB_PATH, UserHistory
+from ..data.categoricals import drop_unused_categories
 from ..data.ssa_columns import SSAColumns
 from ..utils.log_manager import LogManager
+from ..utils.validation_rules import DEFAULT_RULES
+
+
+# Callbacks dos filtros: um por grupo de saídas, (id, propriedade) na ordem do builder
+OUTPUT_GROUPS = {
+    "summary": [("resp-summary-cards", "children"), ("detail-section", "style")],
+    "responsaveis": [("resp-prog-chart", "figure"), ("resp-exec-chart", "figure")],
+    "detail": [("detail-state-chart", "figure"), ("detail-week-chart", "figure")],
+    "weeks_in_state": [("weeks-in-state-chart", "figure")],
+    "weeks": [("programmed-week-chart", "figure"), ("registration-week-chart", "figure")],
+}
+
+# Ordem das saídas devolvidas por _compute_all_outputs; a página da ssa-table
+# vem de um callback próprio (paginação, ordenação e filtro no servidor)
+ALL_OUTPUTS = [
+    ("resp-summary-cards", "children"),
+    ("resp-prog-chart", "figure"),
+    ("resp-exec-chart", "figure"),
+    ("programmed-week-chart", "figure"),
+    ("registration-week-chart", "figure"),
+    ("detail-section", "style"),
+    ("detail-state-chart", "figure"),
+    ("detail-week-chart", "figure"),
+    ("ssa-table", "data"),
+    ("weeks-in-state-chart", "figure"),
+]
+
+# Gráfico do DrilldownIndex -> grupo que o constrói
+DRILLDOWN_GROUPS = {
+    "resp_prog": "responsaveis",
+    "resp_exec": "responsaveis",
+    "state": "detail",
+    "week_detail": "detail",
+    "week_programmed": "weeks",
+    "week_registration": "weeks",
+    "weeks_in_state": "weeks_in_state",
+}
+
+DEFAULT_CHART_WORKERS = 4
+# SSAs por página na lista do modal de drill-down
+DEFAULT_SSA_LIST_PAGE_SIZE = 100
+
+# Cookie da sessão do histórico e rotas internas que não entram nele
+HISTORY_COOKIE = "ssa_history_session"
+_INTERNAL_PATHS = ("/_dash-", "/_reload-hash", "/_favicon", "/favicon.ico", "/assets/", "/_diagnostics")
 
 
 class SSADashboard:
     """Dashboard interativo para analise de SSAs."""
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        callback_cache_bytes: int = DEFAULT_CALLBACK_CACHE_BYTES,
+        chart_workers: int = DEFAULT_CHART_WORKERS,
+        ssa_list_page_size: int = DEFAULT_SSA_LIST_PAGE_SIZE,
+        history_db: Optional[str] = DEFAULT_DB_PATH,
+        validation_issues: Optional[pd.DataFrame] = None,
+    ):
         self.df = df
+        self.ssa_list_page_size = max(1, ssa_list_page_size)
         self.app = Dash(
             __name__,
             external_stylesheets=[dbc.themes.BOOTSTRAP],
@@ -30,7 +95,8 @@ class SSADashboard:
         self.logger: Any = LogManager()
         
         # User interaction history - addresses "o que acabei de falar" request
-        self.user_history = []
+        # Um buffer circular por sessão (cookie), com expiração de ociosas
+        self.user_history = UserHistory(db_path=history_db)
 
         # Configurar servidor Flask subjacente
         server = self.app.server
@@ -39,37 +105,69 @@ class SSADashboard:
         @server.before_request
         def log_request_info():
             self.logger.log_with_ip("INFO", f"Acesso a rota: {request.path}")
-            # Log user interactions to history
-            if request.path != '/favicon.ico' and request.path != '/_dash-dependencies':
+            session_id = request.cookies.get(HISTORY_COOKIE)
+            if not session_id:
+                session_id = g.new_history_session = uuid.uuid4().hex
+            g.history_session = session_id
+            # Log user interactions to history (só navegação de página; os
+            # callbacks registram as próprias ações)
+            if not request.path.startswith(_INTERNAL_PATHS):
                 self._add_to_history(f"Acessou: {request.path}", "navigation")
 
+        @server.after_request
+        def set_history_cookie(response):
+            session_id = g.get("new_history_session")
+            if session_id:
+                response.set_cookie(HISTORY_COOKIE, session_id, httponly=True, samesite="Lax")
+            return response
+
         self.visualizer = SSAVisualizer(df)
         self.kpi_calc = KPICalculator(df)
         self.week_analyzer = self.visualizer.week_analyzer
+        self._filter_index: Optional[FilterIndex] = None
+        # Versão do dataset: muda quando self.df é substituído (novo snapshot)
+        self.data_version = 0
+        self._index_lock = threading.Lock()
+        # Seleção filtrada, saídas de cada grupo e índices de drill-down por
+        # (versão do dataset, filtros)
+        self.callback_cache = CallbackCache(callback_cache_bytes)
+        # Pool limitado para montar os grupos de saídas em paralelo
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, chart_workers), thread_name_prefix="ssa-charts"
+        )
+
+        @server.route("/_diagnostics/cache")
+        def cache_diagnostics():
+            return jsonify(
+                {"data_version": self.data_version, "filter_callbacks": self.callback_cache.stats()}
+            )
+        # Problemas de qualidade (rule, row, value): os do DataLoader, quando
+        # fornecidos; senão avaliados aqui sobre o DF canônico
+        self.validation_issues = (
+            validation_issues if validation_issues is not None else DEFAULT_RULES.evaluate(df)
+        )
         self.setup_layout()
         self.setup_callbacks()
     
+    def _history_session(self) -> str:
+        """Sessão do histórico na requisição atual ("local" fora de uma requisição)."""
+        if has_request_context():
+            return g.get("history_session") or request.cookies.get(HISTORY_COOKIE) or "local"
+        return "local"
+
     def _add_to_history(self, action: str, action_type: str = "action"):
         """Add user action to history - answers 'what did I just say/do'."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.user_history.append({
-            'time': timestamp,
-            'action': action,
-            'type': action_type,
-            'full_timestamp': datetime.now()  # For potential future use
-        })
-        # Keep only last 10 items
-        if len(self.user_history) > 10:
-            self.user_history.pop(0)
+        self.user_history.add(self._history_session(), action, action_type)
     
     def _clear_history(self):
         """Clear user history."""
-        self.user_history.clear()
+        self.user_history.clear(self._history_session())
         self._add_to_history("Historico limpo pelo usuario", "action")
     
     def _export_history(self):
         """Export user history as text for copying."""
-        if not self.user_history:
+        history = self.user_history.items(self._history_session())
+        if not history:
             return "Nenhuma acao registrada no historico."
         
         export_lines = []
@@ -77,7 +175,7 @@ class SSADashboard:
         export_lines.append(f"Exportado em: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
         export_lines.append("")
         
-        for item in self.user_history:
+        for item in history:
             icon_map = {
                 'user_input': '[CHAT]',
                 'filter': '[FILTER]', 
@@ -89,13 +187,15 @@ class SSADashboard:
             export_lines.append(f"{icon} {item['time']} - {item['action']}")
         
         export_lines.append("")
-        export_lines.append(f"Total de acoes: {len(self.user_history)}")
+        export_lines.append(f"Total de acoes: {len(history)}")
         
         return "\n".join(export_lines)
     
     def _get_recent_history_html(self):
         """Get recent user history as HTML - shows 'what I just said/did'."""
-        if not self.user_history:
+        session_id = self._history_session()
+        recent = self.user_history.recent(session_id, 5)  # Show last 5 items
+        if not recent:
             return html.P(
                 "Nenhuma acao recente", 
                 className="text-muted text-center py-2"
@@ -122,7 +222,7 @@ class SSADashboard:
             'test': 'text-muted'
         }
         
-        for item in reversed(self.user_history[-5:]):  # Show last 5 items
+        for item in recent:
             icon = action_icons.get(item['type'], '[NOTE]')
             color = action_colors.get(item['type'], 'text-dark')
             
@@ -147,7 +247,7 @@ class SSADashboard:
             html.Ul(history_items, className="list-unstyled mb-0"),
             html.Hr(className="my-2"),
             html.Small(
-                f"Total de acoes hoje: {len(self.user_history)}", 
+                f"Total de acoes hoje: {self.user_history.count(session_id)}", 
                 className="text-muted"
             )
         ])
@@ -204,15 +304,11 @@ class SSADashboard:
                 periodo = {"inicio": "N/A", "fim": "N/A"}
 
             # Estatisticas de responsaveis
+            resp_prog = self.df.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO]
+            resp_exec = self.df.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO]
             responsaveis = {
-                "programacao": self.df.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO]
-                .replace("", np.nan)
-                .dropna()
-                .nunique(),
-                "execucao": self.df.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO]
-                .replace("", np.nan)
-                .dropna()
-                .nunique(),
+                "programacao": resp_prog[resp_prog != ""].nunique(),
+                "execucao": resp_exec[resp_exec != ""].nunique(),
             }
 
             return {
@@ -224,6 +320,7 @@ class SSADashboard:
                 "por_estado": estados,
                 "periodo": periodo,
                 "responsaveis": responsaveis,
+                "qualidade": DEFAULT_RULES.summarize(self.validation_issues),
             }
 
         except Exception as e:
@@ -238,8 +335,213 @@ class SSADashboard:
                 "por_estado": pd.Series(dtype="object"),
                 "periodo": {"inicio": "N/A", "fim": "N/A"},
                 "responsaveis": {"programacao": 0, "execucao": 0},
+                "qualidade": {},
             }
 
+    def _data_quality_label(self, qualidade):
+        """Resumo curto dos problemas de qualidade para o cabeçalho."""
+        total = sum(qualidade.values())
+        if not total:
+            return "Qualidade dos dados: nenhum problema encontrado"
+        return f"Qualidade dos dados: {total} problema(s) em {len(qualidade)} regra(s)"
+
+    def _get_filter_index(self) -> FilterIndex:
+        """Índice dos filtros do dashboard, reconstruído só quando self.df muda.
+
+        A reconstrução avança ``data_version`` e descarta as saídas memoizadas.
+        """
+        with self._index_lock:
+            index = self._filter_index
+            if index is None or index.df is not self.df:
+                if index is not None:
+                    self.data_version += 1
+                    self.callback_cache.clear()
+                index = self._filter_index = FilterIndex(self.df)
+            return index
+
+    def _filters_key(self, *parts, filters):
+        return (*parts, self.data_version, *(v or None for v in filters))
+
+    def _filtered_selection(self, filters) -> SSAVisualizer:
+        """Visualizador das linhas dos filtros, compartilhado pelos grupos de saídas.
+
+        Guarda a seleção filtrada (``.df``) e as análises de semana já feitas.
+        """
+
+        def select():
+            df_filtered = self._get_filter_index().filter(**dict(zip(FILTER_COLUMNS, filters)))
+            # Categóricas: descarta categorias sem linhas após os filtros
+            return SSAVisualizer(drop_unused_categories(df_filtered))
+
+        return self.callback_cache.get_or_compute(
+            self._filters_key("selection", filters=filters),
+            select,
+            sizeof=lambda visualizer: estimate_bytes(visualizer.df),
+        )
+
+    def _group_outputs(self, name, filters):
+        """Saídas de um grupo (OUTPUT_GROUPS), memoizadas por (versão, filtros)."""
+        self._get_filter_index()
+        filters = tuple(v or None for v in filters)
+
+        def compute():
+            outputs, drilldown = self._compute_group(name, filters)
+            if drilldown is not None:
+                self.callback_cache.put(self._filters_key("drilldown", name, filters=filters), drilldown)
+            return outputs
+
+        return self.callback_cache.get_or_compute(
+            self._filters_key("group", name, filters=filters), compute
+        )
+
+    def _compute_group(self, name, filters):
+        """Calcula as saídas de um grupo e o DrilldownIndex dos seus gráficos."""
+        selection = self._filtered_selection(filters)
+        drilldown = DrilldownIndex(selection.df)
+        builders = {
+            "summary": self._build_summary,
+            "responsaveis": self._build_responsaveis,
+            "detail": self._build_detail,
+            "weeks": self._build_weeks,
+            "weeks_in_state": self._build_weeks_in_state,
+        }
+        outputs = builders[name](selection, filters, drilldown)
+        return outputs, (drilldown if name in DRILLDOWN_GROUPS.values() else None)
+
+    def _schedule_groups(self, filters):
+        """Agenda no pool os grupos ainda não calculados para estes filtros.
+
+        Cada callback espera só o seu grupo; os demais já estão em andamento
+        quando os seus pedidos chegam (o cache evita cálculo duplicado).
+        """
+        self._get_filter_index()
+        filters = tuple(v or None for v in filters)
+        futures = {}
+        for name in OUTPUT_GROUPS:
+            if not self.callback_cache.known(self._filters_key("group", name, filters=filters)):
+                futures[name] = self._executor.submit(self._group_outputs, name, filters)
+        return futures
+
+    def _compute_all_outputs(self, resp_prog, resp_exec, setor_emissor, setor_executor):
+        """Todas as saídas dos filtros, na ordem de ALL_OUTPUTS (grupos em paralelo)."""
+        filters = (resp_prog, resp_exec, setor_emissor, setor_executor)
+        futures = self._schedule_groups(filters)
+        values = {("ssa-table", "data"): self._table_page(filters)[0]}
+        for name, outputs in OUTPUT_GROUPS.items():
+            future = futures.get(name)
+            group = future.result() if future is not None else self._group_outputs(name, filters)
+            values.update(zip(outputs, group))
+        return tuple(values[output] for output in ALL_OUTPUTS)
+
+    def _table_query(self, filters) -> TableQuery:
+        """Motor de consulta da ssa-table sobre a seleção dos dropdowns."""
+        self._get_filter_index()
+        filters = tuple(v or None for v in filters)
+        return self.callback_cache.get_or_compute(
+            self._filters_key("table", filters=filters),
+            lambda: TableQuery(self._filtered_selection(filters).df),
+        )
+
+    def _table_page(
+        self, filters, page_current=0, page_size=DEFAULT_PAGE_SIZE, sort_by=None, filter_query=None
+    ):
+        """(linhas da página, total de páginas, página efetiva) da ssa-table.
+
+        Um filter_query inválido é ignorado (com aviso no log), como no
+        filtro nativo do DataTable.
+        """
+        query = self._table_query(filters)
+        try:
+            rows, page_count, current = query.page(page_current, page_size, sort_by, filter_query)
+        except ValueError as e:
+            logging.warning(f"Filtro da tabela ignorado ({filter_query!r}): {e}")
+            rows, page_count, current = query.page(page_current, page_size, sort_by)
+        return self._prepare_table_data(rows), page_count, current
+
+    def _drilldown_ssas(self, chart, bar_id, label, filters) -> List[str]:
+        """SSAs da barra clicada, resolvidas pelo índice de (versão, filtros, gráfico).
+
+        Se o índice saiu do cache, é reconstruído recalculando o grupo do
+        gráfico com os mesmos filtros (os ids das barras são determinísticos).
+        """
+        group = DRILLDOWN_GROUPS.get(chart)
+        if group is None:
+            return []
+        self._get_filter_index()
+        filters = tuple(v or None for v in filters)
+        drilldown = self.callback_cache.get_or_compute(
+            self._filters_key("drilldown", group, filters=filters),
+            lambda: self._compute_group(group, filters)[1],
+        )
+        return drilldown.ssas(chart, bar_id, label) or []
+
+    def _build_summary(self, selection, filters, drilldown):
+        """Grupo "summary": cards dos responsáveis e visibilidade do detalhe."""
+        df_filtered = selection.df
+        detail_style = {"display": "block"} if any(filters) else {"display": "none"}
+        return self._create_resp_summary_cards(df_filtered), detail_style
+
+    def _build_responsaveis(self, selection, filters, drilldown):
+        """Grupo "responsaveis": SSAs por programador e por executor."""
+        df_filtered = selection.df
+        fig_prog = self._enhance_bar_chart(
+            self._create_resp_prog_chart(df_filtered),
+            "resp_prog",
+            "SSAs por Programador",
+            df_filtered,
+            drilldown,
+        )
+        fig_exec = self._enhance_bar_chart(
+            self._create_resp_exec_chart(df_filtered),
+            "resp_exec",
+            "SSAs por Executor",
+            df_filtered,
+            drilldown,
+        )
+        return fig_prog, fig_exec
+
+    def _build_weeks(self, selection, filters, drilldown):
+        """Grupo "weeks": SSAs programadas e cadastradas por semana."""
+        df_filtered = selection.df
+        fig_programmed_week = self._enhance_bar_chart(
+            selection.create_week_chart(use_programmed=True),
+            "week_programmed",
+            "SSAs Programadas",
+            df_filtered,
+            drilldown,
+        )
+        fig_registration_week = self._enhance_bar_chart(
+            selection.create_week_chart(use_programmed=False),
+            "week_registration",
+            "SSAs Cadastradas",
+            df_filtered,
+            drilldown,
+        )
+        return fig_programmed_week, fig_registration_week
+
+    def _build_detail(self, selection, filters, drilldown):
+        """Grupo "detail": detalhe por estado e por semana."""
+        df_filtered = selection.df
+        fig_detail_state = self._enhance_bar_chart(
+            self._create_detail_state_chart(df_filtered),
+            "state",
+            "SSAs por Estado",
+            df_filtered,
+            drilldown,
+        )
+        fig_detail_week = self._enhance_bar_chart(
+            selection.create_week_chart(),
+            "week_detail",
+            "SSAs por Semana",
+            df_filtered,
+            drilldown,
+        )
+        return fig_detail_state, fig_detail_week
+
+    def _build_weeks_in_state(self, selection, filters, drilldown):
+        """Grupo "weeks_in_state": tempo no estado atual."""
+        return (selection.add_weeks_in_state_chart(drilldown=drilldown),)
+
     def _get_state_counts(self):
         """Obtem contagem de SSAs por estado."""
         return self.df.iloc[:, SSAColumns.SITUACAO].value_counts().to_dict()
@@ -347,15 +649,21 @@ class SSADashboard:
             f"<b>Primeiras SSAs:</b><br>{ssa_preview}"
         )
 
-    def _create_ssa_list(self, ssas):
-        """Creates clickable SSA list with copy and link functionality."""
+    def _create_ssa_list(self, ssas, total=None):
+        """Creates clickable SSA list with copy and link functionality.
+
+        ``ssas`` é a primeira página; ``total`` o tamanho da lista completa.
+        As páginas seguintes vêm do servidor em "Carregar mais" e "Copiar
+        todas" busca a lista completa só quando clicado.
+        """
         if not ssas or len(ssas) == 0:
             return html.Div("Nenhuma SSA encontrada para este período/categoria.")
+        total = len(ssas) if total is None else total
 
         return html.Div(
             [
                 html.Button(
-                    f"Copiar todas ({len(ssas)})",
+                    f"Copiar todas ({total})",
                     id="copy-all-ssas",
                     n_clicks=0,
                     style={
@@ -367,70 +675,112 @@ class SSADashboard:
                         "cursor": "pointer",
                     },
                 ),
-                html.Div(
-                    ",".join(str(ssa) for ssa in ssas),
-                    id="all-ssas-data",
-                    style={"display": "none"},
-                ),
                 html.Div(
                     [
                         html.Div(
-                            [
-                                html.A(
-                                    str(ssa),
-                                    href=f"https://osprd.itaipu/SAM_SMA/SSAPublicView.aspx?SerialNumber={ssa}&language=pt",
-                                    target="_blank",
-                                    id=f"ssa-link-{ssa}",
-                                    style={
-                                        "textDecoration": "none",
-                                        "color": "inherit",
-                                        "flex": "1",
-                                    },
-                                ),
-                                html.Button(
-                                    "COPY",
-                                    id={"type": "copy-button", "index": i},
-                                    title=str(ssa),
-                                    style={
-                                        "cursor": "pointer",
-                                        "border": "none",
-                                        "background": "none",
-                                        "padding": "0 5px",
-                                        "fontSize": "10px"
-                                    },
-                                ),
-                            ],
-                            style={
-                                "padding": "3px 8px",
-                                "margin": "1px 0",
-                                "background": "#f8f9fa",
-                                "borderRadius": "3px",
-                                "display": "flex",
-                                "alignItems": "center",
-                                "width": "200px",
-                                "transition": "background-color 0.2s",
-                            },
-                        )
-                        for i, ssa in enumerate(ssas)
-                        if ssa
+                            self._ssa_list_items(ssas),
+                            id="ssa-list-items",
+                            style={"display": "flex", "flexDirection": "column", "gap": "2px"},
+                        ),
+                        html.Button(
+                            self._more_label(len(ssas), total),
+                            id="ssa-list-more",
+                            n_clicks=0,
+                            style=self._more_style(len(ssas), total),
+                        ),
                     ],
                     style={
                         "maxHeight": "500px",
                         "overflowY": "auto",
                         "padding": "5px",
-                        "display": "flex",
-                        "flexDirection": "column",
-                        "gap": "2px",
                     },
                 ),
             ]
         )
 
-    def _enhance_bar_chart(self, fig, chart_type, title, df_filtered=None):
-        """Enhances bar chart with hover info and clickable data."""
+    def _ssa_list_items(self, ssas, start=0):
+        """Linhas da lista do modal; ``start`` mantém os índices dos botões únicos entre páginas."""
+        return [
+            html.Div(
+                [
+                    html.A(
+                        str(ssa),
+                        href=f"https://osprd.itaipu/SAM_SMA/SSAPublicView.aspx?SerialNumber={ssa}&language=pt",
+                        target="_blank",
+                        id=f"ssa-link-{ssa}",
+                        style={
+                            "textDecoration": "none",
+                            "color": "inherit",
+                            "flex": "1",
+                        },
+                    ),
+                    html.Button(
+                        "COPY",
+                        id={"type": "copy-button", "index": start + i},
+                        title=str(ssa),
+                        style={
+                            "cursor": "pointer",
+                            "border": "none",
+                            "background": "none",
+                            "padding": "0 5px",
+                            "fontSize": "10px"
+                        },
+                    ),
+                ],
+                style={
+                    "padding": "3px 8px",
+                    "margin": "1px 0",
+                    "background": "#f8f9fa",
+                    "borderRadius": "3px",
+                    "display": "flex",
+                    "alignItems": "center",
+                    "width": "200px",
+                    "transition": "background-color 0.2s",
+                },
+            )
+            for i, ssa in enumerate(ssas)
+            if ssa
+        ]
+
+    @staticmethod
+    def _more_label(loaded, total):
+        return f"Carregar mais ({total - loaded} restantes)"
+
+    @staticmethod
+    def _more_style(loaded, total):
+        style = {
+            "marginTop": "5px",
+            "padding": "3px 8px",
+            "width": "200px",
+            "backgroundColor": "#f8f9fa",
+            "border": "1px solid #dee2e6",
+            "borderRadius": "4px",
+            "cursor": "pointer",
+        }
+        if loaded >= total:
+            style["display"] = "none"
+        return style
+
+    def _modal_ssas(self, ref) -> List[str]:
+        """Lista completa do modal a partir da referência guardada no ssa-modal-store."""
+        if not ref:
+            return []
+        ssas = self._drilldown_ssas(ref.get("chart"), ref.get("bar"), ref.get("label"), ref.get("filters") or ())
+        return [ssa.strip() for ssa in ssas if ssa]
+
+    def _enhance_bar_chart(self, fig, chart_type, title, df_filtered=None, drilldown=None):
+        """Enhances bar chart with hover info and clickable data.
+
+        O customdata de cada barra é só o id registrado em ``drilldown``; a
+        lista de SSAs é resolvida no servidor ao clicar.
+        """
         df_to_use = df_filtered if df_filtered is not None else self.df
+        if drilldown is None:
+            drilldown = DrilldownIndex(df_to_use)
 
         try:
+            # Um groupby por gráfico para todos os pares (categoria, trace)
+            aggregates = ChartAggregates(df_to_use, chart_type)
             for trace in fig.data:
                 if isinstance(trace, go.Bar):
                     hover_text = []
@@ -449,61 +799,19 @@ class SSADashboard:
                         except Exception:
                             categories = []
 
+                    trace_name = getattr(trace, "name", None)
                     for cat in categories:
-                        mask = None
-                        if chart_type == "resp_prog":
-                            mask = (
-                                df_to_use.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO]
-                                == cat
-                            )
-                        elif chart_type == "resp_exec":
-                            mask = (
-                                df_to_use.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO]
-                                == cat
-                            )
-                        elif chart_type == "state":
-                            mask = df_to_use.iloc[:, SSAColumns.SITUACAO] == cat
-                        elif chart_type == "week_programmed":
-                            mask = df_to_use.iloc[
-                                :, SSAColumns.SEMANA_PROGRAMADA
-                            ] == str(cat)
-                            if getattr(trace, "name", None):
-                                mask = mask & (
-                                    df_to_use.iloc[
-                                        :, SSAColumns.GRAU_PRIORIDADE_EMISSAO
-                                    ]
-                                    == getattr(trace, "name", None)
-                                )
-                        elif chart_type == "week_registration":
-                            mask = df_to_use.iloc[:, SSAColumns.SEMANA_CADASTRO] == str(
-                                cat
-                            )
-                            if getattr(trace, "name", None):
-                                mask = mask & (
-                                    df_to_use.iloc[
-                                        :, SSAColumns.GRAU_PRIORIDADE_EMISSAO
-                                    ]
-                                    == getattr(trace, "name", None)
-                                )
-                        else:
+                        if not aggregates.supported:
                             continue
+                        positions = aggregates.positions(cat, trace_name)
+                        total = len(positions)
 
-                        if mask is not None:
-                            ssas = (
-                                df_to_use[mask]
-                                .iloc[:, SSAColumns.NUMERO_SSA]
-                                .astype(str)
-                                .tolist()
-                            )
-                        else:
-                            ssas = []
-
-                        new_y.append(len(ssas))
+                        new_y.append(total)
 
                         # Texto do hover
-                        ssa_preview = "<br>".join(ssas[:5])
-                        if len(ssas) > 5:
-                            ssa_preview += f"<br>... (+{len(ssas)-5} SSAs)"
+                        ssa_preview = "<br>".join(aggregates.numbers(positions[:5]))
+                        if total > 5:
+                            ssa_preview += f"<br>... (+{total-5} SSAs)"
 
                         title_text = str(cat)
                         if getattr(trace, "name", None):
@@ -511,10 +819,10 @@ class SSADashboard:
 
                         hover_text.append(
                             f"<b>{title_text}</b><br>"
-                            f"Total SSAs: {len(ssas)}<br>"
+                            f"Total SSAs: {total}<br>"
                             f"SSAs:<br>{ssa_preview}"
                         )
-                        customdata.append(ssas)
+                        customdata.append(drilldown.add(chart_type, cat, positions))
 
                     trace.update(
                         y=new_y,
@@ -673,25 +981,7 @@ class SSADashboard:
 
     def _prepare_table_data(self, df):
         """Prepara dados para a tabela com informacoes adicionais."""
-        return [
-            {
-                "numero": f"[{row.iloc[SSAColumns.NUMERO_SSA]}](https://osprd.itaipu/SAM_SMA/SSAPublicView.aspx?SerialNumber={row.iloc[SSAColumns.NUMERO_SSA]}&language=pt)",
-                "estado": row.iloc[SSAColumns.SITUACAO],
-                "setor_emissor": row.iloc[SSAColumns.SETOR_EMISSOR],
-                "setor_executor": row.iloc[SSAColumns.SETOR_EXECUTOR],
-                "resp_prog": row.iloc[SSAColumns.RESPONSAVEL_PROGRAMACAO],
-                "resp_exec": row.iloc[SSAColumns.RESPONSAVEL_EXECUCAO],
-                "semana_prog": row.iloc[SSAColumns.SEMANA_PROGRAMADA],
-                "prioridade": row.iloc[SSAColumns.GRAU_PRIORIDADE_EMISSAO],
-                "data_emissao": (
-                    row.iloc[SSAColumns.EMITIDA_EM].strftime("%d/%m/%Y %H:%M")
-                    if pd.notnull(row.iloc[SSAColumns.EMITIDA_EM])
-                    else ""
-                ),
-                "descricao": row.iloc[SSAColumns.DESC_SSA],
-            }
-            for idx, row in df.iterrows()
-        ]
+        return build_table_records(df)
 
     def setup_callbacks(self):
         """Configure all dashboard callbacks with enhanced features."""
@@ -792,28 +1082,20 @@ class SSADashboard:
             
             return self._get_recent_history_html()
 
+        filter_inputs = [
+            Input("resp-prog-filter", "value"),
+            Input("resp-exec-filter", "value"),
+            Input("setor-emissor-filter", "value"),
+            Input("setor-executor-filter", "value"),
+        ]
+
+        # Um callback por grupo de OUTPUT_GROUPS: cada gráfico aparece assim
+        # que o seu grupo fica pronto, sem esperar os mais lentos
         @self.app.callback(
-            [
-                Output("resp-summary-cards", "children"),
-                Output("resp-prog-chart", "figure"),
-                Output("resp-exec-chart", "figure"),
-                Output("programmed-week-chart", "figure"),
-                Output("registration-week-chart", "figure"),
-                Output("detail-section", "style"),
-                Output("detail-state-chart", "figure"),
-                Output("detail-week-chart", "figure"),
-                Output("ssa-table", "data"),
-                Output("weeks-in-state-chart", "figure"),
-            ],
-            [
-                Input("resp-prog-filter", "value"),
-                Input("resp-exec-filter", "value"),
-                Input("setor-emissor-filter", "value"),
-                Input("setor-executor-filter", "value"),
-            ],
+            [Output(*output) for output in OUTPUT_GROUPS["summary"]], filter_inputs
         )
-        def update_all_charts(resp_prog, resp_exec, setor_emissor, setor_executor):
-            """Update all charts with filter data."""
+        def update_filter_summary(resp_prog, resp_exec, setor_emissor, setor_executor):
+            """Update summary cards and detail visibility with filter data."""
             if any([resp_prog, resp_exec, setor_emissor, setor_executor]):
                 self.logger.log_with_ip(
                     "INFO",
@@ -839,103 +1121,63 @@ class SSADashboard:
                 if dash.callback_context.triggered:
                     self._add_to_history("Visualizou todos os dados (sem filtros)", "data_filter")
 
-            df_filtered = self.df.copy()
+            filters = (resp_prog, resp_exec, setor_emissor, setor_executor)
+            self._schedule_groups(filters)
+            return self._group_outputs("summary", filters)
 
-            # Aplicar filtros
-            if resp_prog:
-                df_filtered = df_filtered[
-                    df_filtered.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO] == resp_prog
-                ]
-            if resp_exec:
-                df_filtered = df_filtered[
-                    df_filtered.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO] == resp_exec
-                ]
-            if setor_emissor:
-                df_filtered = df_filtered[
-                    df_filtered.iloc[:, SSAColumns.SETOR_EMISSOR] == setor_emissor
-                ]
-            if setor_executor:
-                df_filtered = df_filtered[
-                    df_filtered.iloc[:, SSAColumns.SETOR_EXECUTOR] == setor_executor
-                ]
+        def group_callback(name):
+            def update_group(resp_prog, resp_exec, setor_emissor, setor_executor):
+                filters = (resp_prog, resp_exec, setor_emissor, setor_executor)
+                self._schedule_groups(filters)
+                return self._group_outputs(name, filters)
 
-            # Criar visualizador filtrado
-            filtered_visualizer = SSAVisualizer(df_filtered)
+            return update_group
 
-            # Criar os cards de resumo
-            resp_cards = self._create_resp_summary_cards(df_filtered)
-
-            # Gerar graficos com informacoes de hover e click
-            fig_prog = self._enhance_bar_chart(
-                self._create_resp_prog_chart(df_filtered),
-                "resp_prog",
-                "SSAs por Programador",
-                df_filtered,
-            )
-
-            fig_exec = self._enhance_bar_chart(
-                self._create_resp_exec_chart(df_filtered),
-                "resp_exec",
-                "SSAs por Executor",
-                df_filtered,
-            )
-
-            # Gráficos de semana com hover e click
-            fig_programmed_week = self._enhance_bar_chart(
-                filtered_visualizer.create_week_chart(use_programmed=True),
-                "week_programmed",
-                "SSAs Programadas",
-                df_filtered,
-            )
-
-            fig_registration_week = self._enhance_bar_chart(
-                filtered_visualizer.create_week_chart(use_programmed=False),
-                "week_registration",
-                "SSAs Cadastradas",
-                df_filtered,
-            )
-
-            detail_style = (
-                {"display": "block"}
-                if any([resp_prog, resp_exec, setor_emissor, setor_executor])
-                else {"display": "none"}
-            )
-
-            fig_detail_state = self._enhance_bar_chart(
-                self._create_detail_state_chart(df_filtered),
-                "state",
-                "SSAs por Estado",
-                df_filtered,
-            )
-
-            fig_detail_week = self._enhance_bar_chart(
-                filtered_visualizer.create_week_chart(),
-                "week_detail",
-                "SSAs por Semana",
-                df_filtered,
-            )
+        for name, outputs in OUTPUT_GROUPS.items():
+            if name != "summary":
+                self.app.callback([Output(*output) for output in outputs], filter_inputs)(
+                    group_callback(name)
+                )
 
-            table_data = self._prepare_table_data(df_filtered)
-            weeks_fig = filtered_visualizer.add_weeks_in_state_chart()
-
-            return (
-                resp_cards,
-                fig_prog,
-                fig_exec,
-                fig_programmed_week,
-                fig_registration_week,
-                detail_style,
-                fig_detail_state,
-                fig_detail_week,
-                table_data,
-                weeks_fig,
-            )
+        @self.app.callback(
+            [
+                Output("ssa-table", "data"),
+                Output("ssa-table", "page_count"),
+                Output("ssa-table", "page_current"),
+            ],
+            filter_inputs
+            + [
+                Input("ssa-table", "page_current"),
+                Input("ssa-table", "page_size"),
+                Input("ssa-table", "sort_by"),
+                Input("ssa-table", "filter_query"),
+            ],
+        )
+        def update_table(
+            resp_prog,
+            resp_exec,
+            setor_emissor,
+            setor_executor,
+            page_current,
+            page_size,
+            sort_by,
+            filter_query,
+        ):
+            """Página visível da tabela (só ela vai para o navegador)."""
+            filters = (resp_prog, resp_exec, setor_emissor, setor_executor)
+            self._schedule_groups(filters)
+            # Novo filtro/ordenação volta para a primeira página
+            triggered = [t["prop_id"] for t in dash.callback_context.triggered]
+            if not any(t.startswith("ssa-table.page_") for t in triggered):
+                page_current = 0
+            return self._table_page(filters, page_current, page_size, sort_by, filter_query)
 
         @self.app.callback(
             [
                 Output("ssa-modal", "is_open"),
                 Output("ssa-modal-body", "children"),
                 Output("ssa-modal-title", "children"),
+                Output("ssa-modal-store", "data"),
             ],
             [
                 Input("weeks-in-state-chart", "clickData"),
@@ -947,7 +1189,13 @@ class SSADashboard:
                 Input("detail-week-chart", "clickData"),
                 Input("close-modal", "n_clicks"),
             ],
-            [State("ssa-modal", "is_open")],
+            [
+                State("ssa-modal", "is_open"),
+                State("resp-prog-filter", "value"),
+                State("resp-exec-filter", "value"),
+                State("setor-emissor-filter", "value"),
+                State("setor-executor-filter", "value"),
+            ],
         )
         def toggle_modal(
             weeks_click,
@@ -959,54 +1207,70 @@ class SSADashboard:
             detail_week_click,
             close_clicks,
             is_open,
+            resp_prog,
+            resp_exec,
+            setor_emissor,
+            setor_executor,
         ):
             """Handle modal opening/closing and content."""
             ctx = dash.callback_context
             if not ctx.triggered:
-                return False, "", ""
+                return False, "", "", None
 
             trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
 
             if trigger_id == "close-modal":
-                return False, "", ""
+                return False, "", "", None
 
             try:
+                # id do gráfico -> (clickData, título, gráfico no DrilldownIndex)
                 click_mapping = {
-                    "weeks-in-state-chart": (weeks_click, "SSAs no intervalo"),
-                    "resp-prog-chart": (prog_click, "SSAs do programador"),
-                    "resp-exec-chart": (exec_click, "SSAs do executor"),
+                    "weeks-in-state-chart": (
+                        weeks_click,
+                        "SSAs no intervalo",
+                        "weeks_in_state",
+                    ),
+                    "resp-prog-chart": (prog_click, "SSAs do programador", "resp_prog"),
+                    "resp-exec-chart": (exec_click, "SSAs do executor", "resp_exec"),
                     "programmed-week-chart": (
                         prog_week_click,
                         "SSAs programadas na semana",
+                        "week_programmed",
                     ),
                     "registration-week-chart": (
                         reg_week_click,
                         "SSAs cadastradas na semana",
+                        "week_registration",
                     ),
-                    "detail-state-chart": (detail_state_click, "SSAs no estado"),
+                    "detail-state-chart": (detail_state_click, "SSAs no estado", "state"),
                     "detail-week-chart": (
                         detail_week_click,
                         "SSAs na semana (detalhe)",
+                        "week_detail",
                     ),
                 }
 
                 if trigger_id in click_mapping:
-                    click_data, title_prefix = click_mapping[trigger_id]
+                    click_data, title_prefix, chart = click_mapping[trigger_id]
                     if (
                         not click_data
                         or "points" not in click_data
                         or not click_data["points"]
                     ):
-                        return False, "", ""
+                        return False, "", "", None
 
                     point_data = click_data["points"][0]
                     label = point_data.get("x", "")
-                    ssas = point_data.get("customdata", [])
-
-                    if isinstance(ssas, (list, tuple)):
-                        ssas = [str(ssa).strip() for ssa in ssas if ssa]
-                    else:
-                        ssas = []
+                    # customdata traz só o id da barra; SSAs vêm do servidor.
+                    # O navegador recebe a primeira página e a referência da
+                    # barra (ssa-modal-store) para buscar o resto sob demanda.
+                    ref = {
+                        "chart": chart,
+                        "bar": point_data.get("customdata"),
+                        "label": label,
+                        "filters": [resp_prog, resp_exec, setor_emissor, setor_executor],
+                    }
+                    ssas = self._modal_ssas(ref)
 
                     if ssas:
                         self.logger.log_with_ip(
@@ -1015,22 +1279,55 @@ class SSADashboard:
                         # Add to user history when user views SSA details
                         self._add_to_history(f"Visualizou detalhes: {title_prefix} {label} ({len(ssas)} SSAs)", "action")
 
-                    ssa_list = self._create_ssa_list(ssas)
+                    ssa_list = self._create_ssa_list(ssas[: self.ssa_list_page_size], len(ssas))
                     title = f"{title_prefix} {label} ({len(ssas)} SSAs)"
 
-                    return True, ssa_list, title
+                    return True, ssa_list, title, ref
 
             except Exception as e:
                 self.logger.log_with_ip("ERROR", f"Erro no modal: {str(e)}")
-                return False, "", ""
+                return False, "", "", None
+
+            return False, "", "", None
+
+        @self.app.callback(
+            Output("ssa-list-items", "children"),
+            Output("ssa-list-more", "children"),
+            Output("ssa-list-more", "style"),
+            Input("ssa-list-more", "n_clicks"),
+            State("ssa-modal-store", "data"),
+            prevent_initial_call=True,
+            running=[(Output("ssa-list-more", "disabled"), True, False)],
+        )
+        def load_more_ssas(n_clicks, ref):
+            """Acrescenta a próxima página à lista do modal (só os itens novos)."""
+            if not n_clicks or not ref:
+                raise PreventUpdate
+            ssas = self._modal_ssas(ref)
+            start = n_clicks * self.ssa_list_page_size
+            end = min(start + self.ssa_list_page_size, len(ssas))
+            items = Patch()
+            items.extend(self._ssa_list_items(ssas[start:end], start))
+            return items, self._more_label(end, len(ssas)), self._more_style(end, len(ssas))
 
-            return False, "", ""
+        @self.app.callback(
+            Output("ssa-copy-data", "data"),
+            Input("copy-all-ssas", "n_clicks"),
+            State("ssa-modal-store", "data"),
+            prevent_initial_call=True,
+        )
+        def fetch_all_ssas(n_clicks, ref):
+            """Lista completa para "Copiar todas", buscada só no clique."""
+            if not n_clicks or not ref:
+                raise PreventUpdate
+            ssas = self._modal_ssas(ref)
+            return {"text": ",".join(ssas), "count": len(ssas), "n_clicks": n_clicks}
 
         # Callback para copiar SSAs
         self.app.clientside_callback(
             """
-            function(n_clicks) {
-                if (!n_clicks) return null;
+            function(data) {
+                if (!data) return null;
 
                 function copy(text) {
                     try {
@@ -1051,17 +1348,14 @@ class SSADashboard:
                     return Promise.resolve();
                 }
 
-                const el = document.getElementById('all-ssas-data');
-                if (!el) return null;
-                const allSSAs = (el.textContent || '').trim();
+                const allSSAs = data.text || '';
                 return copy(allSSAs).then(function() {
                     const btn = document.getElementById('copy-all-ssas');
                     if (!btn) return true;
                     btn.textContent = 'Copiado!';
                     btn.style.backgroundColor = '#d4edda';
                     setTimeout(() => {
-                        const count = allSSAs ? allSSAs.split(',').filter(Boolean).length : 0;
-                        btn.textContent = `Copiar todas (${count})`;
+                        btn.textContent = `Copiar todas (${data.count || 0})`;
                         btn.style.backgroundColor = '#f8f9fa';
                     }, 1500);
                     return true;
@@ -1069,7 +1363,7 @@ class SSADashboard:
             }
             """,
             Output("copy-all-ssas", "data-copied"),
-            Input("copy-all-ssas", "n_clicks"),
+            Input("ssa-copy-data", "data"),
         )
 
         self.app.clientside_callback(
@@ -1331,6 +1625,12 @@ class SSADashboard:
                                             f"Atualizado em: {datetime.now().strftime('%d/%m/%Y %H:%M')}",
                                             className="text-muted",
                                         ),
+                                        html.Small(
+                                            self._data_quality_label(stats["qualidade"]),
+                                            title=DEFAULT_RULES.format_summary(self.validation_issues),
+                                            className="text-muted d-block",
+                                            id="data-quality-label",
+                                        ),
                                     ]
                                 )
                             ],
@@ -1821,11 +2121,16 @@ class SSADashboard:
                                                         "lineHeight": "12px",
                                                         "padding": "5px",
                                                     },
-                                                    page_size=30,
+                                                    # Página, ordenação e filtro
+                                                    # resolvidos no servidor
+                                                    page_size=DEFAULT_PAGE_SIZE,
                                                     page_current=0,
-                                                    sort_action="native",
+                                                    page_action="custom",
+                                                    sort_action="custom",
                                                     sort_mode="multi",
-                                                    filter_action="native",
+                                                    sort_by=[],
+                                                    filter_action="custom",
+                                                    filter_query="",
                                                     tooltip_data=[],
                                                     tooltip_duration=None,
                                                     style_as_list_view=True,
@@ -1890,6 +2195,9 @@ class SSADashboard:
                     size="lg",
                     is_open=False,
                 ),
+                # Referência da barra aberta no modal e lista para "Copiar todas"
+                dcc.Store(id="ssa-modal-store"),
+                dcc.Store(id="ssa-copy-data"),
                 # Store para dados de estado
                 dcc.Store(id="state-data"),
                 # Intervalo para atualizacao automatica
@@ -1,9 +1,12 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import logging
+import threading
 from datetime import datetime, date
-from typing import Optional, Sequence
+from typing import Dict, Optional, Sequence
 from ..data.ssa_columns import SSAColumns
+from .drilldown import DrilldownIndex
 from ..utils.log_manager import LogManager
 
 
@@ -120,7 +123,8 @@ class SSAVisualizer:
                 [
                     self.df.iloc[:, SSAColumns.SETOR_EXECUTOR],
                     self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO],
-                ]
+                ],
+                observed=True,
             )
             .size()
             .unstack(fill_value=0)
@@ -173,6 +177,7 @@ class SSAVisualizer:
             columns="prioridade",
             fill_value=0,
             aggfunc="sum",
+            observed=True,
         )
 
         fig = go.Figure()
@@ -186,9 +191,6 @@ class SSAVisualizer:
                     y=pivot_data[priority],
                     text=pivot_data[priority],
                     textposition="auto",
-                    customdata=analysis[analysis["prioridade"] == priority][
-                        "numero_ssa"
-                    ].tolist(),
                 )
             )
 
@@ -214,14 +216,22 @@ class SSAVisualizer:
 
         return fig
 
-    def add_weeks_in_state_chart(self, df_filtered=None) -> go.Figure:
-        """Cria gráfico mostrando distribuição de SSAs por tempo no estado."""
+    def add_weeks_in_state_chart(
+        self, df_filtered=None, drilldown: Optional[DrilldownIndex] = None
+    ) -> go.Figure:
+        """Cria gráfico mostrando distribuição de SSAs por tempo no estado.
+
+        O customdata de cada barra é o id registrado em ``drilldown``
+        (gráfico "weeks_in_state").
+        """
         df_to_use = df_filtered if df_filtered is not None else self.df
+        if drilldown is None:
+            drilldown = DrilldownIndex(df_to_use)
         weeks_in_state = self.week_analyzer.calculate_weeks_in_state()
         valid_weeks = weeks_in_state.dropna()
 
         if valid_weeks.empty:
-            return self._create_empty_chart()  # type: ignore[attr-defined]
+            return self.week_analyzer.create_empty_chart()
 
         value_counts = valid_weeks.value_counts().sort_index()
         max_weeks = value_counts.index.max()
@@ -240,7 +250,7 @@ class SSAVisualizer:
             value_counts = value_counts.set_axis(new_index, axis=0)
 
         hover_text = []
-        ssas_by_interval = {}
+        positions_by_interval = {}
 
         for interval in value_counts.index:
             if pd.isna(interval) or str(interval).strip() == "":
@@ -254,16 +264,16 @@ class SSAVisualizer:
                     weeks = int(interval.split()[0])
                     mask = weeks_in_state == weeks
 
-                ssas = df_to_use[mask].iloc[:, SSAColumns.NUMERO_SSA].tolist()
-                ssas_by_interval[str(interval)] = ssas
+                positions = np.flatnonzero(mask.to_numpy())
+                positions_by_interval[str(interval)] = positions
 
-                ssa_preview = "<br>".join(ssas[:5])
-                if len(ssas) > 5:
-                    ssa_preview += f"<br>... (+{len(ssas)-5} SSAs)"
+                ssa_preview = "<br>".join(drilldown.numbers(positions[:5]))
+                if len(positions) > 5:
+                    ssa_preview += f"<br>... (+{len(positions)-5} SSAs)"
 
                 hover_text.append(
                     f"<b>{interval}</b><br>"
-                    f"<b>Total SSAs:</b> {len(ssas)}<br>"
+                    f"<b>Total SSAs:</b> {len(positions)}<br>"
                     f"<b>SSAs:</b><br>{ssa_preview}"
                 )
 
@@ -278,7 +288,7 @@ class SSAVisualizer:
         ]
 
         if not valid_indices:
-            return self._create_empty_chart()  # type: ignore[attr-defined]
+            return self.week_analyzer.create_empty_chart()
 
         fig = go.Figure(
             [
@@ -292,7 +302,10 @@ class SSAVisualizer:
                     hovertext=[hover_text[i] for i in valid_indices],
                     hoverinfo="text",
                     customdata=[
-                        list(ssas_by_interval.values())[i] for i in valid_indices
+                        drilldown.add("weeks_in_state", label, positions)
+                        for label, positions in (
+                            list(positions_by_interval.items())[i] for i in valid_indices
+                        )
                     ],
                     hoverlabel=dict(bgcolor="white", font_size=12, font_family="Arial"),
                     showlegend=False,
@@ -333,6 +346,9 @@ class WeekAnalyzer:
         self.current_date = date.today()
         self.current_year = self.current_date.year
         self.current_week = self.current_date.isocalendar()[1]
+        # analyze_weeks por use_programmed (gráficos de semana compartilham)
+        self._weeks: Dict[bool, pd.DataFrame] = {}
+        self._weeks_lock = threading.Lock()
 
     def calculate_weeks_in_state(self) -> pd.Series:
         """Calcula quantas semanas cada SSA está em seu estado atual."""
@@ -348,7 +364,8 @@ class WeekAnalyzer:
             except ValueError:
                 return None
 
-        weeks_in_state = self.df.iloc[:, SSAColumns.SEMANA_CADASTRO].apply(
+        # astype(object): em colunas categóricas o apply devolveria outra categórica
+        weeks_in_state = self.df.iloc[:, SSAColumns.SEMANA_CADASTRO].astype(object).apply(
             get_week_number
         )
         current_week = int(self.current_date.strftime("%Y%W")[4:])
@@ -359,6 +376,13 @@ class WeekAnalyzer:
         )
 
     def analyze_weeks(self, use_programmed: bool = True) -> pd.DataFrame:
+        """Analisa distribuição de SSAs por semana (memoizado por instância)."""
+        with self._weeks_lock:
+            if use_programmed not in self._weeks:
+                self._weeks[use_programmed] = self._analyze_weeks(use_programmed)
+            return self._weeks[use_programmed]
+
+    def _analyze_weeks(self, use_programmed: bool = True) -> pd.DataFrame:
         """Analisa distribuição de SSAs por semana com validação melhorada."""
         week_column = (
             SSAColumns.SEMANA_PROGRAMADA
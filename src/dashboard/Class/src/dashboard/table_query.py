@@ -0,0 +1,297 @@
+# src/dashboard/table_query.py
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..data.ssa_columns import SSAColumns
+
+
+# Colunas da ssa-table -> coluna do DF canônico
+TABLE_COLUMNS = {
+    "numero": SSAColumns.NUMERO_SSA,
+    "estado": SSAColumns.SITUACAO,
+    "setor_emissor": SSAColumns.SETOR_EMISSOR,
+    "setor_executor": SSAColumns.SETOR_EXECUTOR,
+    "resp_prog": SSAColumns.RESPONSAVEL_PROGRAMACAO,
+    "resp_exec": SSAColumns.RESPONSAVEL_EXECUCAO,
+    "semana_prog": SSAColumns.SEMANA_PROGRAMADA,
+    "prioridade": SSAColumns.GRAU_PRIORIDADE_EMISSAO,
+    "data_emissao": SSAColumns.EMITIDA_EM,
+    "descricao": SSAColumns.DESC_SSA,
+}
+
+DATE_COLUMNS = {"data_emissao"}
+DATE_FORMAT = "%d/%m/%Y %H:%M"
+DEFAULT_PAGE_SIZE = 30
+
+# Operadores do filter_query do DataTable (sem o prefixo de caixa s/i)
+_OPERATORS = {
+    "=": "eq", "eq": "eq",
+    "!=": "ne", "ne": "ne",
+    "<": "lt", "lt": "lt",
+    "<=": "le", "le": "le",
+    ">": "gt", "gt": "gt",
+    ">=": "ge", "ge": "ge",
+    "contains": "contains",
+    "datestartswith": "datestartswith",
+}
+_UNARY = {"blank": "blank", "nil": "blank"}
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<column>\{[^}]*\})
+      | (?P<quoted>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|`(?:[^`\\]|\\.)*`)
+      | (?P<logic>&&|\|\|)
+      | (?P<word>[^\s{}"'`]+)
+    )""",
+    re.VERBOSE,
+)
+
+# (coluna, operador, valor, sensível à caixa)
+Condition = Tuple[str, str, Optional[str], bool]
+
+
+def _tokens(query: str) -> List[Tuple[str, str]]:
+    tokens, pos = [], 0
+    query = query.strip()
+    while pos < len(query):
+        match = _TOKEN.match(query, pos)
+        if match is None or match.end() == pos:
+            raise ValueError(f"Filtro inválido perto de: {query[pos:pos + 20]!r}")
+        kind = match.lastgroup
+        assert kind is not None  # todas as alternativas do padrão são grupos nomeados
+        text = match.group(kind)
+        if kind == "quoted":
+            text = re.sub(r"\\(.)", r"\1", text[1:-1])
+        elif kind == "word" and text.lower() in ("and", "or"):
+            kind, text = "logic", "&&" if text.lower() == "and" else "||"
+        tokens.append((kind, text))
+        pos = match.end()
+    return tokens
+
+
+def parse_filter_query(query: Optional[str]) -> List[List[Condition]]:
+    """Converte o filter_query do DataTable em grupos OR de condições AND.
+
+    Aceita ``{coluna} operador valor`` com os operadores do DataTable
+    (``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` e as formas ``eq``/``ne``/...,
+    ``contains``, ``datestartswith``, prefixos ``s``/``i`` de caixa e
+    ``is blank``/``is nil``/``is not blank``), unidas por ``&&``/``and`` e
+    ``||``/``or``. Parênteses não são suportados. Levanta ValueError para
+    consultas inválidas ou colunas desconhecidas.
+    """
+    if not query or not query.strip():
+        return []
+    groups: List[List[Condition]] = [[]]
+    tokens = _tokens(query)
+    # Operador lógico (&& ou ||) ainda sem a condição à sua direita
+    pending: Optional[str] = None
+    i = 0
+    while i < len(tokens):
+        kind, text = tokens[i]
+        if kind == "logic":
+            if pending is not None or not groups[-1]:
+                raise ValueError(f"Operador lógico sem condição: {text}")
+            if text == "||":
+                groups.append([])
+            pending = text
+            i += 1
+            continue
+        if kind != "column":
+            raise ValueError(f"Esperado {{coluna}}, encontrado {text!r}")
+        column = text[1:-1].strip()
+        if column not in TABLE_COLUMNS:
+            raise ValueError(f"Coluna desconhecida no filtro: {column}")
+        if i + 1 >= len(tokens) or tokens[i + 1][0] != "word":
+            raise ValueError(f"Operador ausente para {column}")
+        op = tokens[i + 1][1].lower()
+        if op == "is":
+            negate = i + 2 < len(tokens) and tokens[i + 2][1].lower() == "not"
+            j = i + 3 if negate else i + 2
+            unary = _UNARY.get(tokens[j][1].lower()) if j < len(tokens) else None
+            if unary is None:
+                raise ValueError(f"Operador unário inválido para {column}")
+            groups[-1].append((column, f"not_{unary}" if negate else unary, None, True))
+            pending = None
+            i = j + 1
+            continue
+        sensitive = True
+        if op not in _OPERATORS and op[:1] in ("s", "i") and op[1:] in _OPERATORS:
+            sensitive, op = op[0] == "s", op[1:]
+        if op not in _OPERATORS:
+            raise ValueError(f"Operador desconhecido: {op}")
+        if i + 2 >= len(tokens) or tokens[i + 2][0] not in ("word", "quoted"):
+            raise ValueError(f"Valor ausente para {column} {op}")
+        groups[-1].append((column, _OPERATORS[op], tokens[i + 2][1], sensitive))
+        pending = None
+        i += 3
+    if pending is not None:
+        raise ValueError(f"Filtro termina com operador lógico: {pending}")
+    return groups
+
+
+def _sort_key(sort_by) -> Tuple[Tuple[str, bool], ...]:
+    key = []
+    for item in sort_by or []:
+        column = item.get("column_id")
+        if column in TABLE_COLUMNS:
+            key.append((column, item.get("direction", "asc") == "desc"))
+    return tuple(key)
+
+
+class TableQuery:
+    """Filtro, ordenação e paginação da ssa-table no servidor.
+
+    Trabalha sobre a seleção filtrada pelos dropdowns. Os predicados são
+    avaliados uma vez por valor distinto da coluna (``pd.factorize``) e
+    expandidos para as linhas; a ordem resultante de cada par
+    (ordenação, filtro) fica em um pequeno LRU para a troca de página não
+    refazer o trabalho. Os textos comparados são os exibidos na tabela
+    (datas em ``DATE_FORMAT``); ``<``/``>`` em datas comparam o instante.
+    """
+
+    def __init__(self, df: pd.DataFrame, max_orders: int = 16):
+        self.df = df
+        self.max_orders = max_orders
+        self._factorized: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._orders: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [codes for codes, _, _ in self._factorized.values()]
+        arrays += list(self._orders.values())
+        return sum(a.nbytes for a in arrays)
+
+    def _values(self, column: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(códigos por linha, textos exibidos, valores) por valor distinto, já ordenados.
+
+        Código -1 é vazio. Textos seguem a ordem lexicográfica (como a
+        ordenação nativa do DataTable); datas, a cronológica.
+        """
+        if column not in self._factorized:
+            series = self.df.iloc[:, TABLE_COLUMNS[column]]
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            if column in DATE_COLUMNS:
+                uniques = pd.DatetimeIndex(uniques)
+                texts = uniques.strftime(DATE_FORMAT).to_numpy(dtype=object)
+                order = np.argsort(uniques.to_numpy(), kind="stable")
+            else:
+                texts = np.asarray([str(v) for v in uniques], dtype=object)
+                order = np.argsort(texts, kind="stable")
+            rank = np.empty(len(order), dtype=np.intp)
+            rank[order] = np.arange(len(order))
+            codes = codes.astype(np.intp)
+            valid = codes >= 0
+            codes[valid] = rank[codes[valid]]
+            values = np.asarray(uniques)[order]
+            self._factorized[column] = (codes, texts[order], values)
+        return self._factorized[column]
+
+    def _condition_mask(self, column: str, op: str, value: Optional[str], sensitive: bool) -> np.ndarray:
+        codes, texts, values = self._values(column)
+        if op in ("blank", "not_blank"):
+            per_value = np.asarray([t.strip() == "" for t in texts], dtype=bool)
+            mask = _expand(per_value, codes, missing=True)
+            return ~mask if op == "not_blank" else mask
+        if column in DATE_COLUMNS and op in ("lt", "le", "gt", "ge"):
+            moment = pd.to_datetime(value, dayfirst=True, errors="coerce")
+            if pd.notna(moment):
+                return _expand(_compare(values, op, moment.to_datetime64()), codes)
+        text = str(value)
+        candidates = texts if sensitive else np.asarray([t.lower() for t in texts], dtype=object)
+        if not sensitive:
+            text = text.lower()
+        if op == "contains":
+            per_value = np.asarray([text in t for t in candidates], dtype=bool)
+        elif op == "datestartswith":
+            per_value = np.asarray([t.startswith(text) for t in candidates], dtype=bool)
+        else:
+            per_value = _compare(candidates, op, text)
+        return _expand(per_value, codes, missing=(op == "ne"))
+
+    def select(self, filter_query: Optional[str] = None) -> Optional[np.ndarray]:
+        """Máscara das linhas que atendem ao filter_query (None: todas)."""
+        groups = parse_filter_query(filter_query)
+        if not groups:
+            return None
+        mask = np.zeros(len(self.df), dtype=bool)
+        for conditions in groups:
+            group = np.ones(len(self.df), dtype=bool)
+            for condition in conditions:
+                group &= self._condition_mask(*condition)
+            mask |= group
+        return mask
+
+    def order(self, sort_by=None, filter_query: Optional[str] = None) -> np.ndarray:
+        """Posições das linhas filtradas, na ordem pedida (estável)."""
+        key = (_sort_key(sort_by), (filter_query or "").strip())
+        with self._lock:
+            cached = self._orders.get(key)
+            if cached is not None:
+                self._orders.move_to_end(key)
+                return cached
+        mask = self.select(filter_query)
+        positions = np.arange(len(self.df), dtype=np.intp) if mask is None else np.flatnonzero(mask)
+        if key[0] and len(positions):
+            keys = []
+            for column, descending in reversed(key[0]):
+                codes, texts, _ = self._values(column)
+                ranks = codes[positions]
+                # Vazios por último nos dois sentidos
+                if descending:
+                    ranks = np.where(ranks < 0, len(texts), len(texts) - 1 - ranks)
+                else:
+                    ranks = np.where(ranks < 0, len(texts), ranks)
+                keys.append(ranks)
+            positions = positions[np.lexsort(keys)]
+        with self._lock:
+            self._orders[key] = positions
+            while len(self._orders) > self.max_orders:
+                self._orders.popitem(last=False)
+        return positions
+
+    def page(
+        self,
+        page_current: Optional[int] = 0,
+        page_size: Optional[int] = DEFAULT_PAGE_SIZE,
+        sort_by=None,
+        filter_query: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, int, int]:
+        """(linhas da página, total de páginas, página efetiva).
+
+        A página pedida é limitada ao intervalo válido.
+        """
+        positions = self.order(sort_by, filter_query)
+        size = max(1, int(page_size or DEFAULT_PAGE_SIZE))
+        page_count = max(1, math.ceil(len(positions) / size))
+        current = min(max(0, int(page_current or 0)), page_count - 1)
+        return self.df.take(positions[current * size:(current + 1) * size]), page_count, current
+
+
+def _compare(values: np.ndarray, op: str, other) -> np.ndarray:
+    if op == "eq":
+        return values == other
+    if op == "ne":
+        return values != other
+    if op == "lt":
+        return values < other
+    if op == "le":
+        return values <= other
+    if op == "gt":
+        return values > other
+    return values >= other
+
+
+def _expand(per_value: np.ndarray, codes: np.ndarray, missing: bool = False) -> np.ndarray:
+    """Resultado por valor distinto -> máscara por linha (vazios recebem ``missing``)."""
+    per_value = np.append(np.asarray(per_value, dtype=bool), missing)
+    return per_value[codes]
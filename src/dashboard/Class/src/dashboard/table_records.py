@@ -0,0 +1,55 @@
+# src/dashboard/table_records.py
+from typing import Any, Collection, Dict, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .table_query import DATE_COLUMNS, DATE_FORMAT, TABLE_COLUMNS
+
+SAM_LINK_PREFIX = "https://osprd.itaipu/SAM_SMA/SSAPublicView.aspx?SerialNumber="
+SAM_LINK_SUFFIX = "&language=pt"
+LINK_COLUMNS = ("numero",)
+
+
+def sam_links(numbers: pd.Series) -> pd.Series:
+    """Links Markdown ``[num](url)`` para a página pública da SSA no SAM."""
+    text = numbers.astype(str).astype(object)
+    return "[" + text + "](" + SAM_LINK_PREFIX + text + SAM_LINK_SUFFIX + ")"
+
+
+def format_dates(values: pd.Series, date_format: str = DATE_FORMAT) -> pd.Series:
+    """Datas no formato da tabela; nulas viram ``""``.
+
+    ``strftime`` roda uma vez por data distinta (``pd.factorize``) e é
+    expandido para as linhas.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        values = pd.to_datetime(values, errors="coerce")
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    texts = np.append(pd.DatetimeIndex(uniques).strftime(date_format).to_numpy(dtype=object), "")
+    return pd.Series(texts[codes], index=values.index, dtype=object)
+
+
+def build_table_records(
+    df: pd.DataFrame,
+    columns: Mapping[str, int] = TABLE_COLUMNS,
+    link_columns: Collection[str] = LINK_COLUMNS,
+    date_columns: Collection[str] = DATE_COLUMNS,
+    date_format: str = DATE_FORMAT,
+) -> List[Dict[str, Any]]:
+    """Linhas da ssa-table (lista de dicts) montadas por coluna.
+
+    ``columns`` liga cada id de coluna da tabela ao índice no DF canônico.
+    Datas e links são formatados de uma vez por coluna; os registros saem
+    de um ``zip`` das listas, sem ``iterrows``.
+    """
+    keys = list(columns)
+    values = []
+    for key in keys:
+        series = df.iloc[:, columns[key]]
+        if key in date_columns:
+            series = format_dates(series, date_format)
+        elif key in link_columns:
+            series = sam_links(series)
+        values.append(series.tolist())
+    return [dict(zip(keys, row)) for row in zip(*values)]
@@ -0,0 +1,151 @@
+# src/dashboard/user_history.py
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from itertools import islice
+from typing import Deque, Dict, List, Optional
+
+# Ações guardadas por sessão e expiração de sessões ociosas
+DEFAULT_HISTORY_SIZE = 10
+DEFAULT_IDLE_SECONDS = 8 * 3600
+# Persistência opcional (pode ser ligada sem alterar código: SSA_HISTORY_DB=logs/history.db)
+DEFAULT_DB_PATH = os.environ.get("SSA_HISTORY_DB") or None
+DEFAULT_FLUSH_EVERY = 50
+
+
+class _Session:
+    __slots__ = ("items", "last_seen")
+
+    def __init__(self, size: int):
+        self.items: Deque[Dict] = deque(maxlen=size)
+        self.last_seen = time.monotonic()
+
+
+class UserHistory:
+    """Histórico de ações por sessão, com buffer circular por sessão.
+
+    Cada sessão guarda só as últimas ``size`` ações (``deque`` com
+    ``maxlen``); leituras custam O(k) no número de itens pedidos. Sessões
+    sem atividade por ``idle_seconds`` são descartadas na próxima escrita
+    (as sessões ficam em ordem de último acesso). Com ``db_path``, as ações
+    também vão para uma tabela SQLite, gravadas em lotes de ``flush_every``.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_HISTORY_SIZE,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        db_path: Optional[str] = DEFAULT_DB_PATH,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+    ):
+        self.size = max(1, size)
+        self.idle_seconds = idle_seconds
+        self.db_path = db_path
+        self.flush_every = max(1, flush_every)
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        if db_path:
+            atexit.register(self.flush)
+
+    def __len__(self) -> int:
+        """Número de sessões ativas."""
+        return len(self._sessions)
+
+    def _touch(self, session_id: str) -> Optional[_Session]:
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.last_seen = time.monotonic()
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def _get_or_create(self, session_id: str) -> _Session:
+        session = self._touch(session_id)
+        if session is None:
+            session = self._sessions[session_id] = _Session(self.size)
+        return session
+
+    def _expire(self) -> None:
+        limit = time.monotonic() - self.idle_seconds
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_seen >= limit:
+                break
+            del self._sessions[session_id]
+
+    def add(self, session_id: str, action: str, action_type: str = "action") -> None:
+        now = datetime.now()
+        item = {
+            "time": now.strftime("%H:%M:%S"),
+            "action": action,
+            "type": action_type,
+            "full_timestamp": now,
+        }
+        flush = False
+        with self._lock:
+            self._expire()
+            self._get_or_create(session_id).items.append(item)
+            if self.db_path:
+                self._pending.append((session_id, now.isoformat(timespec="seconds"), action_type, action))
+                flush = len(self._pending) >= self.flush_every
+        if flush:
+            self.flush()
+
+    def recent(self, session_id: str, k: int) -> List[Dict]:
+        """As ``k`` ações mais recentes da sessão, da mais nova para a mais antiga."""
+        with self._lock:
+            session = self._touch(session_id)
+            return list(islice(reversed(session.items), k)) if session else []
+
+    def items(self, session_id: str) -> List[Dict]:
+        """Ações guardadas da sessão, da mais antiga para a mais nova."""
+        with self._lock:
+            session = self._touch(session_id)
+            return list(session.items) if session else []
+
+    def count(self, session_id: str) -> int:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            return len(session.items) if session else 0
+
+    def clear(self, session_id: str) -> None:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.items.clear()
+
+    def flush(self) -> None:
+        """Grava no SQLite as ações pendentes (sem efeito sem ``db_path``).
+
+        Nunca levanta: se o banco ou o diretório não puderem ser usados, o
+        lote é descartado (com aviso no log) para não derrubar a requisição
+        e não acumular memória enquanto o caminho continuar inválido. O
+        histórico em memória não é afetado.
+        """
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if not rows or not self.db_path:
+            return
+        try:
+            with self._db_lock:
+                directory = os.path.dirname(self.db_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                conn = sqlite3.connect(self.db_path)
+                try:
+                    with conn:
+                        conn.execute(
+                            "CREATE TABLE IF NOT EXISTS user_history "
+                            "(session TEXT, ts TEXT, type TEXT, action TEXT)"
+                        )
+                        conn.executemany("INSERT INTO user_history VALUES (?, ?, ?, ?)", rows)
+                finally:
+                    conn.close()
+        except (sqlite3.Error, OSError) as e:
+            logging.warning(f"Falha ao gravar histórico em {self.db_path}; {len(rows)} ações descartadas: {e}")
@@ -6,6 +6,22 @@ Módulo de dados do Dashboard SSA.
 from .ssa_data import SSAData
 from .ssa_columns import SSAColumns
 from .data_loader import DataLoader
+from .snapshot_cache import SnapshotCache
+from .ssa_table import SSATable, SSARecord
+from .ssa_index import SSAIndex
+from .categoricals import CATEGORICAL_COLUMNS, to_categorical, drop_unused_categories
 from ..utils.file_manager import FileManager
 
-__all__ = ["SSAData", "SSAColumns", "DataLoader", "FileManager"]
+__all__ = [
+    "SSAData",
+    "SSAColumns",
+    "DataLoader",
+    "SnapshotCache",
+    "SSATable",
+    "SSARecord",
+    "SSAIndex",
+    "CATEGORICAL_COLUMNS",
+    "to_categorical",
+    "drop_unused_categories",
+    "FileManager",
+]
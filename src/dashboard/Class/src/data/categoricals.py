@@ -0,0 +1,52 @@
+# src/data/categoricals.py
+from typing import Iterable
+
+import pandas as pd
+
+from .ssa_columns import SSAColumns
+
+
+# Colunas de baixa cardinalidade armazenadas como "category" no DF canônico
+CATEGORICAL_COLUMNS = (
+    SSAColumns.SITUACAO,
+    SSAColumns.SETOR_EMISSOR,
+    SSAColumns.SETOR_EXECUTOR,
+    SSAColumns.GRAU_PRIORIDADE_EMISSAO,
+    SSAColumns.GRAU_PRIORIDADE_PLANEJAMENTO,
+    SSAColumns.RESPONSAVEL_PROGRAMACAO,
+    SSAColumns.RESPONSAVEL_EXECUCAO,
+    SSAColumns.SEMANA_CADASTRO,
+    SSAColumns.SEMANA_PROGRAMADA,
+    SSAColumns.EXECUCAO_SIMPLES,
+)
+
+
+def to_categorical(
+    df: pd.DataFrame, columns: Iterable[int] = CATEGORICAL_COLUMNS
+) -> pd.DataFrame:
+    """Converte as colunas indicadas do DF canônico para dtype ``category``.
+
+    As categorias ficam em ordem lexical, então ``sort_index``/``sorted`` sobre
+    os resultados se comportam como nas colunas de strings. O valor vazio ("")
+    vira uma categoria comum, mantendo válidas comparações como ``== ""``.
+    """
+    for idx in columns:
+        if idx in df.columns and not isinstance(df[idx].dtype, pd.CategoricalDtype):
+            df[idx] = df[idx].astype("category")
+    return df
+
+
+def drop_unused_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """Remove categorias sem ocorrência (após filtros) das colunas categóricas.
+
+    Sem isso, ``value_counts`` de um DF filtrado lista todas as categorias do
+    DF original com contagem zero. Devolve um novo DF (cópia rasa); colunas
+    não categóricas são compartilhadas com o original.
+    """
+    cat_cols = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    if not cat_cols:
+        return df
+    out = df.copy(deep=False)
+    for col in cat_cols:
+        out[col] = out[col].cat.remove_unused_categories()
+    return out
@@ -0,0 +1,142 @@
+# src/data/column_mapping_cache.py
+import hashlib
+import json
+import logging
+import numbers
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+# Incrementar quando as regras de mapeamento (sinônimos, inferência) mudarem
+MAPPING_VERSION = "1"
+
+DEFAULT_MAX_ENTRIES = 64
+
+
+def _digest(parts: Sequence[object]) -> str:
+    payload = json.dumps([MAPPING_VERSION, *parts], default=repr, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def header_fingerprint(header_row: int, values: Sequence[object]) -> str:
+    """Impressão digital de um layout com cabeçalho: posição + valores brutos da linha.
+
+    Células vazias à direita são ignoradas (a largura lida varia entre o modo
+    padrão e o streaming).
+    """
+    values = list(values)
+    while values and values[-1] in ("", None):
+        values.pop()
+    return "h-" + _digest([header_row, [repr(v) for v in values]])
+
+
+def dtype_fingerprint(df: pd.DataFrame) -> str:
+    """Impressão digital de uma planilha sem cabeçalho: largura + dtypes das colunas."""
+    return "d-" + _digest([df.shape[1], [str(t) for t in df.dtypes]])
+
+
+def _json_label(label):
+    """Rótulo serializável em JSON (str, inteiro ou None); levanta TypeError se não for."""
+    if label is None or isinstance(label, str):
+        return label
+    if isinstance(label, numbers.Integral) and not isinstance(label, bool):
+        return int(label)  # rótulos posicionais vêm como numpy.int64
+    raise TypeError(f"rótulo não serializável: {label!r}")
+
+
+class ColumnMappingCache:
+    """Cache persistente (JSON) do mapeamento SSAColumns -> rótulo real.
+
+    Exportações do SAM mantêm o mesmo layout por meses; com o mapeamento
+    resolvido guardado pela impressão digital do cabeçalho (ou dos dtypes, em
+    planilhas sem cabeçalho), cargas seguintes pulam a detecção de cabeçalho,
+    a normalização de rótulos e a inferência por dados. Um layout diferente
+    gera outra impressão digital, então não há invalidação manual. O arquivo
+    guarda no máximo ``max_entries`` layouts (os mais recentes).
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.max_entries = int(max_entries)
+        self._entries: Optional[Dict[str, dict]] = None
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "writes": 0}
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                entries = data.get("entries", {}) if data.get("version") == MAPPING_VERSION else {}
+            except (OSError, ValueError, AttributeError):
+                entries = {}
+            self._entries = entries if isinstance(entries, dict) else {}
+        return self._entries
+
+    def header_rows(self) -> List[int]:
+        """Linhas de cabeçalho já vistas (candidatas para a busca rápida)."""
+        rows = {e.get("header_row") for e in self._load().values()}
+        return sorted(r for r in rows if isinstance(r, int))
+
+    @staticmethod
+    def _labels(entry: dict) -> Dict[int, object]:
+        return {int(idx): label for idx, label in entry["labels"]}
+
+    def get(self, fingerprint: str) -> Optional[Dict[int, object]]:
+        entry = self._load().get(fingerprint)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return self._labels(entry)
+
+    def find_header(self, grid: Sequence[list]) -> Optional[Tuple[int, Dict[int, object]]]:
+        """Procura um cabeçalho conhecido nas linhas de ``grid`` já vistas como cabeçalho.
+
+        Devolve ``(linha do cabeçalho, mapeamento)`` ou None.
+        """
+        entries = self._load()
+        for row in self.header_rows():
+            if row < len(grid):
+                entry = entries.get(header_fingerprint(row, grid[row]))
+                if entry is not None and entry.get("header_row") == row:
+                    self.stats["hits"] += 1
+                    return row, self._labels(entry)
+        self.stats["misses"] += 1
+        return None
+
+    def put(
+        self,
+        fingerprint: str,
+        labels: Dict[int, object],
+        header_row: Optional[int] = None,
+    ) -> bool:
+        """Grava o mapeamento (atômico); rótulos não serializáveis não são cacheados."""
+        try:
+            stored = sorted([int(k), _json_label(v)] for k, v in labels.items())
+        except TypeError:
+            return False
+        entries = self._load()
+        entries.pop(fingerprint, None)
+        entries[fingerprint] = {"header_row": header_row, "labels": stored}
+        while len(entries) > self.max_entries:
+            entries.pop(next(iter(entries)))
+        tmp = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(
+                json.dumps({"version": MAPPING_VERSION, "entries": entries}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logging.warning(f"Falha ao gravar cache de mapeamento {self.path.name}: {str(e)}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+        self.stats["writes"] += 1
+        return True
@@ -1,26 +1,72 @@
 # src/data/data_loader.py
+import os
+import numpy as np
 import pandas as pd
+from pandas.io.parsers import TextParser
 import warnings
 import logging
 import traceback
-from typing import List, Optional, Dict, Tuple
+from itertools import chain, islice
+from typing import List, Optional, Dict, Sequence, Tuple, Union
 from datetime import datetime
 import unicodedata
-from ..utils.date_utils import diagnose_dates
-from .ssa_data import SSAData
+from ..utils.date_utils import diagnose_dates, parse_sam_datetimes
+from .ssa_data import SSARecordLike
+from .ssa_table import SSATable
+from .ssa_index import SSAIndex
+from .categoricals import to_categorical
 from .ssa_columns import SSAColumns
+from .snapshot_cache import SnapshotCache, DEFAULT_MAX_BYTES
+from .column_mapping_cache import ColumnMappingCache, dtype_fingerprint, header_fingerprint
+from .excel_stream import ExcelRowReader, iter_chunks, pad_rows
 from ..utils.data_validator import SSADataValidator
+from ..utils.validation_rules import DEFAULT_RULES
+from ..utils.diagnostics import Diagnostics
+
+
+# Incrementar sempre que a saída canônica de load_data mudar (invalida snapshots)
+LOADER_VERSION = "2"
 
 
 class DataLoader:
     """Carrega e prepara os dados das SSAs."""
 
-    def __init__(self, excel_path: str):
+    def __init__(
+        self,
+        excel_path: str,
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        streaming: bool = False,
+        chunk_rows: int = 50_000,
+        categorical: bool = False,
+        diagnostics: Optional[Union[str, Diagnostics]] = None,
+    ):
         self.excel_path = excel_path
-        self.df = None
-        self.ssa_objects = []
+        self.df: Optional[pd.DataFrame] = None
+        self.ssa_objects: Optional[SSATable] = None
+        self._ssa_index: Optional[SSAIndex] = None
         self.validator = SSADataValidator()
-        self._col_labels = {}  # Mapeia índice SSAColumns -> rótulo real no DF
+        self._col_labels: Dict[int, object] = {}  # Mapeia índice SSAColumns -> rótulo real no DF
+        # Cache de snapshots canônicos (opcional): evita reprocessar o mesmo Excel
+        self.cache = SnapshotCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.loaded_from_cache = False
+        # Problemas encontrados pelas regras de validação (rule, row, value)
+        self.validation_issues: Optional[pd.DataFrame] = None
+        # Mapeamento de colunas por layout (cabeçalho/dtypes), junto aos snapshots
+        self.mapping_cache = (
+            ColumnMappingCache(os.path.join(cache_dir, "column_mappings.json"))
+            if cache_dir
+            else None
+        )
+        # Modo streaming: lê e normaliza em blocos de chunk_rows linhas
+        self.streaming = streaming
+        self.chunk_rows = max(1, int(chunk_rows))
+        # Colunas de baixa cardinalidade como dtype "category" no DF canônico
+        self.categorical = categorical
+        # Diagnósticos: "off" / "summary" (padrão) / "full" (detalhe em arquivo)
+        self.diagnostics = (
+            diagnostics if isinstance(diagnostics, Diagnostics) else Diagnostics(diagnostics)
+        )
         # self.file_manager = FileManager(os.path.dirname(excel_path)) # Evitar ref circular
 
     # -----------------------
@@ -76,17 +122,34 @@ class DataLoader:
             ],
         }
 
-    def _detect_header_row(self, max_rows: int = 25) -> int:
+    def _read_raw_grid(self) -> List[list]:
+        """Lê a planilha uma única vez e devolve a grade bruta de células.
+
+        As células vêm sem conversão de tipos nem tratamento de vazios (como o
+        leitor do pandas as entrega ao parser), de modo que detecção de
+        cabeçalho, modo posicional e inferência de colunas trabalham sobre esta
+        grade em memória, sem novas leituras do Excel.
+        """
+        raw = pd.read_excel(self.excel_path, header=None, dtype=object, na_filter=False)
+        return raw.values.tolist()
+
+    def _detect_header_row(
+        self, max_rows: int = 25, grid: Optional[List[list]] = None
+    ) -> int:
         """Detecta automaticamente a linha de cabeçalho no Excel.
 
         Estratégia: lê as primeiras linhas sem cabeçalho e escolhe a linha
-        com maior cobertura de nomes esperados/sinônimos.
+        com maior cobertura de nomes esperados/sinônimos. Se ``grid`` for
+        informado, usa a grade já carregada em vez de reler o arquivo.
         """
-        try:
-            tmp = pd.read_excel(self.excel_path, header=None, nrows=max_rows)
-        except Exception:
-            # fallback seguro
-            return 1
+        if grid is not None:
+            tmp = pd.DataFrame(grid[:max_rows])
+        else:
+            try:
+                tmp = pd.read_excel(self.excel_path, header=None, nrows=max_rows)
+            except Exception:
+                # fallback seguro
+                return 1
 
         # prepara conjunto de chaves esperadas normalizadas
         expected = {self._normalize_label(n) for n in SSAColumns.COLUMN_NAMES.values()}
@@ -107,6 +170,17 @@ class DataLoader:
         # Se cobertura muito baixa, mantém padrão 1 (linha 1 = segunda linha zero-based)
         return int(best_row)
 
+    def _frame_from_grid(
+        self, grid: List[list], header_row: Optional[int]
+    ) -> pd.DataFrame:
+        """Monta o DataFrame equivalente a ``read_excel(header=header_row)``.
+
+        Usa o mesmo ``TextParser`` que o ``read_excel`` aplica internamente,
+        garantindo rótulos (vazios/duplicados) e inferência de tipos idênticos.
+        ``header_row=None`` equivale à leitura sem cabeçalho.
+        """
+        return TextParser(grid, header=header_row).read()
+
     def _infer_columns_from_data(self, sample_rows: int = 200) -> None:
         """Para planilhas sem cabeçalho, infere colunas-chave por padrão de dados.
 
@@ -123,7 +197,7 @@ class DataLoader:
         cols = list(df.columns)
 
         def frac(series, cond):
-            s = series.astype(str)
+            s = self._as_text(series)
             total = max(len(s), 1)
             return (cond(s)).sum() / total
 
@@ -242,6 +316,22 @@ class DataLoader:
             log_issue(f"Erro ao processar data: {str(e)}")
             return None
 
+    @staticmethod
+    def _as_text(series: pd.Series) -> pd.Series:
+        """Converte a coluna para texto sem o sufixo '.0' de inteiros em float.
+
+        Colunas numéricas com vazios chegam como float; formatar os inteiros
+        sem casa decimal deixa o texto independente da inferência de tipos
+        (planilha inteira ou bloco a bloco no modo streaming).
+        """
+        if pd.api.types.is_float_dtype(series.dtype):
+            out = series.astype(str)
+            integral = series.notna() & (series % 1 == 0) & (series.abs() < 1e15)
+            if integral.any():
+                out[integral] = series[integral].astype("int64").astype(str)
+            return out
+        return series.astype(str)
+
     def _convert_dates(self):
         """Converte e valida datas mantendo o tipo apropriado e dtype consistente."""
         try:
@@ -251,15 +341,8 @@ class DataLoader:
             if (col_label is None) or (col_label not in self.df.columns):
                 logging.warning("Coluna 'Emitida Em' ausente; pulando conversão de datas")
                 return
-            # Converte diretamente para datetime usando o formato correto; always enforce dtype
-            converted = pd.to_datetime(
-                self.df[col_label],
-                format="%d/%m/%Y %H:%M:%S",
-                errors="coerce",
-                dayfirst=True,
-            )
-            # Ensure dtype is datetime64[ns]
-            self.df[col_label] = converted.astype("datetime64[ns]")
+            # Layout fixo dd/mm/aaaa HH:MM:SS via NumPy; o restante pelo parser geral
+            self.df[col_label] = parse_sam_datetimes(self.df[col_label])
 
             # Verifica se houve problemas
             invalid_mask = self.df[col_label].isna()
@@ -267,42 +350,38 @@ class DataLoader:
 
             if invalid_count > 0:
                 logging.error(f"Encontradas {invalid_count} datas inválidas")
-                for idx in invalid_mask[invalid_mask].index:
-                    logging.error(
+                self.diagnostics.detail(
+                    "Datas inválidas",
+                    lambda: (
                         f"Linha {idx + 1}: Data inválida - verificar valor original"
-                    )
+                        for idx in invalid_mask[invalid_mask].index
+                    ),
+                )
 
         except Exception as e:
             logging.error(f"Erro no processamento de datas: {str(e)}")
             raise
 
-    def _to_canonical_dataframe(self):
-        """Reorganiza o DataFrame para a ordem canônica de colunas baseada em SSAColumns.
-
-        - Garante que df tenha todas as colunas esperadas nas posições corretas
-        - Preenche colunas ausentes com valores padrão seguros
-        - Mantém os tipos básicos (datetime para EMITIDA_EM, strings para demais)
-        """
-        if self.df is None:
-            return
-
-        n = len(self.df)
-        canonical_cols = []
+    def _canonical_frame(self) -> pd.DataFrame:
+        """Monta o DataFrame na ordem canônica de SSAColumns a partir de self.df."""
+        df = self.df
+        assert df is not None
+        n = len(df)
         data = {}
 
         # Helpers de defaults por tipo esperado
         def default_series(idx: int):
             expected = SSAColumns.COLUMN_TYPES.get(idx)
             if expected == "datetime64[ns]":
-                return pd.Series([pd.NaT] * n, dtype="datetime64[ns]")
+                return pd.Series([pd.NaT] * n, dtype="datetime64[ns]", index=df.index)
             # default string
-            return pd.Series([""] * n, dtype="object")
+            return pd.Series([""] * n, dtype="object", index=df.index)
 
         # Ordem canônica: pelos índices definidos
         for idx in sorted(SSAColumns.COLUMN_NAMES.keys()):
             lbl = self._get_label(idx)
-            if lbl is not None and lbl in self.df.columns:
-                s = self.df[lbl]
+            if lbl is not None and lbl in df.columns:
+                s = df[lbl]
             else:
                 s = default_series(idx)
 
@@ -318,226 +397,342 @@ class DataLoader:
                 s = s.astype("string").fillna("").astype("object")
 
             data[idx] = s
-            canonical_cols.append(idx)
 
         # Cria novo DF com as colunas na ordem desejada
-        new_df = pd.DataFrame({i: data[i] for i in canonical_cols})
-        # Substitui
-        self.df = new_df
+        return pd.DataFrame(data)
 
-    def load_data(self) -> pd.DataFrame:
-        """Carrega dados do Excel com as configurações corretas."""
-        try:
-            # Inicializa validador se ainda não existe
-            if not hasattr(self, "validator"):
-                self.validator = SSADataValidator()
+    def _to_canonical_dataframe(self):
+        """Reorganiza o DataFrame para a ordem canônica de colunas baseada em SSAColumns.
 
-            logging.info(f"Iniciando carregamento do arquivo: {self.excel_path}")
+        - Garante que df tenha todas as colunas esperadas nas posições corretas
+        - Preenche colunas ausentes com valores padrão seguros
+        - Mantém os tipos básicos (datetime para EMITIDA_EM, strings para demais)
+        - Com ``categorical=True``, usa dtype "category" nas colunas de
+          baixa cardinalidade (ver categoricals.CATEGORICAL_COLUMNS)
+        """
+        if self.df is None:
+            return
 
-            # Detecta automaticamente a linha de cabeçalho
-            header_row = self._detect_header_row()
-            self.df = pd.read_excel(
-                self.excel_path,
-                header=header_row,
+        self.df = self._canonical_frame()
+        if self.categorical:
+            to_categorical(self.df)
+        # A partir daqui os rótulos são os próprios índices de SSAColumns
+        self._col_labels = {idx: idx for idx in SSAColumns.COLUMN_NAMES.keys()}
+
+    def _cache_version(self) -> str:
+        """Versão usada na chave do snapshot (loader + opções que afetam a saída)."""
+        return f"{LOADER_VERSION}-cat" if self.categorical else LOADER_VERSION
+
+    def _load_from_snapshot(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Restaura o estado do loader a partir de um DataFrame canônico em cache."""
+        self.df = df
+        self._col_labels = {idx: idx for idx in SSAColumns.COLUMN_NAMES.keys()}
+        # Objetos SSAData são gerados sob demanda via get_ssa_objects()
+        self.ssa_objects = None
+        self.loaded_from_cache = True
+        logging.info(
+            f"Snapshot em cache reutilizado para {self.excel_path}: {len(df)} linhas"
+        )
+        self._validate_data_quality()
+        return df
+
+    def _needs_positional_mapping(self) -> bool:
+        """Indica se a cobertura de colunas essenciais é baixa demais (planilha sem cabeçalho)."""
+        required = [
+            SSAColumns.NUMERO_SSA,
+            SSAColumns.SITUACAO,
+            SSAColumns.GRAU_PRIORIDADE_EMISSAO,
+            SSAColumns.EMITIDA_EM,
+            SSAColumns.SETOR_EXECUTOR,
+        ]
+        coverage = sum(1 for r in required if self._get_label(r) in getattr(self.df, 'columns', []))
+        if coverage <= 2:
+            logging.warning("Cobertura baixa de colunas esperadas; assumindo planilha sem cabeçalho e usando mapeamento posicional")
+            return True
+        return False
+
+    def _apply_positional_mapping(self):
+        """Mapeia índices esperados para posições e infere colunas-chave pelos dados."""
+        self._col_labels = {}
+        for idx in SSAColumns.COLUMN_NAMES.keys():
+            if idx < self.df.shape[1]:
+                self._col_labels[idx] = self.df.columns[idx]
+        logging.info(f"Mapeamento posicional aplicado para {len(self._col_labels)} colunas")
+        fingerprint = dtype_fingerprint(self.df) if self.mapping_cache is not None else None
+        if fingerprint is not None:
+            cached = self.mapping_cache.get(fingerprint)
+            if cached is not None and all(
+                lbl is None or lbl in self.df.columns for lbl in cached.values()
+            ):
+                self._col_labels = cached
+                logging.info("Mapeamento posicional reutilizado do cache de layouts")
+                return
+        # Tenta inferir rótulos-chave baseado nos dados
+        self._infer_columns_from_data()
+        if fingerprint is not None:
+            self.mapping_cache.put(fingerprint, self._col_labels)
+
+    def _cached_header_layout(
+        self, grid: List[list]
+    ) -> Optional[Tuple[int, Dict[int, object]]]:
+        """Busca no cache de layouts um cabeçalho conhecido nas linhas de ``grid``.
+
+        Devolve ``(linha do cabeçalho, mapeamento)`` quando os rótulos
+        guardados existem nas colunas geradas por essa linha; caso contrário None.
+        """
+        if self.mapping_cache is None:
+            return None
+        found = self.mapping_cache.find_header(grid)
+        if found is None:
+            return None
+        header_row, labels = found
+        columns = set(self._frame_from_grid([grid[header_row]], 0).columns)
+        if not all(lbl is None or lbl in columns for lbl in labels.values()):
+            return None
+        logging.info(f"Mapeamento de colunas reutilizado do cache (cabeçalho na linha {header_row})")
+        return header_row, labels
+
+    def _remember_header_layout(self, header_row: int, header: list) -> None:
+        """Guarda o mapeamento resolvido para o cabeçalho ``header``."""
+        if self.mapping_cache is not None:
+            self.mapping_cache.put(
+                header_fingerprint(header_row, header), self._col_labels, header_row
             )
 
-            logging.info(f"Arquivo carregado. Total de linhas: {len(self.df)}")
+    def _strip_key_columns(self):
+        """Normalizações mínimas para colunas-chave no modo posicional."""
+        for key_idx in [
+            SSAColumns.NUMERO_SSA,
+            SSAColumns.SITUACAO,
+            SSAColumns.GRAU_PRIORIDADE_EMISSAO,
+            SSAColumns.SETOR_EXECUTOR,
+        ]:
+            lbl = self._get_label(key_idx)
+            if lbl in self.df.columns:
+                self.df[lbl] = self._as_text(self.df[lbl]).str.strip()
+
+    def _log_date_diagnosis(self):
+        """Diagnóstico de datas problemáticas de self.df.
+
+        No nível summary registra só as contagens por tipo de problema; no
+        nível full grava cada linha problemática no arquivo de diagnóstico.
+        """
+        em_label = self._get_label(SSAColumns.EMITIDA_EM)
+        if (em_label is None) or (em_label not in self.df.columns):
+            return
+        full = self.diagnostics.full_enabled
+        if not (full or self.diagnostics.summary_enabled):
+            return
+        # Resolve integer index robustly even if duplicate columns exist
+        try:
+            idx_arr = self.df.columns.get_indexer_for([em_label])
+            if len(idx_arr) == 1 and idx_arr[0] != -1:
+                date_col_index = int(idx_arr[0])
+            else:
+                # Se colunas são inteiras, o próprio label pode ser o índice
+                date_col_index = int(em_label) if isinstance(em_label, int) else None
+        except Exception:
+            date_col_index = int(em_label) if isinstance(em_label, int) else None
+        if date_col_index is None:
+            return
+        date_diagnosis = diagnose_dates(self.df, date_col_index, max_rows=None if full else 0)
+        if date_diagnosis["error_count"] == 0:
+            return
+        self.diagnostics.summary(
+            "Diagnóstico de datas",
+            {
+                "linhas": date_diagnosis["total_rows"],
+                "problemas": date_diagnosis["error_count"],
+                **{k: v for k, v in date_diagnosis["error_details"].items() if v},
+            },
+        )
 
-            # Constrói mapeamento de colunas esperadas -> rótulos reais
-            self._build_column_mapping()
+        def lines():
+            for prob in date_diagnosis["problematic_rows"]:
+                yield f"Linha {prob['index'] + 1}: {prob['value']!r} - {prob['reason']}"
+                for key, value in prob["row_data"].items():
+                    yield f"    {key}: {value}"
+
+        self.diagnostics.detail("Diagnóstico de Datas", lines)
+
+    def _normalize_columns(self):
+        """Aplica as conversões de tipo e limpezas sobre self.df (rótulos reais)."""
+        # Converte as datas
+        self._convert_dates()
+
+        # Converte colunas string
+        string_columns = [
+            SSAColumns.NUMERO_SSA,
+            SSAColumns.SITUACAO,
+            SSAColumns.SEMANA_CADASTRO,
+            SSAColumns.GRAU_PRIORIDADE_EMISSAO,
+            SSAColumns.SETOR_EXECUTOR,
+            SSAColumns.DERIVADA,
+            SSAColumns.LOCALIZACAO,
+            SSAColumns.DESC_LOCALIZACAO,
+            SSAColumns.EQUIPAMENTO,
+            SSAColumns.DESC_SSA,
+            SSAColumns.SETOR_EMISSOR,
+            SSAColumns.SOLICITANTE,
+            SSAColumns.SERVICO_ORIGEM,
+            SSAColumns.EXECUCAO_SIMPLES,
+            SSAColumns.SISTEMA_ORIGEM,
+            SSAColumns.ANOMALIA,
+        ]
+
+        for col in string_columns:
+            try:
+                label = self._get_label(col)
+                if (label is not None) and (label in self.df.columns):
+                    self.df[label] = (
+                        self._as_text(self.df[label]).str.strip().replace("nan", "")
+                    )
+            except Exception as e:
+                logging.error(f"Erro ao converter coluna {col}: {str(e)}")
+
+        # Padroniza prioridades para maiúsculas
+        pri_label = self._get_label(SSAColumns.GRAU_PRIORIDADE_EMISSAO)
+        if (pri_label is not None) and (pri_label in self.df.columns):
+            self.df[pri_label] = self.df[pri_label].str.upper().str.strip()
+
+        # Converte colunas opcionais
+        optional_string_columns = [
+            SSAColumns.GRAU_PRIORIDADE_PLANEJAMENTO,
+            SSAColumns.RESPONSAVEL_PROGRAMACAO,
+            SSAColumns.SEMANA_PROGRAMADA,
+            SSAColumns.RESPONSAVEL_EXECUCAO,
+            SSAColumns.DESCRICAO_EXECUCAO,
+        ]
+
+        for col in optional_string_columns:
+            try:
+                label = self._get_label(col)
+                if (label is not None) and (label in self.df.columns):
+                    self.df[label] = (
+                        self._as_text(self.df[label]).replace("nan", None).replace("", None)
+                    )
+            except Exception as e:
+                logging.error(f"Erro ao converter coluna opcional {col}: {str(e)}")
 
-            # Verifica cobertura de colunas essenciais; se muito baixa, tenta modo posicional (planilha sem cabeçalho)
-            required = [
-                SSAColumns.NUMERO_SSA,
-                SSAColumns.SITUACAO,
-                SSAColumns.GRAU_PRIORIDADE_EMISSAO,
-                SSAColumns.EMITIDA_EM,
-                SSAColumns.SETOR_EXECUTOR,
-            ]
-            coverage = sum(1 for r in required if self._get_label(r) in getattr(self.df, 'columns', []))
-            if coverage <= 2:
-                logging.warning("Cobertura baixa de colunas esperadas; assumindo planilha sem cabeçalho e usando mapeamento posicional")
-                # Recarrega sem cabeçalho para não perder a primeira linha de dados
-                self.df = pd.read_excel(self.excel_path, header=None)
-                # Mapeia índices esperados para posições
-                self._col_labels = {}
-                for idx in SSAColumns.COLUMN_NAMES.keys():
-                    if idx < self.df.shape[1]:
-                        self._col_labels[idx] = self.df.columns[idx]
-                logging.info(f"Mapeamento posicional aplicado para {len(self._col_labels)} colunas")
-                # Tenta inferir rótulos-chave baseado nos dados
-                self._infer_columns_from_data()
-                # Normalizações mínimas para colunas-chave
-                for key_idx in [
-                    SSAColumns.NUMERO_SSA,
-                    SSAColumns.SITUACAO,
-                    SSAColumns.GRAU_PRIORIDADE_EMISSAO,
-                    SSAColumns.SETOR_EXECUTOR,
-                ]:
-                    lbl = self._get_label(key_idx)
-                    if lbl in self.df.columns:
-                        self.df[lbl] = self.df[lbl].astype(str).str.strip()
+        # Remove linhas com número da SSA vazio
+        num_label = self._get_label(SSAColumns.NUMERO_SSA)
+        if (num_label is not None) and (num_label in self.df.columns):
+            empty_ssa_count = (self.df[num_label].astype(str).str.strip() == "").sum()
+            if empty_ssa_count > 0:
+                logging.warning(
+                    f"Removendo {empty_ssa_count} linhas com número de SSA vazio"
+                )
+            self.df = self.df[self.df[num_label].astype(str).str.strip() != ""]
 
-            # Diagnóstico inicial de datas (se a coluna existir)
-            em_label = self._get_label(SSAColumns.EMITIDA_EM)
-            if (em_label is not None) and (em_label in self.df.columns):
-                # Resolve integer index robustly even if duplicate columns exist
-                try:
-                    idx_arr = self.df.columns.get_indexer_for([em_label])
-                    if len(idx_arr) == 1 and idx_arr[0] != -1:
-                        date_col_index = int(idx_arr[0])
-                    else:
-                        # Se colunas são inteiras, o próprio label pode ser o índice
-                        date_col_index = int(em_label) if isinstance(em_label, int) else None
-                except Exception:
-                    date_col_index = int(em_label) if isinstance(em_label, int) else None
-                date_diagnosis = None
-                if date_col_index is not None:
-                    date_diagnosis = diagnose_dates(self.df, date_col_index)
-                if date_diagnosis and date_diagnosis["error_count"] > 0:
-                    logging.info("=== Diagnóstico de Datas ===")
-                    logging.info(f"Total de linhas: {date_diagnosis['total_rows']}")
-                    logging.info(f"Problemas encontrados: {date_diagnosis['error_count']}")
-                    for prob in date_diagnosis["problematic_rows"]:
-                        logging.info(f"\nLinha {prob['index'] + 1}:")
-                        logging.info(f"  Valor encontrado: {prob['value']}")
-                        logging.info(f"  Motivo: {prob['reason']}")
-                        logging.info("  Dados da linha:")
-                        for key, value in prob["row_data"].items():
-                            logging.info(f"    {key}: {value}")
-
-            # Converte as datas
-            self._convert_dates()
-
-            # Converte colunas string
-            string_columns = [
-                SSAColumns.NUMERO_SSA,
-                SSAColumns.SITUACAO,
-                SSAColumns.SEMANA_CADASTRO,
-                SSAColumns.GRAU_PRIORIDADE_EMISSAO,
-                SSAColumns.SETOR_EXECUTOR,
-                SSAColumns.DERIVADA,
-                SSAColumns.LOCALIZACAO,
-                SSAColumns.DESC_LOCALIZACAO,
-                SSAColumns.EQUIPAMENTO,
-                SSAColumns.DESC_SSA,
-                SSAColumns.SETOR_EMISSOR,
-                SSAColumns.SOLICITANTE,
-                SSAColumns.SERVICO_ORIGEM,
-                SSAColumns.EXECUCAO_SIMPLES,
-                SSAColumns.SISTEMA_ORIGEM,
-                SSAColumns.ANOMALIA,
-            ]
+        # Trata semana cadastro e programada
+        try:
+            # Trata semana cadastro
+            cad_label = self._get_label(SSAColumns.SEMANA_CADASTRO)
+            if (cad_label is not None) and (cad_label in self.df.columns):
+                self.df[cad_label] = (
+                    pd.to_numeric(self.df[cad_label], errors="coerce")
+                    .fillna(0)
+                    .astype(int)
+                    .astype(str)
+                    .str.zfill(6)  # Garante 6 dígitos (AAASS)
+                )
 
-            for col in string_columns:
-                try:
-                    label = self._get_label(col)
-                    if (label is not None) and (label in self.df.columns):
-                        self.df[label] = (
-                            self.df[label].astype(str).str.strip().replace("nan", "")
-                        )
-                except Exception as e:
-                    logging.error(f"Erro ao converter coluna {col}: {str(e)}")
-
-            # Padroniza prioridades para maiúsculas
-            pri_label = self._get_label(SSAColumns.GRAU_PRIORIDADE_EMISSAO)
-            if (pri_label is not None) and (pri_label in self.df.columns):
-                self.df[pri_label] = self.df[pri_label].str.upper().str.strip()
-
-            # Converte colunas opcionais
-            optional_string_columns = [
-                SSAColumns.GRAU_PRIORIDADE_PLANEJAMENTO,
-                SSAColumns.RESPONSAVEL_PROGRAMACAO,
-                SSAColumns.SEMANA_PROGRAMADA,
-                SSAColumns.RESPONSAVEL_EXECUCAO,
-                SSAColumns.DESCRICAO_EXECUCAO,
-            ]
+            # Trata semana programada
+            prog_label = self._get_label(SSAColumns.SEMANA_PROGRAMADA)
+            if (prog_label is not None) and (prog_label in self.df.columns):
+                self.df[prog_label] = (
+                    pd.to_numeric(self.df[prog_label], errors="coerce")
+                    .fillna(0)
+                    .astype(int)
+                    .astype(str)
+                    .str.zfill(6)
+                )
+                self.df[prog_label] = self.df[prog_label].replace("000000", None)
+
+        except Exception as e:
+            logging.error(f"Erro ao formatar semanas: {str(e)}")
+
+    def load_data(self) -> pd.DataFrame:
+        """Carrega dados do Excel com as configurações corretas."""
+        try:
+            # Inicializa validador se ainda não existe
+            if not hasattr(self, "validator"):
+                self.validator = SSADataValidator()
 
-            for col in optional_string_columns:
+            logging.info(f"Iniciando carregamento do arquivo: {self.excel_path}")
+
+            # Snapshot canônico em cache: pula leitura, detecção e normalizações
+            self.loaded_from_cache = False
+            cache_key = None
+            if self.cache is not None:
                 try:
-                    label = self._get_label(col)
-                    if (label is not None) and (label in self.df.columns):
-                        self.df[label] = (
-                            self.df[label].astype(str).replace("nan", None).replace("", None)
-                        )
-                except Exception as e:
-                    logging.error(f"Erro ao converter coluna opcional {col}: {str(e)}")
-
-            # Remove linhas com número da SSA vazio
-            num_label = self._get_label(SSAColumns.NUMERO_SSA)
-            if (num_label is not None) and (num_label in self.df.columns):
-                empty_ssa_count = (self.df[num_label].astype(str).str.strip() == "").sum()
-                if empty_ssa_count > 0:
-                    logging.warning(
-                        f"Removendo {empty_ssa_count} linhas com número de SSA vazio"
+                    cache_key = self.cache.make_key(
+                        self.excel_path, self._cache_version()
                     )
-                self.df = self.df[self.df[num_label].astype(str).str.strip() != ""]
+                    cached = self.cache.get(cache_key)
+                except OSError as e:
+                    logging.warning(f"Cache de snapshots indisponível: {str(e)}")
+                    cached = None
+                if cached is not None:
+                    return self._load_from_snapshot(cached)
+
+            if self.streaming:
+                return self._load_streaming(cache_key)
+
+            # Leitura única da planilha; cabeçalho e fallback usam a grade em memória
+            grid = self._read_raw_grid()
+            cached = self._cached_header_layout(grid)
+            if cached is not None:
+                # Layout já conhecido: pula detecção de cabeçalho e mapeamento
+                header_row, self._col_labels = cached
+                self.df = self._frame_from_grid(grid, header_row)
+                logging.info(f"Arquivo carregado. Total de linhas: {len(self.df)}")
+            else:
+                header_row = self._detect_header_row(grid=grid)
+                self.df = self._frame_from_grid(grid, header_row)
 
-            # Trata semana cadastro e programada
-            try:
-                # Trata semana cadastro
-                cad_label = self._get_label(SSAColumns.SEMANA_CADASTRO)
-                if (cad_label is not None) and (cad_label in self.df.columns):
-                    self.df[cad_label] = (
-                        pd.to_numeric(self.df[cad_label], errors="coerce")
-                        .fillna(0)
-                        .astype(int)
-                        .astype(str)
-                        .str.zfill(6)  # Garante 6 dígitos (AAASS)
-                    )
+                logging.info(f"Arquivo carregado. Total de linhas: {len(self.df)}")
 
-                # Trata semana programada
-                prog_label = self._get_label(SSAColumns.SEMANA_PROGRAMADA)
-                if (prog_label is not None) and (prog_label in self.df.columns):
-                    self.df[prog_label] = (
-                        pd.to_numeric(self.df[prog_label], errors="coerce")
-                        .fillna(0)
-                        .astype(int)
-                        .astype(str)
-                        .str.zfill(6)
-                    )
-                    self.df[prog_label] = self.df[prog_label].replace("000000", None)
+                # Constrói mapeamento de colunas esperadas -> rótulos reais
+                self._build_column_mapping()
 
-            except Exception as e:
-                logging.error(f"Erro ao formatar semanas: {str(e)}")
+                # Verifica cobertura de colunas essenciais; se muito baixa, tenta modo posicional (planilha sem cabeçalho)
+                if self._needs_positional_mapping():
+                    # Usa a grade sem cabeçalho para não perder a primeira linha de dados
+                    self.df = self._frame_from_grid(grid, None)
+                    self._apply_positional_mapping()
+                    self._strip_key_columns()
+                else:
+                    self._remember_header_layout(header_row, grid[header_row])
 
-            # Converte para objetos SSAData
-            self._convert_to_objects()
+            # Diagnóstico inicial de datas (se a coluna existir)
+            self._log_date_diagnosis()
 
-            # NOVO: Validação com o SSADataValidator
-            validation_result = self.validator.validate_data_consistency(self.ssa_objects)
-            if not validation_result.is_valid:
-                logging.warning("=== Problemas de Consistência Encontrados ===")
-                for issue in validation_result.issues:
-                    logging.warning(issue)
+            # Datas, colunas string, prioridades, semanas e remoção de SSAs vazias
+            self._normalize_columns()
 
-            # NOVO: Verifica integridade dos dados
-            integrity_report = self.validator.verify_data_integrity(self.ssa_objects)
-            if integrity_report["warnings"]:
-                logging.warning("=== Avisos de Integridade ===")
-                for warning in integrity_report["warnings"]:
-                    logging.warning(warning)
+            # Converte para objetos SSAData
+            ssas_validas = self._convert_to_objects()
 
             # Log de estatísticas
             logging.info("=== Estatísticas do Carregamento ===")
             logging.info(f"Total de registros: {len(self.df)}")
-            logging.info(f"SSAs válidas: {len(self.ssa_objects)}")
-            if validation_result.statistics:
-                for key, value in validation_result.statistics.items():
-                    if isinstance(
-                        value, (int, float, str)
-                    ):  # Não loga dicionários aninhados
-                        logging.info(f"{key}: {value}")
-
-            # Verifica a qualidade dos dados após todas as conversões
+            logging.info(f"SSAs válidas: {ssas_validas}")
+
+            # Verifica a qualidade dos dados após todas as conversões (uma única
+            # avaliação das regras; consistência e integridade incluídas)
             self._validate_data_quality()
 
             # Reorganiza para formato canônico esperado pelo dashboard (posicional)
             # Observação: fazer isso após todas as validações e conversões internas,
             # pois a partir daqui a ordem das colunas será a canônica (por índice SSAColumns)
             self._to_canonical_dataframe()
+            # Visões passam a apontar para o DF canônico (o DF intermediário é liberado)
+            self.ssa_objects = SSATable(self.df)
+
+            if self.cache is not None and cache_key is not None:
+                self.cache.put(cache_key, self.df)
 
-            # Verifica a qualidade dos dados após todas as conversões
             return self.df
 
         except Exception as e:
@@ -545,138 +740,174 @@ class DataLoader:
             logging.error(traceback.format_exc())
             raise
 
+    def _load_streaming(self, cache_key: Optional[str] = None) -> pd.DataFrame:
+        """Carrega a planilha em blocos de ``chunk_rows`` linhas.
+
+        As linhas vêm de um iterador somente-leitura; cada bloco passa pelas
+        mesmas normalizações do modo padrão, já sai no formato canônico e é
+        anexado a buffers por coluna, de modo que o pico de memória depende do
+        tamanho do bloco e não do arquivo. Objetos SSAData (e as validações
+        sobre eles) ficam sob demanda via get_ssa_objects().
+        """
+        buffers: Dict[int, list] = {idx: [] for idx in SSAColumns.COLUMN_NAMES}
+        index_parts = []
+        offset = 0
+
+        with ExcelRowReader(self.excel_path) as reader:
+            rows = reader.rows()
+            head = list(islice(rows, 25))
+            if not head:
+                raise ValueError(f"Planilha vazia: {self.excel_path}")
+            width = max([reader.max_column] + [len(r) for r in head])
+            head = list(pad_rows(head, width))
+            rows = pad_rows(rows, width)
+
+            cached = self._cached_header_layout(head)
+            if cached is not None:
+                header_row = cached[0]
+            else:
+                header_row = self._detect_header_row(grid=head)
+            if header_row >= len(head):
+                raise ValueError(f"Linha de cabeçalho {header_row} inexistente")
+            header = head[header_row]
+            data_rows = chain(head[header_row + 1:], rows)
+
+            # O primeiro bloco decide entre cabeçalho e mapeamento posicional
+            first = list(islice(data_rows, self.chunk_rows))
+            self.df = self._frame_from_grid([header] + first, 0)
+            if cached is not None:
+                self._col_labels = cached[1]
+                positional = False
+            else:
+                self._build_column_mapping()
+                positional = self._needs_positional_mapping()
+                if not positional:
+                    self._remember_header_layout(header_row, header)
+            if positional:
+                chunks = iter_chunks(
+                    chain(head[: header_row + 1], first, data_rows), self.chunk_rows
+                )
+            else:
+                chunks = chain([first], iter_chunks(data_rows, self.chunk_rows))
+            mapped = False
+
+            for chunk in chunks:
+                if positional:
+                    self.df = self._frame_from_grid(chunk, None)
+                else:
+                    self.df = self._frame_from_grid([header] + chunk, 0)
+                self.df.index = pd.RangeIndex(offset, offset + len(self.df))
+                offset += len(self.df)
+
+                if positional:
+                    if not mapped:
+                        self._apply_positional_mapping()
+                        mapped = True
+                    self._strip_key_columns()
+
+                self._log_date_diagnosis()
+                self._normalize_columns()
+                part = self._canonical_frame()
+                index_parts.append(part.index.to_numpy())
+                for idx in buffers:
+                    buffers[idx].append(part[idx].to_numpy())
+
+        index = np.concatenate(index_parts)
+        self.df = pd.DataFrame(
+            {idx: np.concatenate(parts) for idx, parts in buffers.items()},
+            index=pd.RangeIndex(offset) if len(index) == offset else pd.Index(index),
+        )
+        if self.categorical:
+            to_categorical(self.df)
+        self._col_labels = {idx: idx for idx in SSAColumns.COLUMN_NAMES.keys()}
+        self.ssa_objects = None
+
+        logging.info("=== Estatísticas do Carregamento (streaming) ===")
+        logging.info(f"Linhas lidas: {offset}")
+        logging.info(f"Total de registros: {len(self.df)}")
+        self._validate_data_quality()
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.put(cache_key, self.df)
+
+        return self.df
+
     def _validate_data_quality(self):
-        """Valida a qualidade dos dados após as conversões."""
-        issues = []
+        """Valida a qualidade dos dados com o registro de regras (DEFAULT_RULES).
 
-        # Verifica datas válidas
+        As regras são avaliadas em conjunto sobre as colunas; a tabela de
+        problemas (rule, row, value) fica em ``self.validation_issues``.
+        """
         if self.df is None:
             logging.warning("DataFrame ainda não carregado para validação de qualidade.")
             return
-        em_label = self._get_label(SSAColumns.EMITIDA_EM)
-        valid_dates = (
-            self.df[em_label].notna().sum() if em_label and em_label in self.df.columns else 0
+        self.validation_issues, stats = DEFAULT_RULES.evaluate(
+            self.df, self._col_labels, return_stats=True
+        )
+        logging.info(
+            f"Regras de validação: {stats['rows']} linhas em {stats['seconds']:.3f}s "
+            f"({stats['rows_per_second']:,.0f} linhas/s)"
         )
-        total_rows = len(self.df)
-        if valid_dates < total_rows:
-            diff = total_rows - valid_dates
-            issues.append(
-                f"{diff} data{'s' if diff > 1 else ''} inválida{'s' if diff > 1 else ''}"
-            )
-
-        # Verifica campos obrigatórios vazios
-        for col in [SSAColumns.NUMERO_SSA, SSAColumns.SITUACAO, SSAColumns.GRAU_PRIORIDADE_EMISSAO]:
-            label = self._get_label(col)
-            if label and label in self.df.columns:
-                empty_count = self.df[label].isna().sum()
-                if empty_count > 0:
-                    issues.append(
-                        f"{empty_count} {SSAColumns.get_name(col)} vazio{'s' if empty_count > 1 else ''}"
-                    )
 
         # Registra todos os problemas em uma única mensagem
-        if issues:
-            logging.warning("Problemas encontrados nos dados: " + "; ".join(issues))
+        summary = DEFAULT_RULES.format_summary(self.validation_issues)
+        if summary:
+            logging.warning("Problemas encontrados nos dados: " + summary)
 
     def _convert_to_objects(self) -> int:
         """
-        Converte as linhas do DataFrame em objetos SSAData.
+        Monta a sequência de SSAs (SSATable) sobre as colunas de self.df.
+
+        Nenhum objeto é copiado: cada item é uma visão da linha e objetos
+        SSAData só são criados sob demanda. Linhas sem número, situação ou
+        prioridade são rejeitadas e registradas individualmente.
 
         Returns:
-            int: Número de objetos convertidos com sucesso
+            int: Número de SSAs válidas
 
         Raises:
             Exception: Se houver erro durante a conversão
         """
         try:
-            self.ssa_objects = []
-            unique_responsaveis = set()
-            unique_responsaveis_prog = set()
+            assert self.df is not None
+            table = SSATable(self.df, self._col_labels)
+            self.ssa_objects = table
+
+            resp_exec = table.field_values("responsavel_execucao")
+            resp_prog = table.field_values("responsavel_programacao")
+            unique_responsaveis = {r for r in resp_exec if r}
+            unique_responsaveis_prog = {r for r in resp_prog if r}
             conversions = {
-                "exec": {"total": 0, "errors": 0},
-                "prog": {"total": 0, "errors": 0},
+                "exec": {"total": sum(1 for r in resp_exec if r), "errors": 0},
+                "prog": {"total": sum(1 for r in resp_prog if r), "errors": 0},
             }
 
-            assert self.df is not None
-            for idx, row in self.df.iterrows():
-                try:
-                    # Helpers para recuperar valores por rótulo
-                    def gv(i):
-                        lbl = self._get_label(i)
-                        if lbl is None:
-                            return None
-                        # row is a Series: membership checks column label presence
-                        return row[lbl] if (lbl in row.index or lbl in row) else None
-
-                    # Processamento do responsável execução
-                    raw_resp = gv(SSAColumns.RESPONSAVEL_EXECUCAO)
-                    responsavel = str(raw_resp).strip() if raw_resp is not None else ""
-                    if responsavel.lower() in ["nan", "none", ""]:
-                        responsavel = None
-                    elif responsavel:
-                        responsavel = responsavel.upper()
-                        unique_responsaveis.add(responsavel)
-                        conversions["exec"]["total"] += 1
-
-                    # Processamento do responsável programação
-                    raw_prog = gv(SSAColumns.RESPONSAVEL_PROGRAMACAO)
-                    resp_prog = str(raw_prog).strip() if raw_prog is not None else ""
-                    if resp_prog.lower() in ["nan", "none", ""]:
-                        resp_prog = None
-                    elif resp_prog:
-                        resp_prog = resp_prog.upper()
-                        unique_responsaveis_prog.add(resp_prog)
-                        conversions["prog"]["total"] += 1
-
-                    # Criação do objeto SSA
-                    ssa = SSAData(
-                        numero=str(gv(SSAColumns.NUMERO_SSA) or "").strip(),
-                        situacao=str(gv(SSAColumns.SITUACAO) or "").strip(),
-                        derivada=(str(gv(SSAColumns.DERIVADA) or "").strip() or None),
-                        localizacao=str(gv(SSAColumns.LOCALIZACAO) or "").strip(),
-                        desc_localizacao=str(gv(SSAColumns.DESC_LOCALIZACAO) or "").strip(),
-                        equipamento=str(gv(SSAColumns.EQUIPAMENTO) or "").strip(),
-                        semana_cadastro=str(gv(SSAColumns.SEMANA_CADASTRO) or "").strip(),
-                        emitida_em=(gv(SSAColumns.EMITIDA_EM) if pd.notna(gv(SSAColumns.EMITIDA_EM)) else None),
-                        descricao=str(gv(SSAColumns.DESC_SSA) or "").strip(),
-                        setor_emissor=str(gv(SSAColumns.SETOR_EMISSOR) or "").strip(),
-                        setor_executor=str(gv(SSAColumns.SETOR_EXECUTOR) or "").strip(),
-                        solicitante=str(gv(SSAColumns.SOLICITANTE) or "").strip(),
-                        servico_origem=str(gv(SSAColumns.SERVICO_ORIGEM) or "").strip(),
-                        prioridade_emissao=str(gv(SSAColumns.GRAU_PRIORIDADE_EMISSAO) or "").strip().upper(),
-                        prioridade_planejamento=(str(gv(SSAColumns.GRAU_PRIORIDADE_PLANEJAMENTO) or "").strip() or None),
-                        execucao_simples=str(gv(SSAColumns.EXECUCAO_SIMPLES) or "").strip(),
-                        responsavel_programacao=resp_prog,  # Já processado acima
-                        semana_programada=(str(gv(SSAColumns.SEMANA_PROGRAMADA) or "").strip() or None),
-                        responsavel_execucao=responsavel,  # Já processado acima, não é mais tupla
-                        descricao_execucao=(str(gv(SSAColumns.DESCRICAO_EXECUCAO) or "").strip() or None),
-                        sistema_origem=str(gv(SSAColumns.SISTEMA_ORIGEM) or "").strip(),
-                        anomalia=(str(gv(SSAColumns.ANOMALIA) or "").strip() or None),
-                    )
-                    self.ssa_objects.append(ssa)
-
-                except Exception as e:
-                    logging.error(f"Erro ao converter linha {idx}: {str(e)}")
-                    if responsavel:
-                        conversions["exec"]["errors"] += 1
-                    if resp_prog:
-                        conversions["prog"]["errors"] += 1
-                    continue
+            # Linhas rejeitadas: mesmas mensagens de SSAData.__post_init__
+            for (lbl, message), exec_value, prog_value in zip(
+                table.invalid_rows,
+                table.invalid_values("responsavel_execucao"),
+                table.invalid_values("responsavel_programacao"),
+            ):
+                logging.error(f"Erro ao converter linha {lbl}: {message}")
+                if exec_value:
+                    conversions["exec"]["total"] += 1
+                    conversions["exec"]["errors"] += 1
+                if prog_value:
+                    conversions["prog"]["total"] += 1
+                    conversions["prog"]["errors"] += 1
 
             # Log de estatísticas e validações
             logging.info("=== Estatísticas de Conversão ===")
-            logging.info(f"Total de registros convertidos: {len(self.ssa_objects)}")
+            logging.info(f"Total de registros convertidos: {len(table)}")
             logging.info(f"Responsáveis execução únicos: {len(unique_responsaveis)}")
             logging.info(
                 f"Responsáveis programação únicos: {len(unique_responsaveis_prog)}"
             )
 
             # Validação detalhada de responsáveis
-            if self.ssa_objects:
-                self._log_responsaveis_detalhes(
-                    unique_responsaveis, unique_responsaveis_prog
-                )
-                self._log_primeiro_objeto()
+            if table:
+                self._log_responsaveis_detalhes(resp_exec, resp_prog)
+                self.diagnostics.detail("Primeiro Objeto Convertido", self._primeiro_objeto_lines)
 
             # Log de erros de conversão
             if conversions["exec"]["errors"] > 0 or conversions["prog"]["errors"] > 0:
@@ -688,59 +919,67 @@ class DataLoader:
                     f"Erros em responsável programação: {conversions['prog']['errors']}"
                 )
 
-            return len(self.ssa_objects)
+            return len(table)
 
         except Exception as e:
             logging.error(f"Erro durante conversão para objetos: {str(e)}")
             logging.error(traceback.format_exc())
             raise
 
-    def _log_responsaveis_detalhes(
-        self, unique_responsaveis: set, unique_responsaveis_prog: set
-    ):
-        """Log detalhado dos responsáveis."""
-        logging.info("\n=== Validação de Responsáveis Execução ===")
-        for resp in sorted(unique_responsaveis):
-            ssas_resp = [
-                ssa
-                for ssa in self.ssa_objects
-                if ssa.responsavel_execucao and ssa.responsavel_execucao.upper() == resp
-            ]
-            logging.info(f"\nResponsável Execução: '{resp}'")
-            logging.info(f"Total SSAs: {len(ssas_resp)}")
-            logging.info("Números das SSAs:")
-            for ssa in ssas_resp:
-                logging.info(f"  - SSA {ssa.numero}: {ssa.situacao}")
-
-        logging.info("\n=== Validação de Responsáveis Programação ===")
-        for resp in sorted(unique_responsaveis_prog):
-            ssas_resp = [
-                ssa
-                for ssa in self.ssa_objects
-                if ssa.responsavel_programacao
-                and ssa.responsavel_programacao.upper() == resp
-            ]
-            logging.info(f"\nResponsável Programação: '{resp}'")
-            logging.info(f"Total SSAs: {len(ssas_resp)}")
-            logging.info("Números das SSAs:")
-            for ssa in ssas_resp:
-                logging.info(f"  - SSA {ssa.numero}: {ssa.situacao}")
-
-    def _log_primeiro_objeto(self):
-        """Log do primeiro objeto para verificação."""
-        first_ssa = self.ssa_objects[0]
-        logging.info("\n=== Primeiro Objeto Convertido (Verificação) ===")
-        logging.info(f"Número: {first_ssa.numero}")
-        logging.info(f"Data de emissão: {first_ssa.emitida_em}")
-        logging.info(f"Prioridade: {first_ssa.prioridade_emissao}")
-        logging.info(f"Setor executor: {first_ssa.setor_executor}")
-        logging.info(f"Responsável execução: {first_ssa.responsavel_execucao}")
-        logging.info(f"Responsável programação: {first_ssa.responsavel_programacao}")
-
-    def get_ssa_objects(self) -> List[SSAData]:
-        """Retorna a lista de objetos SSAData."""
-        if not self.ssa_objects:
+    def _log_responsaveis_detalhes(self, resp_exec: list, resp_prog: list):
+        """Resumo (e, no nível full, detalhe por SSA) dos responsáveis.
+
+        As contagens vêm de um único value_counts por campo; a listagem das
+        SSAs de cada responsável é agrupada uma vez e só é montada no nível full.
+        """
+        if not (self.diagnostics.summary_enabled or self.diagnostics.full_enabled):
+            return
+        for title, values in (
+            ("Responsáveis Execução", resp_exec),
+            ("Responsáveis Programação", resp_prog),
+        ):
+            counts = pd.Series(values, dtype=object).dropna().str.upper().value_counts()
+            self.diagnostics.summary(
+                f"{title} ({len(counts)})", counts.head(10).to_dict()
+            )
+
+        if not self.diagnostics.full_enabled:
+            return
+        table = self.get_ssa_objects()
+        frame = pd.DataFrame(
+            {
+                "numero": table.field_values("numero"),
+                "situacao": table.field_values("situacao"),
+            }
+        )
+
+        def lines(values: list, label: str):
+            keys = pd.Series(values, dtype=object).str.upper()
+            for resp, grupo in frame.groupby(keys, sort=True):
+                yield f"Responsável {label}: '{resp}' - Total SSAs: {len(grupo)}"
+                for numero, situacao in zip(grupo["numero"], grupo["situacao"]):
+                    yield f"  - SSA {numero}: {situacao}"
+
+        self.diagnostics.detail("Validação de Responsáveis Execução", lines(resp_exec, "Execução"))
+        self.diagnostics.detail(
+            "Validação de Responsáveis Programação", lines(resp_prog, "Programação")
+        )
+
+    def _primeiro_objeto_lines(self):
+        """Campos do primeiro objeto convertido (verificação)."""
+        first_ssa = self.get_ssa_objects()[0]
+        yield f"Número: {first_ssa.numero}"
+        yield f"Data de emissão: {first_ssa.emitida_em}"
+        yield f"Prioridade: {first_ssa.prioridade_emissao}"
+        yield f"Setor executor: {first_ssa.setor_executor}"
+        yield f"Responsável execução: {first_ssa.responsavel_execucao}"
+        yield f"Responsável programação: {first_ssa.responsavel_programacao}"
+
+    def get_ssa_objects(self) -> SSATable:
+        """Retorna a sequência de SSAs (visões de linha; use materialize() para SSAData)."""
+        if self.ssa_objects is None:
             self._convert_to_objects()
+        assert self.ssa_objects is not None
         return self.ssa_objects
 
     def _build_column_mapping(self):
@@ -776,25 +1015,41 @@ class DataLoader:
 
             self._col_labels[idx] = label
 
-    def _get_label(self, idx: int) -> Optional[str]:
+    def _get_label(self, idx: int) -> Optional[object]:
         """Retorna o rótulo real da coluna para um índice SSAColumns, se existente."""
         return self._col_labels.get(idx)
 
+    def get_ssa_index(self) -> SSAIndex:
+        """Índices de consulta (setor, prioridade, data) sobre a sequência atual de SSAs.
+
+        Construídos na primeira consulta e reconstruídos apenas quando a
+        sequência de SSAs muda (nova carga).
+        """
+        table = self.get_ssa_objects()
+        if self._ssa_index is None or self._ssa_index.table is not table:
+            self._ssa_index = SSAIndex(table)
+        return self._ssa_index
+
     def filter_ssas(
         self,
         setor: Optional[str] = None,
         prioridade: Optional[str] = None,
         data_inicio: Optional[datetime] = None,
         data_fim: Optional[datetime] = None,
-    ) -> Tuple[List[SSAData], Optional[Dict]]:
+        diagnose: bool = True,
+    ) -> Tuple[Sequence[SSARecordLike], Optional[Dict]]:
         """
         Filtra SSAs com base nos critérios fornecidos.
 
+        As consultas usam os índices de get_ssa_index(): interseção das
+        posições por setor/prioridade e intervalo de datas via searchsorted.
+
         Args:
             setor: Setor para filtrar
             prioridade: Prioridade para filtrar
             data_inicio: Data inicial do período
             data_fim: Data final do período
+            diagnose: Se False, não calcula nem registra o diagnóstico de responsáveis
 
         Returns:
             Tupla contendo (lista de SSAs filtradas, dicionário de diagnóstico)
@@ -803,7 +1058,6 @@ class DataLoader:
             ValueError: Se os tipos de dados fornecidos forem inválidos
         """
         try:
-            filtered_ssas = self.get_ssa_objects()
             diagnostico = None
 
             # Validação de tipos
@@ -822,69 +1076,37 @@ class DataLoader:
                     f"Data fim deve ser datetime, recebido {type(data_fim)}"
                 )
 
-            # Filtro por setor com validação melhorada
-            if setor:
-                setor = setor.strip().upper()
-                filtered_ssas = [
-                    ssa
-                    for ssa in filtered_ssas
-                    if ssa.setor_executor
-                    and ssa.setor_executor.strip().upper() == setor
-                ]
-                logging.info(f"Filtro por setor '{setor}': {len(filtered_ssas)} SSAs")
-
-            # Filtro por prioridade
-            if prioridade:
-                prioridade = prioridade.strip().upper()
-                filtered_ssas = [
-                    ssa
-                    for ssa in filtered_ssas
-                    if ssa.prioridade_emissao
-                    and ssa.prioridade_emissao.strip().upper() == prioridade
-                ]
-                logging.info(
-                    f"Filtro por prioridade '{prioridade}': {len(filtered_ssas)} SSAs"
-                )
-
-            # Filtro por data inicial
-            if data_inicio:
-                filtered_ssas = [
-                    ssa
-                    for ssa in filtered_ssas
-                    if ssa.emitida_em and ssa.emitida_em >= data_inicio
-                ]
-                logging.info(
-                    f"Filtro por data início {data_inicio}: {len(filtered_ssas)} SSAs"
-                )
-
-            # Filtro por data final
-            if data_fim:
-                filtered_ssas = [
-                    ssa
-                    for ssa in filtered_ssas
-                    if ssa.emitida_em and ssa.emitida_em <= data_fim
-                ]
-                logging.info(
-                    f"Filtro por data fim {data_fim}: {len(filtered_ssas)} SSAs"
-                )
+            index = self.get_ssa_index()
+            positions = index.query(setor, prioridade, data_inicio, data_fim)
+            filtered_ssas = index.records(positions)
+            logging.info(
+                f"Filtro (setor={setor!r}, prioridade={prioridade!r}, "
+                f"início={data_inicio}, fim={data_fim}): {len(filtered_ssas)} SSAs"
+            )
 
             # Diagnóstico após todos os filtros
-            if filtered_ssas:
+            if diagnose and filtered_ssas:
                 diagnostico = self.validator.diagnose_responsavel_data(
-                    filtered_ssas, setor or ""
+                    filtered_ssas, setor.strip().upper() if setor else ""
+                )
+                por_exec = diagnostico["por_responsavel_exec"]
+                por_prog = diagnostico.get("por_responsavel_prog") or {}
+                self.diagnostics.summary(
+                    "Diagnóstico após filtros",
+                    {
+                        "SSAs filtradas": len(filtered_ssas),
+                        "responsáveis execução": len(por_exec),
+                        "responsáveis programação": len(por_prog),
+                    },
                 )
-                logging.info("=== Diagnóstico após Filtros ===")
-                logging.info(f"Total de SSAs filtradas: {len(filtered_ssas)}")
-                logging.info("Responsáveis na Execução:")
-                for resp, dados in diagnostico["por_responsavel_exec"].items():
-                    logging.info(f"  - {resp}: {dados['total']} SSAs")
-                    logging.info(f"    Números: {', '.join(dados['ssas'])}")
-
-                if diagnostico.get("por_responsavel_prog"):
-                    logging.info("Responsáveis na Programação:")
-                    for resp, dados in diagnostico["por_responsavel_prog"].items():
-                        logging.info(f"  - {resp}: {dados['total']} SSAs")
-                        logging.info(f"    Números: {', '.join(dados['ssas'])}")
+
+                def lines():
+                    for label, grupos in (("Execução", por_exec), ("Programação", por_prog)):
+                        for resp, dados in grupos.items():
+                            yield f"{label} - {resp}: {dados['total']} SSAs"
+                            yield f"    Números: {', '.join(dados['ssas'])}"
+
+                self.diagnostics.detail("Diagnóstico após Filtros", lines)
 
             return filtered_ssas, diagnostico
 
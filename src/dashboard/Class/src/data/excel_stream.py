@@ -0,0 +1,102 @@
+# src/data/excel_stream.py
+import logging
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+from openpyxl import load_workbook  # type: ignore[import-untyped]
+from openpyxl.workbook.workbook import Workbook  # type: ignore[import-untyped]
+from openpyxl.worksheet.worksheet import Worksheet  # type: ignore[import-untyped]
+
+
+def _convert_cell(value):
+    """Converte o valor da célula como o leitor openpyxl do pandas faz.
+
+    Vazio vira "" e números inteiros armazenados como float viram int, para
+    que o ``TextParser`` infira exatamente os mesmos tipos do ``read_excel``.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+class ExcelRowReader:
+    """Iterador somente-leitura das linhas da primeira aba de um Excel.
+
+    Usa o modo ``read_only`` do openpyxl, que lê a planilha sob demanda sem
+    montar a aba inteira em memória. As linhas saem com as células
+    convertidas, sem vazios à direita e sem as linhas vazias finais, no mesmo
+    formato da grade que o ``read_excel`` entrega ao parser.
+    """
+
+    def __init__(self, excel_path: str):
+        self.excel_path = excel_path
+        self._wb: Optional[Workbook] = None
+        # No modo read_only a aba é um ReadOnlyWorksheet (mesma interface de leitura)
+        self._ws: Optional[Worksheet] = None
+        self.max_column = 0
+
+    def __enter__(self) -> "ExcelRowReader":
+        wb = load_workbook(
+            self.excel_path, read_only=True, data_only=True, keep_links=False
+        )
+        ws = wb.worksheets[0]
+        self._wb, self._ws = wb, ws
+        try:
+            self.max_column = int(ws.max_column or 0)
+        except (TypeError, ValueError):
+            self.max_column = 0
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
+            self._ws = None
+
+    def rows(self) -> Iterator[list]:
+        """Gera as linhas convertidas; linhas vazias só saem se houver dados depois."""
+        if self._ws is None:
+            raise ValueError("ExcelRowReader precisa ser aberto com 'with'")
+        pending_blank = 0
+        for raw in self._ws.iter_rows(values_only=True):
+            row = [_convert_cell(v) for v in raw]
+            while row and row[-1] == "":
+                row.pop()
+            if not row:
+                pending_blank += 1
+                continue
+            for _ in range(pending_blank):
+                yield []
+            pending_blank = 0
+            yield row
+
+
+def pad_rows(rows: Iterable[list], width: int) -> Iterator[list]:
+    """Ajusta cada linha para ``width`` colunas (grade retangular)."""
+    warned = False
+    for row in rows:
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        elif len(row) > width:
+            if not warned and any(v != "" for v in row[width:]):
+                logging.warning(
+                    f"Linha com mais de {width} colunas; células excedentes ignoradas"
+                )
+                warned = True
+            row = row[:width]
+        yield row
+
+
+def iter_chunks(rows: Iterable[list], size: int) -> Iterator[List[list]]:
+    """Agrupa as linhas em blocos de até ``size`` linhas."""
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
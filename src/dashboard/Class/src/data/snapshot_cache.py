@@ -0,0 +1,177 @@
+# src/data/snapshot_cache.py
+import hashlib
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+try:  # Parquet (colunar) depende do pyarrow; sem ele usamos pickle do pandas
+    import pyarrow  # type: ignore[import-untyped]  # noqa: F401
+
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
+
+# Versão do layout dos arquivos de snapshot (não confundir com LOADER_VERSION)
+CACHE_FORMAT_VERSION = "1"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MiB
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Calcula o hash SHA-256 do conteúdo de um arquivo, lendo em blocos."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SnapshotCache:
+    """Cache em disco do DataFrame canônico, endereçado pelo conteúdo do arquivo.
+
+    Cada entrada é identificada por ``<sha256 do Excel>-<versão do loader>``, de
+    modo que arquivos renomeados ou copiados reaproveitam o mesmo snapshot e
+    qualquer mudança no pipeline de normalização invalida as entradas antigas.
+    O diretório é limitado por ``max_bytes``; ao exceder, os snapshots menos
+    recentemente usados (mtime) são removidos.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_bytes)
+        self.extension = ".parquet" if HAS_PARQUET else ".pkl"
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    # -----------------------
+    # Chaves e caminhos
+    # -----------------------
+    def make_key(self, excel_path: str, loader_version: str) -> str:
+        """Gera a chave do snapshot a partir do conteúdo do arquivo e da versão."""
+        return f"{file_sha256(excel_path)}-v{CACHE_FORMAT_VERSION}.{loader_version}"
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.extension}"
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        if not self.cache_dir.is_dir():
+            return []
+        entries = []
+        for p in self.cache_dir.iterdir():
+            if p.suffix in (".parquet", ".pkl") and p.is_file():
+                try:
+                    entries.append((p, p.stat()))
+                except OSError:
+                    continue
+        return entries
+
+    # -----------------------
+    # Leitura / escrita
+    # -----------------------
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Retorna o DataFrame do snapshot ou None em caso de ausência/erro."""
+        path = self._path_for(key)
+        if not path.exists():
+            self.stats["misses"] += 1
+            return None
+        try:
+            if self.extension == ".parquet":
+                df = pd.read_parquet(path)
+                # Parquet exige rótulos string; restaura os índices inteiros de SSAColumns
+                df.columns = [int(c) for c in df.columns]
+            else:
+                df = pd.read_pickle(path)
+            # Marca como recentemente usado para a política LRU
+            os.utime(path, None)
+        except Exception as e:
+            logging.warning(f"Snapshot corrompido ou ilegível ({path.name}): {str(e)}")
+            self.stats["errors"] += 1
+            self.stats["misses"] += 1
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+        self.stats["hits"] += 1
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """Grava o snapshot de forma atômica e aplica a política de tamanho."""
+        path = self._path_for(key)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if self.extension == ".parquet":
+                out = df.copy(deep=False)
+                out.columns = [str(c) for c in out.columns]
+                out.to_parquet(tmp)
+            else:
+                df.to_pickle(tmp)
+            os.replace(tmp, path)
+        except Exception as e:
+            logging.warning(f"Falha ao gravar snapshot {path.name}: {str(e)}")
+            self.stats["errors"] += 1
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+
+        self.stats["writes"] += 1
+        self._evict(keep=path)
+        return True
+
+    def _evict(self, keep: Optional[Path] = None) -> None:
+        """Remove snapshots mais antigos (LRU por mtime) até caber em max_bytes."""
+        entries = sorted(self._entries(), key=lambda e: e[1].st_mtime)
+        total = sum(st.st_size for _, st in entries)
+        for p, st in entries:
+            if total <= self.max_bytes:
+                break
+            if keep is not None and p == keep:
+                continue
+            try:
+                p.unlink()
+                total -= st.st_size
+                self.stats["evictions"] += 1
+            except OSError:
+                continue
+
+    def clear(self) -> None:
+        """Remove todos os snapshots do diretório."""
+        for p, _ in self._entries():
+            try:
+                p.unlink()
+            except OSError:
+                pass
+
+    # -----------------------
+    # Estatísticas
+    # -----------------------
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return (self.stats["hits"] / lookups) if lookups else 0.0
+
+    def get_stats(self) -> Dict:
+        """Retorna contadores de uso e ocupação atual do diretório."""
+        entries = self._entries()
+        return {
+            **self.stats,
+            "hit_ratio": self.hit_ratio,
+            "entries": len(entries),
+            "size_bytes": sum(st.st_size for _, st in entries),
+            "max_bytes": self.max_bytes,
+            "format": self.extension.lstrip("."),
+        }
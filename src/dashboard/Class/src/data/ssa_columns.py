@@ -57,6 +57,32 @@ class SSAColumns:
         ANOMALIA: "Anomalia",
     }
 
+    # Campo correspondente em SSAData (mesma ordem dos índices)
+    FIELD_NAMES = {
+        NUMERO_SSA: "numero",
+        SITUACAO: "situacao",
+        DERIVADA: "derivada",
+        LOCALIZACAO: "localizacao",
+        DESC_LOCALIZACAO: "desc_localizacao",
+        EQUIPAMENTO: "equipamento",
+        SEMANA_CADASTRO: "semana_cadastro",
+        EMITIDA_EM: "emitida_em",
+        DESC_SSA: "descricao",
+        SETOR_EMISSOR: "setor_emissor",
+        SETOR_EXECUTOR: "setor_executor",
+        SOLICITANTE: "solicitante",
+        SERVICO_ORIGEM: "servico_origem",
+        GRAU_PRIORIDADE_EMISSAO: "prioridade_emissao",
+        GRAU_PRIORIDADE_PLANEJAMENTO: "prioridade_planejamento",
+        EXECUCAO_SIMPLES: "execucao_simples",
+        RESPONSAVEL_PROGRAMACAO: "responsavel_programacao",
+        SEMANA_PROGRAMADA: "semana_programada",
+        RESPONSAVEL_EXECUCAO: "responsavel_execucao",
+        DESCRICAO_EXECUCAO: "descricao_execucao",
+        SISTEMA_ORIGEM: "sistema_origem",
+        ANOMALIA: "anomalia",
+    }
+
     # Descrições detalhadas dos estados
     STATE_DESCRIPTIONS = {
         "APL": "APL - AGUARDANDO PLANEJAMENTO",
@@ -1,13 +1,40 @@
 # src/data/ssa_data.py
+import sys
 from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Protocol
 import pandas as pd
 
 
-@dataclass
+# Campos de baixa cardinalidade: internados para compartilhar uma única cópia
+INTERNED_FIELDS = frozenset(
+    {
+        "situacao",
+        "localizacao",
+        "semana_cadastro",
+        "setor_emissor",
+        "setor_executor",
+        "solicitante",
+        "servico_origem",
+        "prioridade_emissao",
+        "prioridade_planejamento",
+        "execucao_simples",
+        "responsavel_programacao",
+        "semana_programada",
+        "responsavel_execucao",
+        "sistema_origem",
+    }
+)
+
+
+@dataclass(slots=True)
 class SSAData:
-    """Estrutura de dados para uma SSA."""
+    """Estrutura de dados para uma SSA.
+
+    Usa __slots__ (sem __dict__ por instância) e interna os campos de baixa
+    cardinalidade (INTERNED_FIELDS), para que milhares de SSAs compartilhem
+    as mesmas strings de setor, situação, prioridade e responsáveis.
+    """
 
     numero: str
     situacao: str
@@ -34,19 +61,17 @@ class SSAData:
 
     def __post_init__(self):
         """Validação dos dados após inicialização."""
-        # Garante que strings não sejam None
-        for field in fields(self):
-            if field.type == str and not field.default:
-                value = getattr(self, field.name)
-                if value is None:
-                    setattr(self, field.name, "")
-
-        # Normaliza strings
-        for field in fields(self):
-            if field.type == str:
-                value = getattr(self, field.name)
-                if isinstance(value, str):
-                    setattr(self, field.name, value.strip())
+        # Normaliza strings (e interna as de baixa cardinalidade)
+        for name in _STR_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                value = value.strip()
+                setattr(self, name, sys.intern(value) if name in INTERNED_FIELDS else value)
+
+        for name in _OPTIONAL_INTERNED_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                setattr(self, name, sys.intern(value))
 
         # Validações específicas
         if not self.numero:
@@ -58,6 +83,20 @@ class SSAData:
         if not self.prioridade_emissao:
             raise ValueError("Prioridade de emissão não pode ser vazia")
 
+    @classmethod
+    def from_trusted(cls, *values) -> "SSAData":
+        """Cria o objeto a partir de valores já normalizados, sem revalidar.
+
+        Recebe os 22 campos na ordem de declaração (a mesma de SSAColumns).
+        Destinado à carga em lote: o chamador garante strings sem espaços nas
+        bordas, None apenas nos campos opcionais, campos obrigatórios
+        preenchidos e INTERNED_FIELDS já internados (ver SSATable).
+        """
+        obj = cls.__new__(cls)
+        for setter, value in zip(_FIELD_SETTERS, values):
+            setter(obj, value)
+        return obj
+
     def to_dict(self) -> Dict:
         """Converte o objeto para dicionário."""
         return {
@@ -139,3 +178,54 @@ class SSAData:
     def has_responsible(self) -> bool:
         """Verifica se a SSA tem responsável designado."""
         return bool(self.responsavel_programacao or self.responsavel_execucao)
+
+
+class SSARecordLike(Protocol):
+    """Atributos comuns a SSAData e SSARecord (somente leitura).
+
+    Permite que validadores e filtros aceitem tanto objetos materializados
+    quanto visões de linha do SSATable.
+    """
+
+    @property
+    def numero(self) -> str:
+        ...
+
+    @property
+    def situacao(self) -> str:
+        ...
+
+    @property
+    def emitida_em(self) -> Optional[datetime]:
+        ...
+
+    @property
+    def setor_emissor(self) -> str:
+        ...
+
+    @property
+    def setor_executor(self) -> str:
+        ...
+
+    @property
+    def prioridade_emissao(self) -> str:
+        ...
+
+    @property
+    def responsavel_programacao(self) -> Optional[str]:
+        ...
+
+    @property
+    def responsavel_execucao(self) -> Optional[str]:
+        ...
+
+
+# Ordem dos campos usada por SSAData.from_trusted
+_FIELD_ORDER = tuple(f.name for f in fields(SSAData))
+# Descritores dos slots, na mesma ordem (atribuição direta, sem __setattr__)
+_FIELD_SETTERS = tuple(getattr(SSAData, name).__set__ for name in _FIELD_ORDER)
+# Campos declarados como str e campos opcionais (Optional[str]) internados
+_STR_FIELDS = tuple(f.name for f in fields(SSAData) if f.type == str)
+_OPTIONAL_INTERNED_FIELDS = tuple(
+    name for name in _FIELD_ORDER if name in INTERNED_FIELDS and name not in _STR_FIELDS
+)
@@ -0,0 +1,100 @@
+# src/data/ssa_index.py
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .ssa_table import SSARecord, SSATable
+
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+def _inverted_index(keys: List[Optional[str]]) -> Dict[str, np.ndarray]:
+    """Chave normalizada (strip + upper) -> posições (ordenadas) no SSATable.
+
+    Valores vazios não entram no índice: o filtro antigo também os descartava.
+    """
+    codes, uniques = pd.factorize(
+        np.array([(k or "").strip().upper() for k in keys], dtype=object)
+    )
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+    return {
+        key: positions
+        for key, positions in zip(uniques, np.split(order.astype(np.intp), bounds))
+        if key
+    }
+
+
+def _ns(value: datetime) -> int:
+    return pd.Timestamp(value).as_unit("ns").value
+
+
+class SSAIndex:
+    """Índices de consulta sobre um SSATable, construídos uma vez por dataset.
+
+    - ``by_setor`` / ``by_prioridade``: setor executor / prioridade de emissão
+      normalizados -> posições no SSATable;
+    - índice de datas: posições ordenadas por ``emitida_em`` (sem NaT), para
+      intervalos via ``searchsorted``.
+
+    ``query`` combina os critérios por interseção e devolve as posições em
+    ordem crescente (mesma ordem da varredura linear).
+    """
+
+    def __init__(self, table: SSATable):
+        self.table = table
+        self.by_setor = _inverted_index(table.field_values("setor_executor"))
+        self.by_prioridade = _inverted_index(table.field_values("prioridade_emissao"))
+
+        dates = pd.DatetimeIndex(table.field_values("emitida_em")).as_unit("ns")
+        values = dates.asi8
+        valid = np.flatnonzero(~dates.isna())
+        order = valid[np.argsort(values[valid], kind="stable")]
+        self._date_positions = order.astype(np.intp)
+        self._date_values = values[order]
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def date_range(
+        self, data_inicio: Optional[datetime] = None, data_fim: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Posições (ordenadas) com data_inicio <= emitida_em <= data_fim."""
+        lo, hi = 0, len(self._date_values)
+        if data_inicio is not None:
+            lo = int(np.searchsorted(self._date_values, _ns(data_inicio), "left"))
+        if data_fim is not None:
+            hi = int(np.searchsorted(self._date_values, _ns(data_fim), "right"))
+        return np.sort(self._date_positions[lo:hi]) if hi > lo else _EMPTY
+
+    def query(
+        self,
+        setor: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """Posições das SSAs que atendem a todos os critérios informados."""
+        parts = []
+        if setor:
+            parts.append(self.by_setor.get(setor.strip().upper(), _EMPTY))
+        if prioridade:
+            parts.append(self.by_prioridade.get(prioridade.strip().upper(), _EMPTY))
+        if data_inicio or data_fim:
+            parts.append(self.date_range(data_inicio, data_fim))
+        if not parts:
+            return np.arange(len(self.table), dtype=np.intp)
+        # Interseção começando pelo conjunto menor
+        parts.sort(key=len)
+        result = parts[0]
+        for part in parts[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, part, assume_unique=True)
+        return result
+
+    def records(self, positions: np.ndarray) -> List[SSARecord]:
+        return self.table.take(positions)
@@ -0,0 +1,251 @@
+# src/data/ssa_table.py
+import sys
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .ssa_columns import SSAColumns
+from .ssa_data import INTERNED_FIELDS, SSAData
+
+
+# -----------------------
+# Normalização por campo (mesmas regras da conversão para SSAData)
+# -----------------------
+def _clean_text(value) -> str:
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        if pd.isna(value):
+            return ""
+        value = str(value)
+    return value.strip()
+
+
+def _clean_optional(value) -> Optional[str]:
+    return _clean_text(value) or None
+
+
+def _clean_upper(value) -> str:
+    return _clean_text(value).upper()
+
+
+def _clean_responsavel(value) -> Optional[str]:
+    text = _clean_text(value)
+    if text.lower() in ("nan", "none", ""):
+        return None
+    return text.upper()
+
+
+def _clean_date(value):
+    if value is None or pd.isna(value):
+        return None
+    return pd.Timestamp(value)
+
+
+_OPTIONAL_FIELDS = {
+    "derivada",
+    "prioridade_planejamento",
+    "semana_programada",
+    "descricao_execucao",
+    "anomalia",
+}
+
+_FIELD_CLEANERS = {}
+for _name in SSAColumns.FIELD_NAMES.values():
+    if _name == "emitida_em":
+        _FIELD_CLEANERS[_name] = _clean_date
+    elif _name in ("responsavel_execucao", "responsavel_programacao"):
+        _FIELD_CLEANERS[_name] = _clean_responsavel
+    elif _name == "prioridade_emissao":
+        _FIELD_CLEANERS[_name] = _clean_upper
+    elif _name in _OPTIONAL_FIELDS:
+        _FIELD_CLEANERS[_name] = _clean_optional
+    else:
+        _FIELD_CLEANERS[_name] = _clean_text
+
+# Campos obrigatórios, na ordem das validações de SSAData.__post_init__
+_REQUIRED_FIELDS = [
+    ("numero", "Número da SSA não pode ser vazio"),
+    ("situacao", "Situação não pode ser vazia"),
+    ("prioridade_emissao", "Prioridade de emissão não pode ser vazia"),
+]
+
+
+class _CodedColumn:
+    """Coluna categórica vista como array, sem expandir os valores.
+
+    Guarda as categorias (com None ao final, para o código -1) e os códigos
+    inteiros do ``pd.Categorical``; indexar devolve os valores originais.
+    """
+
+    __slots__ = ("categories", "codes")
+
+    def __init__(self, values: pd.Categorical):
+        self.categories = np.concatenate(
+            [np.asarray(values.categories, dtype=object), np.array([None], dtype=object)]
+        )
+        self.codes = values.codes
+
+    def __getitem__(self, key):
+        return self.categories[self.codes[key]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+def _column_array(series: pd.Series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return _CodedColumn(series.array)
+    return series.to_numpy()
+
+
+class SSARecord:
+    """Visão leve de uma linha do SSATable.
+
+    Expõe os mesmos atributos e helpers de SSAData, lendo os valores das
+    colunas do DataFrame no momento do acesso (sem cópia dos dados).
+    """
+
+    __slots__ = ("_table", "_pos")
+
+    def __init__(self, table: "SSATable", pos: int):
+        self._table = table
+        self._pos = pos
+
+    def __getattr__(self, name):
+        column = self._table._columns.get(name)
+        if column is None:
+            raise AttributeError(name)
+        return _FIELD_CLEANERS[name](column[self._pos])
+
+    def __repr__(self) -> str:
+        return f"SSARecord({self.numero!r})"
+
+    def to_ssa_data(self) -> SSAData:
+        """Materializa a linha como um objeto SSAData independente."""
+        return SSAData.from_trusted(
+            *(getattr(self, name) for name in SSAColumns.FIELD_NAMES.values())
+        )
+
+    # Helpers de SSAData reaproveitados (dependem apenas dos atributos)
+    to_dict = SSAData.to_dict
+    to_display_dict = SSAData.to_display_dict
+    get_age_in_days = SSAData.get_age_in_days
+    is_critical = SSAData.is_critical
+    is_programmed = SSAData.is_programmed
+    has_responsible = SSAData.has_responsible
+    __str__ = SSAData.__str__
+
+
+class SSATable(Sequence[SSARecord]):
+    """Sequência preguiçosa de SSAs apoiada nas colunas do DataFrame.
+
+    Guarda apenas referências aos arrays das colunas e as posições das linhas
+    válidas (número, situação e prioridade preenchidos). A indexação e a
+    iteração devolvem SSARecord; objetos SSAData só são criados sob demanda
+    via ``materialize()`` ou ``SSARecord.to_ssa_data()``.
+    """
+
+    def __init__(self, df: pd.DataFrame, col_labels: Optional[Dict[int, object]] = None):
+        if col_labels is None:
+            col_labels = {idx: idx for idx in SSAColumns.COLUMN_NAMES}
+        self.row_labels = df.index
+        self._n_rows = len(df)
+        self._columns: Dict[str, Any] = {}
+        for idx, name in SSAColumns.FIELD_NAMES.items():
+            lbl = col_labels.get(idx)
+            if lbl is not None and lbl in df.columns:
+                self._columns[name] = _column_array(df[lbl])
+            else:
+                self._columns[name] = np.full(self._n_rows, None, dtype=object)
+
+        valid = np.ones(self._n_rows, dtype=bool)
+        messages: Dict[int, str] = {}
+        for name, message in reversed(_REQUIRED_FIELDS):
+            empty = ~self._non_empty(self._columns[name])
+            for pos in np.flatnonzero(empty):
+                messages[int(pos)] = message
+            valid &= ~empty
+        # (rótulo da linha no DataFrame, motivo) das linhas rejeitadas
+        self._invalid_positions = np.array(sorted(messages), dtype=np.intp)
+        self.invalid_rows: List[Tuple[object, str]] = [
+            (self.row_labels[pos], messages[pos]) for pos in self._invalid_positions
+        ]
+        self._positions = np.flatnonzero(valid)
+
+    @staticmethod
+    def _non_empty(column) -> np.ndarray:
+        if isinstance(column, _CodedColumn):
+            codes, uniques = column.codes, column.categories[:-1]
+        else:
+            codes, uniques = pd.factorize(column, use_na_sentinel=True)
+        filled = np.array([bool(_clean_text(u)) for u in uniques] + [False], dtype=bool)
+        return filled[codes]
+
+    # -----------------------
+    # Protocolo de sequência
+    # -----------------------
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [SSARecord(self, int(pos)) for pos in self._positions[item]]
+        return SSARecord(self, int(self._positions[item]))
+
+    def take(self, positions) -> List[SSARecord]:
+        """Registros nas posições indicadas (posições da sequência, não do DataFrame)."""
+        rows = self._positions[np.asarray(positions, dtype=np.intp)]
+        return [SSARecord(self, int(pos)) for pos in rows]
+
+    def __iter__(self) -> Iterator[SSARecord]:
+        for pos in self._positions:
+            yield SSARecord(self, int(pos))
+
+    def __repr__(self) -> str:
+        return f"SSATable({len(self)} SSAs)"
+
+    # -----------------------
+    # Acesso em bloco
+    # -----------------------
+    def field_values(self, name: str) -> list:
+        """Valores normalizados de um campo para as linhas válidas.
+
+        Cada valor distinto é normalizado uma única vez (e internado, nos
+        campos de baixa cardinalidade), então linhas iguais compartilham o
+        mesmo objeto str.
+        """
+        cleaner = _FIELD_CLEANERS[name]
+        if isinstance(self._columns[name], _CodedColumn):
+            # Categóricas: normaliza só as categorias e expande pelos códigos
+            coded = self._columns[name]
+            codes, uniques = coded.codes[self._positions], coded.categories[:-1]
+        else:
+            column = self._columns[name][self._positions]
+            if column.dtype.kind == "M":
+                values = pd.Series(column).astype(object)
+                return values.where(values.notna(), None).tolist()
+            if name == "emitida_em":
+                return [cleaner(v) for v in column]
+            codes, uniques = pd.factorize(column, use_na_sentinel=True)
+        cleaned = [cleaner(u) for u in uniques] + [cleaner(None)]
+        if name in INTERNED_FIELDS:
+            cleaned = [sys.intern(v) if isinstance(v, str) else v for v in cleaned]
+        return np.array(cleaned, dtype=object)[codes].tolist()
+
+    def raw_values(self, name: str) -> np.ndarray:
+        """Valores crus (sem normalização) de um campo para as linhas válidas."""
+        return np.asarray(self._columns[name][self._positions])
+
+    def invalid_values(self, name: str) -> list:
+        """Valores normalizados de um campo para as linhas rejeitadas (invalid_rows)."""
+        cleaner = _FIELD_CLEANERS[name]
+        return [cleaner(v) for v in self._columns[name][self._invalid_positions]]
+
+    def materialize(self) -> List[SSAData]:
+        """Cria a lista completa de objetos SSAData (carga em lote)."""
+        values = [self.field_values(name) for name in SSAColumns.FIELD_NAMES.values()]
+        from_trusted = SSAData.from_trusted
+        return [from_trusted(*row) for row in zip(*values)]
@@ -4,16 +4,37 @@ Módulo de utilitários do Dashboard SSA.
 """
 
 from .log_manager import LogManager
-from .date_utils import diagnose_dates, validate_date_value, fix_date_format
+from .date_utils import (
+    diagnose_dates,
+    validate_date_value,
+    fix_date_format,
+    parse_sam_datetimes,
+)
 from .file_manager import FileManager
+from .diagnostics import Diagnostics, DIAGNOSTICS_LEVELS
 from .data_validator import SSADataValidator, ValidationResult
+from .validation_rules import (
+    DEFAULT_RULES,
+    RuleContext,
+    RuleRegistry,
+    ValidationRule,
+    evaluate_rules,
+)
 
 __all__ = [
     "LogManager",
     "diagnose_dates",
     "validate_date_value",
     "fix_date_format",
+    "parse_sam_datetimes",
     "FileManager",
+    "Diagnostics",
+    "DIAGNOSTICS_LEVELS",
     "SSADataValidator",
     "ValidationResult",
+    "DEFAULT_RULES",
+    "RuleContext",
+    "RuleRegistry",
+    "ValidationRule",
+    "evaluate_rules",
 ]
@@ -1,9 +1,21 @@
 # src/utils/data_validator.py
 import logging
-from typing import List, Dict, Optional
+from collections import Counter
+from typing import List, Dict, Sequence, Tuple
 from datetime import datetime
 from dataclasses import dataclass
-from ..data.ssa_data import SSAData
+
+import numpy as np
+import pandas as pd
+
+from ..data.ssa_columns import SSAColumns
+from ..data.ssa_data import SSARecordLike
+from ..data.ssa_table import SSATable
+from .validation_rules import DEFAULT_RULES
+
+# Campo de SSAData -> índice de SSAColumns (colunas do frame avaliado pelas regras)
+_FIELD_INDEX = {name: idx for idx, name in SSAColumns.FIELD_NAMES.items()}
+_REQUIRED_RULES = ("numero_vazio", "situacao_vazia", "prioridade_vazia")
 
 
 @dataclass
@@ -16,57 +28,102 @@ class ValidationResult:
     timestamp: datetime
 
 
+def _field_columns(ssa_objects, names: List[str]) -> Dict[str, list]:
+    """Extrai os campos ``names`` como colunas (listas alinhadas), em uma passada.
+
+    Aceita o DataFrame canônico, um SSATable (colunas lidas direto do
+    DataFrame, normalizadas por valor distinto) ou qualquer sequência de
+    objetos com os atributos de SSAData.
+    """
+    if isinstance(ssa_objects, pd.DataFrame):
+        ssa_objects = SSATable(ssa_objects)
+    if isinstance(ssa_objects, SSATable):
+        return {name: ssa_objects.field_values(name) for name in names}
+    objs = list(ssa_objects)
+    return {name: [getattr(o, name) for o in objs] for name in names}
+
+
+def _emitted_dates(ssa_objects) -> pd.DatetimeIndex:
+    """Coluna 'emitida_em' como DatetimeIndex (NaT onde vazio)."""
+    if isinstance(ssa_objects, pd.DataFrame):
+        ssa_objects = SSATable(ssa_objects)
+    if isinstance(ssa_objects, SSATable):
+        raw = ssa_objects.raw_values("emitida_em")
+    else:
+        raw = [o.emitida_em for o in ssa_objects]
+    return pd.DatetimeIndex(pd.to_datetime(pd.Series(raw, dtype=object), errors="coerce"))
+
+
+def _rule_issues(
+    ssa_objects, names: List[str], rules: Sequence[str]
+) -> Tuple[Dict[str, list], pd.DataFrame]:
+    """Avalia as regras ``rules`` do DEFAULT_RULES sobre os campos ``names``.
+
+    Devolve as colunas extraídas (como em _field_columns) e a tabela de
+    problemas (rule, row, value), em que ``row`` é a posição da SSA na
+    sequência. As verificações ficam declaradas só no registro de regras.
+    """
+    if isinstance(ssa_objects, pd.DataFrame):
+        ssa_objects = SSATable(ssa_objects)
+    cols = _field_columns(ssa_objects, [n for n in names if n != "emitida_em"])
+    frame = pd.DataFrame({_FIELD_INDEX[name]: values for name, values in cols.items()})
+    if "emitida_em" in names:
+        frame[SSAColumns.EMITIDA_EM] = _emitted_dates(ssa_objects)
+    return cols, DEFAULT_RULES.evaluate(frame, names=rules)
+
+
+def _rule_rows(issues: pd.DataFrame, *rules: str) -> np.ndarray:
+    """Posições (ordenadas, sem repetição) das SSAs apontadas por ``rules``."""
+    return np.unique(issues.loc[issues["rule"].isin(rules), "row"].to_numpy(dtype=np.intp))
+
+
 class SSADataValidator:
-    """Classe para validação de dados das SSAs."""
+    """Classe para validação de dados das SSAs.
+
+    As verificações de consistência e integridade trabalham sobre colunas
+    (contagens com dicionários/hash e máscaras), em tempo linear no número
+    de SSAs; as regras em si (obrigatórios, datas futuras, responsável sem
+    setor, duplicatas) vêm do registro DEFAULT_RULES.
+    """
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    def validate_data_consistency(self, ssa_objects: List[SSAData]) -> ValidationResult:
+    def validate_data_consistency(self, ssa_objects: Sequence[SSARecordLike]) -> ValidationResult:
         """Valida consistência dos dados."""
         issues = []
         stats = {}
 
         try:
-            # 1. Contagem por responsável
-            resp_counts = {}
-            for ssa in ssa_objects:
-                if ssa.responsavel_execucao:
-                    resp_counts[ssa.responsavel_execucao] = (
-                        resp_counts.get(ssa.responsavel_execucao, 0) + 1
-                    )
+            cols, rule_issues = _rule_issues(
+                ssa_objects,
+                ["numero", "responsavel_execucao", "setor_executor"],
+                ["responsavel_sem_setor"],
+            )
+            responsaveis = cols["responsavel_execucao"]
+            setores = cols["setor_executor"]
 
+            # 1. Contagem por responsável (ordem de primeira ocorrência)
+            resp_counts = dict(Counter(r for r in responsaveis if r))
             stats["resp_counts"] = resp_counts
 
-            # 2. Verificação de inconsistências
-            for resp, count in resp_counts.items():
-                ssas_list = [s for s in ssa_objects if s.responsavel_execucao == resp]
-                if len(ssas_list) != count:
-                    issues.append(
-                        f"Inconsistência na contagem para {resp}: contagem={count}, real={len(ssas_list)}"
-                    )
+            # 2. As contagens vêm de uma única passada; não há recontagem por
+            # responsável (era O(R·N) e sempre coincidia com o item 1)
 
-            # 3. Verificação de estados
-            for ssa in ssa_objects:
-                # Verifica combinações inválidas de estados
-                if ssa.responsavel_execucao and not ssa.setor_executor:
-                    issues.append(
-                        f"SSA {ssa.numero} tem responsável mas não tem setor executor"
-                    )
+            # 3. Verificação de estados: responsável sem setor executor (regra)
+            for pos in _rule_rows(rule_issues, "responsavel_sem_setor"):
+                issues.append(
+                    f"SSA {cols['numero'][pos]} tem responsável mas não tem setor executor"
+                )
 
             # 4. Estatísticas gerais
+            com_responsavel = sum(resp_counts.values())
             stats.update(
                 {
-                    "total_ssas": len(ssa_objects),
-                    "ssas_com_responsavel": len(
-                        [s for s in ssa_objects if s.responsavel_execucao]
-                    ),
-                    "ssas_sem_responsavel": len(
-                        [s for s in ssa_objects if not s.responsavel_execucao]
-                    ),
-                    "setores_executores": len(
-                        set(s.setor_executor for s in ssa_objects if s.setor_executor)
-                    ),
+                    "total_ssas": len(responsaveis),
+                    "ssas_com_responsavel": com_responsavel,
+                    "ssas_sem_responsavel": len(responsaveis) - com_responsavel,
+                    "setores_executores": len(set(s for s in setores if s)),
                     "timestamp": datetime.now(),
                 }
             )
@@ -82,7 +139,7 @@ class SSADataValidator:
             timestamp=datetime.now(),
         )
 
-    def verify_data_integrity(self, ssa_objects: List[SSAData]) -> Dict:
+    def verify_data_integrity(self, ssa_objects: Sequence[SSARecordLike]) -> Dict:
         """Verifica integridade periódica dos dados."""
         integrity_report = {
             "timestamp": datetime.now(),
@@ -92,11 +149,17 @@ class SSADataValidator:
         }
 
         try:
+            cols, rule_issues = _rule_issues(
+                ssa_objects,
+                ["numero", "situacao", "prioridade_emissao", "emitida_em"],
+                [*_REQUIRED_RULES, "data_futura", "numero_duplicado"],
+            )
+            numeros_ssa = cols["numero"]
+            integrity_report["total_records"] = len(numeros_ssa)
+
             # 1. Verificação de dados obrigatórios
             missing_required = [
-                ssa.numero
-                for ssa in ssa_objects
-                if not all([ssa.numero, ssa.situacao, ssa.prioridade_emissao])
+                numeros_ssa[i] for i in _rule_rows(rule_issues, *_REQUIRED_RULES)
             ]
             if missing_required:
                 integrity_report["warnings"].append(
@@ -104,19 +167,18 @@ class SSADataValidator:
                 )
 
             # 2. Verificação de datas
-            future_dates = [
-                ssa.numero
-                for ssa in ssa_objects
-                if ssa.emitida_em and ssa.emitida_em > datetime.now()
-            ]
+            future_dates = [numeros_ssa[i] for i in _rule_rows(rule_issues, "data_futura")]
             if future_dates:
                 integrity_report["warnings"].append(
                     f"SSAs com datas futuras: {', '.join(future_dates)}"
                 )
 
-            # 3. Verificação de duplicatas
-            numeros_ssa = [ssa.numero for ssa in ssa_objects]
-            duplicates = set([num for num in numeros_ssa if numeros_ssa.count(num) > 1])
+            # 3. Verificação de duplicatas (ordem de primeira ocorrência)
+            duplicates = list(
+                dict.fromkeys(
+                    numeros_ssa[i] for i in _rule_rows(rule_issues, "numero_duplicado")
+                )
+            )
             if duplicates:
                 integrity_report["warnings"].append(
                     f"SSAs duplicadas encontradas: {', '.join(duplicates)}"
@@ -137,19 +199,19 @@ class SSADataValidator:
         return integrity_report
 
     def check_graph_data_consistency(
-        self, ssa_objects: List[SSAData], graph_data: Dict
+        self, ssa_objects: Sequence[SSARecordLike], graph_data: Dict
     ) -> List[str]:
         """Verifica consistência entre dados do gráfico e objetos SSA."""
         inconsistencies = []
 
         try:
-            # Contagem real por responsável
-            real_counts = {}
-            for ssa in ssa_objects:
-                if ssa.responsavel_execucao:
-                    real_counts[ssa.responsavel_execucao] = (
-                        real_counts.get(ssa.responsavel_execucao, 0) + 1
-                    )
+            # SSAs por responsável, agrupadas em uma passada
+            cols = _field_columns(ssa_objects, ["numero", "responsavel_execucao"])
+            por_resp: Dict[str, List[str]] = {}
+            for numero, resp in zip(cols["numero"], cols["responsavel_execucao"]):
+                if resp:
+                    por_resp.setdefault(resp, []).append(numero)
+            real_counts = {resp: len(nums) for resp, nums in por_resp.items()}
 
             # Compara com dados do gráfico
             for resp, count in graph_data.items():
@@ -159,10 +221,7 @@ class SSADataValidator:
                         f"Inconsistência para {resp}: "
                         f"gráfico={count}, dados={real_count}"
                     )
-                    self.logger.warning(
-                        f"SSAs para {resp}: "
-                        f"{[s.numero for s in ssa_objects if s.responsavel_execucao == resp]}"
-                    )
+                    self.logger.warning(f"SSAs para {resp}: {por_resp.get(resp, [])}")
 
         except Exception as e:
             self.logger.error(
@@ -173,7 +232,7 @@ class SSADataValidator:
         return inconsistencies
 
     def diagnose_responsavel_data(
-        self, ssa_objects: List[SSAData], area_emissora: str = None
+        self, ssa_objects: Sequence[SSARecordLike], area_emissora: str = None
     ) -> Dict:
         """Diagnóstico detalhado dos dados de responsáveis."""
         try:
@@ -229,7 +288,7 @@ class SSADataValidator:
 
     # Atualize a classe SSADataValidator para incluir verificações específicas:
     def validate_responsavel_consistency(
-        self, ssa_objects: List[SSAData], area_emissora: str = None
+        self, ssa_objects: Sequence[SSARecordLike], area_emissora: str = None
     ) -> List[str]:
         """Valida consistência dos dados de responsáveis."""
         issues = []
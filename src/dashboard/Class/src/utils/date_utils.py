@@ -1,120 +1,255 @@
-from typing import Dict
+import warnings
+from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
 
-def diagnose_dates(df: pd.DataFrame, date_column_index: int) -> Dict:
+# Formato fixo de 'Emitida Em' nas exportações do SAM
+SAM_DATETIME_FORMAT = "%d/%m/%Y %H:%M:%S"
+
+# Posições dos separadores e dígitos em "dd/mm/aaaa HH:MM:SS"
+_FIXED_LEN = 19
+_SEPARATORS = {2: "/", 5: "/", 10: " ", 13: ":", 16: ":"}
+_DIGITS = [i for i in range(_FIXED_LEN) if i not in _SEPARATORS]
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    """Dias desde 1970-01-01 para datas do calendário gregoriano (aritmética inteira)."""
+    y = year - (month <= 2)
+    era = np.floor_divide(y, 400)
+    yoe = y - era * 400
+    mp = (month + 9) % 12
+    doy = (153 * mp + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _fixed_layout_datetimes(text: np.ndarray):
+    """Converte strings "dd/mm/aaaa HH:MM:SS" (array ``<U19``) para datetime64[ns].
+
+    Os caracteres são lidos como inteiros (UCS-4) e fatiados por posição, sem
+    passar por objetos Python. Devolve ``(datas, ok)``: ``ok`` marca as linhas
+    no layout fixo com data válida; as demais ficam NaT e devem ir para o
+    parser geral.
+    """
+    n = len(text)
+    chars = text.view(np.uint32).reshape(n, _FIXED_LEN)
+    ok = np.ones(n, dtype=bool)
+    for pos, sep in _SEPARATORS.items():
+        ok &= chars[:, pos] == ord(sep)
+    digits = {}
+    for pos in _DIGITS:
+        d = chars[:, pos] - np.uint32(ord("0"))  # não-dígitos dão valores >= 10 (wraparound)
+        ok &= d < 10
+        digits[pos] = d.astype(np.int64)
+
+    def number(start, width):
+        value = digits[start]
+        for pos in range(start + 1, start + width):
+            value = value * 10 + digits[pos]
+        return value
+
+    day, month, year = number(0, 2), number(3, 2), number(6, 4)
+    hour, minute, second = number(11, 2), number(14, 2), number(17, 2)
+    ok &= (month >= 1) & (month <= 12) & (hour < 24) & (minute < 60) & (second < 60)
+    # Limites de datetime64[ns]; fora disso o parser geral decide (NaT)
+    ok &= (year >= 1678) & (year <= 2261)
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    max_day = _DAYS_IN_MONTH[np.clip(month, 1, 12) - 1] + ((month == 2) & leap)
+    ok &= (day >= 1) & (day <= max_day)
+
+    seconds = _days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second
+    out = (seconds * 1_000_000_000).view("datetime64[ns]")
+    out[~ok] = np.datetime64("NaT", "ns")
+    return out, ok
+
+
+def parse_sam_datetimes(values: pd.Series) -> pd.Series:
+    """Converte a coluna 'Emitida Em' para datetime64[ns] com caminho rápido.
+
+    Strings no layout fixo "dd/mm/aaaa HH:MM:SS" são montadas direto com
+    NumPy; apenas o restante (outros formatos, Timestamps, números, vazios)
+    passa pelo ``pd.to_datetime(format=SAM_DATETIME_FORMAT, errors="coerce")``.
+    O resultado é o mesmo do parser geral aplicado à coluna inteira.
+    """
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[ns]")
+    raw = values.to_numpy(dtype=object)
+    out = np.full(len(raw), np.datetime64("NaT", "ns"), dtype="datetime64[ns]")
+    is_fixed = np.fromiter(
+        (type(v) is str and len(v) == _FIXED_LEN for v in raw), dtype=bool, count=len(raw)
+    )
+    fixed_pos = np.flatnonzero(is_fixed)
+    if len(fixed_pos):
+        parsed, ok = _fixed_layout_datetimes(raw[fixed_pos].astype(f"<U{_FIXED_LEN}"))
+        out[fixed_pos[ok]] = parsed[ok]
+        is_fixed[fixed_pos[~ok]] = False
+    rest = np.flatnonzero(~is_fixed)
+    if len(rest):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UserWarning)
+            general = pd.to_datetime(
+                pd.Series(raw[rest], dtype=object),
+                format=SAM_DATETIME_FORMAT,
+                errors="coerce",
+                dayfirst=True,
+            )
+        out[rest] = general.astype("datetime64[ns]").to_numpy()
+    return pd.Series(out, index=values.index, name=values.name)
+
+
+# Limite padrão de linhas detalhadas (com row_data) no relatório de diagnose_dates
+DEFAULT_MAX_PROBLEM_ROWS = 100
+
+_NULL_REASON = "Valor nulo ou NaN"
+_RANGE_REASON = "Data fora do intervalo esperado"
+
+
+def _string_failures(values: np.ndarray) -> Dict[str, str]:
+    """Mapeia cada string distinta não conversível para a mensagem de erro.
+
+    Converte os valores distintos de uma vez; só os que resultam em NaT são
+    reavaliados individualmente (vazios e "NaT" são válidos para o parser).
+    """
+    uniques = pd.unique(values)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UserWarning)
+        try:
+            parsed = pd.to_datetime(uniques, dayfirst=True, errors="coerce", format="mixed")
+            suspects = uniques[np.asarray(pd.isna(parsed))]
+        except Exception:
+            suspects = uniques
+        failures = {}
+        for value in suspects:
+            try:
+                pd.to_datetime(value, dayfirst=True)
+            except Exception as e:
+                failures[value] = f"Erro na conversão: {str(e)}"
+    return failures
+
+
+def diagnose_dates(
+    df: pd.DataFrame,
+    date_column_index: int,
+    max_rows: Optional[int] = DEFAULT_MAX_PROBLEM_ROWS,
+) -> Dict:
     """
     Diagnostica problemas com datas em um DataFrame.
 
+    A classificação é feita por máscaras sobre a coluna inteira; strings são
+    convertidas uma vez por valor distinto.
+
     Args:
         df: DataFrame com os dados
         date_column_index: índice da coluna de data
+        max_rows: máximo de linhas detalhadas em 'problematic_rows' (None = todas);
+            as contagens sempre consideram todas as linhas
 
     Returns:
         Dict com informações de diagnóstico
         {
             'total_rows': número total de linhas,
-            'problematic_rows': lista de dicionários com detalhes dos problemas,
+            'problematic_rows': lista de dicionários com detalhes dos problemas
+                (as primeiras max_rows, na ordem das linhas),
             'error_count': número total de erros,
-            'error_details': detalhamento dos tipos de erro
+            'error_details': detalhamento dos tipos de erro,
+            'error_rate': percentual de linhas com erro,
+            'truncated': True se problematic_rows foi limitada por max_rows
         }
     """
-    problematic_rows = []
+    column = df.iloc[:, date_column_index]
+    n = len(column)
+    values = column.to_numpy(dtype=object)
+    reasons = np.full(n, None, dtype=object)
 
-    for idx, row in df.iterrows():
-        date_value = row.iloc[date_column_index]
-        try:
-            # Verifica valores nulos
-            if pd.isna(date_value):
-                problematic_rows.append(
-                    {
-                        "index": idx,
-                        "value": date_value,
-                        "reason": "Valor nulo ou NaN",
-                        "row_data": row.to_dict(),
-                    }
-                )
-            # Verifica strings que deveriam ser datas
-            elif isinstance(date_value, str):
-                try:
-                    # Use explicit dayfirst parsing and avoid duplicate parsing that triggers warnings
-                    pd.to_datetime(date_value, dayfirst=True)
-                except Exception as e:
-                    problematic_rows.append(
-                        {
-                            "index": idx,
-                            "value": date_value,
-                            "reason": f"Erro na conversão: {str(e)}",
-                            "row_data": row.to_dict(),
-                        }
-                    )
-            # Verifica se é um tipo válido de data
-            elif not isinstance(date_value, (pd.Timestamp, datetime)):
-                problematic_rows.append(
-                    {
-                        "index": idx,
-                        "value": date_value,
-                        "reason": f"Tipo inválido: {type(date_value)}",
-                        "row_data": row.to_dict(),
-                    }
-                )
-            # Verifica se a data está em um intervalo razoável (últimos 30 anos até 1 ano futuro)
-            elif isinstance(date_value, (pd.Timestamp, datetime)):
-                now = pd.Timestamp.now()
-                min_date = now - pd.DateOffset(years=30)
-                max_date = now + pd.DateOffset(years=1)
-
-                if not (min_date <= date_value <= max_date):
-                    problematic_rows.append(
-                        {
-                            "index": idx,
-                            "value": date_value,
-                            "reason": "Data fora do intervalo esperado",
-                            "row_data": row.to_dict(),
-                        }
-                    )
-
-        except Exception as e:
-            problematic_rows.append(
-                {
-                    "index": idx,
-                    "value": date_value,
-                    "reason": f"Erro não esperado: {str(e)}",
-                    "row_data": row.to_dict(),
-                }
-            )
+    now = pd.Timestamp.now()
+    min_date = now - pd.DateOffset(years=30)
+    max_date = now + pd.DateOffset(years=1)
 
-    # Agrupa os erros por tipo
-    error_types = {
-        "null_count": sum(
-            1 for row in problematic_rows if "nulo" in row["reason"].lower()
-        ),
-        "format_errors": sum(
-            1 for row in problematic_rows if "conversão" in row["reason"].lower()
-        ),
-        "type_errors": sum(
-            1 for row in problematic_rows if "tipo" in row["reason"].lower()
-        ),
-        "range_errors": sum(
-            1 for row in problematic_rows if "intervalo" in row["reason"].lower()
-        ),
-        "other_errors": sum(
-            1
-            for row in problematic_rows
-            if not any(
-                x in row["reason"].lower()
-                for x in ["nulo", "conversão", "tipo", "intervalo"]
-            )
-        ),
-    }
+    null_mask = np.asarray(pd.isna(values), dtype=bool)
+    reasons[null_mask] = _NULL_REASON
+    range_errors = other_errors = 0
+
+    if column.dtype.kind == "M":
+        dates = column.to_numpy()
+        out_of_range = ~null_mask & ((dates < min_date.to_datetime64()) | (dates > max_date.to_datetime64()))
+        reasons[out_of_range] = _RANGE_REASON
+        range_errors = int(out_of_range.sum())
+        format_errors = type_errors = 0
+    else:
+        kinds = np.fromiter(
+            (
+                0 if isinstance(v, str) else 1 if isinstance(v, (pd.Timestamp, datetime)) else 2
+                for v in values
+            ),
+            dtype=np.int8,
+            count=n,
+        )
+        # Strings: erro de conversão
+        str_pos = np.flatnonzero((kinds == 0) & ~null_mask)
+        failures = _string_failures(values[str_pos]) if len(str_pos) else {}
+        format_errors = 0
+        if failures:
+            failed = [failures.get(v) for v in values[str_pos]]
+            hit = np.array([r is not None for r in failed], dtype=bool)
+            reasons[str_pos[hit]] = np.array(failed, dtype=object)[hit]
+            format_errors = int(hit.sum())
+
+        # Outros tipos (números, date, ...): tipo inválido
+        type_pos = np.flatnonzero((kinds == 2) & ~null_mask)
+        for pos in type_pos:
+            reasons[pos] = f"Tipo inválido: {type(values[pos])}"
+        type_errors = len(type_pos)
+
+        # Datas: fora do intervalo esperado (últimos 30 anos até 1 ano futuro)
+        date_pos = np.flatnonzero((kinds == 1) & ~null_mask)
+        if len(date_pos):
+            try:
+                dates = pd.DatetimeIndex(list(values[date_pos]))
+                if dates.tz is not None:
+                    raise TypeError("datas com fuso horário")
+                bad = np.asarray((dates < min_date) | (dates > max_date))
+                reasons[date_pos[bad]] = _RANGE_REASON
+                range_errors = int(bad.sum())
+            except Exception:
+                # Tipos mistos/fuso horário: compara valor a valor, como antes
+                for pos in date_pos:
+                    try:
+                        if not (min_date <= values[pos] <= max_date):
+                            reasons[pos] = _RANGE_REASON
+                            range_errors += 1
+                    except Exception as e:
+                        reasons[pos] = f"Erro não esperado: {str(e)}"
+                        other_errors += 1
+
+    problem_pos = np.flatnonzero(reasons != None)  # noqa: E711
+    error_count = len(problem_pos)
+    shown = problem_pos if max_rows is None else problem_pos[:max_rows]
+    problematic_rows = [
+        {
+            "index": df.index[pos],
+            "value": column.iloc[pos],
+            "reason": reasons[pos],
+            "row_data": df.iloc[pos].to_dict(),
+        }
+        for pos in shown
+    ]
 
     return {
         "total_rows": len(df),
         "problematic_rows": problematic_rows,
-        "error_count": len(problematic_rows),
-        "error_details": error_types,
-        "error_rate": (len(problematic_rows) / len(df) * 100) if len(df) > 0 else 0,
+        "error_count": error_count,
+        "error_details": {
+            "null_count": int(null_mask.sum()),
+            "format_errors": format_errors,
+            "type_errors": type_errors,
+            "range_errors": range_errors,
+            "other_errors": other_errors,
+        },
+        "error_rate": (error_count / len(df) * 100) if len(df) > 0 else 0,
+        "truncated": len(shown) < error_count,
     }
 
 
@@ -0,0 +1,92 @@
+# src/utils/diagnostics.py
+import logging
+import os
+from datetime import datetime
+from typing import Callable, Iterable, Mapping, Optional, Union
+
+
+# Níveis de diagnóstico, do mais barato ao mais detalhado
+OFF = "off"
+SUMMARY = "summary"
+FULL = "full"
+DIAGNOSTICS_LEVELS = (OFF, SUMMARY, FULL)
+
+# Nível padrão (pode ser trocado sem alterar código: SSA_DIAGNOSTICS=full)
+DEFAULT_LEVEL = os.environ.get("SSA_DIAGNOSTICS", SUMMARY)
+DEFAULT_PATH = os.path.join("logs", "ssa_diagnostics.log")
+
+
+class Diagnostics:
+    """Diagnósticos estruturados do carregamento, com nível configurável.
+
+    - ``off``: nada além de avisos e erros;
+    - ``summary``: apenas contadores agregados, uma linha de log por seção;
+    - ``full``: além do resumo, o detalhe por linha/SSA vai para um arquivo
+      próprio (``path``), aberto só na primeira escrita.
+
+    O detalhe é passado como iterável ou função geradora, então nos níveis
+    ``off``/``summary`` ele nem chega a ser montado.
+    """
+
+    def __init__(self, level: Optional[str] = None, path: Optional[str] = None):
+        level = (level or DEFAULT_LEVEL).strip().lower()
+        if level not in DIAGNOSTICS_LEVELS:
+            raise ValueError(
+                f"Nível de diagnóstico inválido: {level!r} (use {', '.join(DIAGNOSTICS_LEVELS)})"
+            )
+        self.level = level
+        self.path = path or DEFAULT_PATH
+        self._file = None
+        self.lines_written = 0
+
+    @property
+    def summary_enabled(self) -> bool:
+        return self.level != OFF and logging.getLogger().isEnabledFor(logging.INFO)
+
+    @property
+    def full_enabled(self) -> bool:
+        return self.level == FULL
+
+    def summary(self, title: str, counts: Mapping[str, object]) -> None:
+        """Registra um resumo (contadores) em uma única linha INFO."""
+        if not self.summary_enabled:
+            return
+        body = ", ".join(f"{k}: {v}" for k, v in counts.items())
+        logging.info(f"{title}: {body}" if body else title)
+
+    def detail(
+        self, title: str, lines: Union[Iterable[str], Callable[[], Iterable[str]]]
+    ) -> None:
+        """Grava o detalhe no arquivo de diagnóstico (apenas no nível full)."""
+        if not self.full_enabled:
+            return
+        if callable(lines):
+            lines = lines()
+        fh = self._open()
+        if fh is None:
+            return
+        fh.write(f"\n=== {title} ===\n")
+        for line in lines:
+            fh.write(f"{line}\n")
+            self.lines_written += 1
+        fh.flush()
+
+    def _open(self):
+        if self._file is None:
+            try:
+                folder = os.path.dirname(self.path)
+                if folder:
+                    os.makedirs(folder, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+                self._file.write(f"\n##### {datetime.now().isoformat(timespec='seconds')} #####\n")
+                logging.info(f"Diagnóstico detalhado em: {self.path}")
+            except OSError as e:
+                logging.warning(f"Falha ao abrir arquivo de diagnóstico {self.path}: {str(e)}")
+                self.level = SUMMARY
+                return None
+        return self._file
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,304 @@
+# src/utils/validation_rules.py
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Tuple, overload
+
+import numpy as np
+import pandas as pd
+
+from ..data.ssa_columns import SSAColumns
+
+
+# Colunas da tabela de problemas produzida por RuleRegistry.evaluate
+ISSUE_COLUMNS = ["rule", "row", "value"]
+
+_WEEK_RE = re.compile(r"^\d{4}(0[1-9]|[1-4]\d|5[0-3])$")
+_EMPTY_RESPONSAVEL = ("", "NAN", "NONE")
+
+
+class RuleContext:
+    """Colunas do DataFrame preparadas uma única vez e compartilhadas pelas regras.
+
+    ``text`` normaliza (str + strip) cada valor distinto, não cada linha;
+    ``col_labels`` traduz índices de SSAColumns para os rótulos reais (por
+    padrão, o DataFrame canônico, rotulado pelos próprios índices).
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        col_labels: Optional[Dict[int, object]] = None,
+        now: Optional[datetime] = None,
+    ):
+        self.df = df
+        self.n = len(df)
+        self.col_labels = col_labels or {idx: idx for idx in SSAColumns.COLUMN_NAMES}
+        self.now = now or datetime.now()
+        self._text: Dict[int, np.ndarray] = {}
+
+    def has(self, idx: int) -> bool:
+        label = self.col_labels.get(idx)
+        return label is not None and label in self.df.columns
+
+    def raw(self, idx: int) -> np.ndarray:
+        """Valores originais da coluna (para o campo 'value' dos problemas)."""
+        if not self.has(idx):
+            return np.full(self.n, None, dtype=object)
+        return self.df[self.col_labels[idx]].to_numpy(dtype=object)
+
+    def text(self, idx: int) -> np.ndarray:
+        """Coluna como texto sem espaços nas pontas (vazio para nulos)."""
+        if idx not in self._text:
+            if not self.has(idx):
+                self._text[idx] = np.full(self.n, "", dtype=object)
+            else:
+                codes, uniques = pd.factorize(self.df[self.col_labels[idx]], use_na_sentinel=True)
+                cleaned = [str(u).strip() for u in uniques] + [""]
+                self._text[idx] = np.array(cleaned, dtype=object)[codes]
+        return self._text[idx]
+
+    def per_value(self, idx: int, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Aplica ``predicate`` a cada texto distinto da coluna e expande para as linhas."""
+        codes, uniques = pd.factorize(self.text(idx))
+        return np.array([predicate(u) for u in uniques] + [False], dtype=bool)[codes]
+
+    def dates(self, idx: int) -> pd.DatetimeIndex:
+        if not self.has(idx):
+            return pd.DatetimeIndex([pd.NaT] * self.n)
+        values = self.df[self.col_labels[idx]]
+        if values.dtype.kind != "M":
+            values = pd.to_datetime(values, errors="coerce", dayfirst=True)
+        return pd.DatetimeIndex(values)
+
+
+@dataclass(frozen=True)
+class ValidationRule:
+    """Regra declarativa: máscara booleana (True = linha com problema)."""
+
+    name: str
+    column: int
+    description: str
+    mask: Callable[[RuleContext], np.ndarray]
+    severity: str = "warning"
+
+
+class RuleRegistry:
+    """Registro de regras avaliadas em conjunto sobre as colunas do DataFrame.
+
+    Cada regra produz uma máscara; as máscaras são empilhadas numa matriz
+    (regras x linhas) e os problemas saem de um único ``np.nonzero``, já
+    ordenados por regra e linha. O registro não guarda estado por avaliação
+    (pode ser avaliado de várias threads); as estatísticas de cada chamada
+    voltam com o resultado (``return_stats=True``).
+    """
+
+    def __init__(self, rules: Optional[List[ValidationRule]] = None):
+        self._rules: Dict[str, ValidationRule] = {}
+        for rule in rules or []:
+            self.register(rule)
+
+    def register(self, rule: ValidationRule) -> ValidationRule:
+        if rule.name in self._rules:
+            raise ValueError(f"Regra já registrada: {rule.name}")
+        self._rules[rule.name] = rule
+        return rule
+
+    def rule(self, name: str, column: int, description: str, severity: str = "warning"):
+        """Decorador: registra a função de máscara como regra."""
+
+        def decorator(fn: Callable[[RuleContext], np.ndarray]):
+            self.register(ValidationRule(name, column, description, fn, severity))
+            return fn
+
+        return decorator
+
+    @property
+    def rules(self) -> List[ValidationRule]:
+        return list(self._rules.values())
+
+    def describe(self, name: str) -> str:
+        rule = self._rules.get(name)
+        return rule.description if rule else name
+
+    @overload
+    def evaluate(
+        self,
+        df: pd.DataFrame,
+        col_labels: Optional[Dict[int, object]] = ...,
+        now: Optional[datetime] = ...,
+        names: Optional[Iterable[str]] = ...,
+        return_stats: Literal[False] = ...,
+    ) -> pd.DataFrame:
+        ...
+
+    @overload
+    def evaluate(
+        self,
+        df: pd.DataFrame,
+        col_labels: Optional[Dict[int, object]] = ...,
+        now: Optional[datetime] = ...,
+        names: Optional[Iterable[str]] = ...,
+        *,
+        return_stats: Literal[True],
+    ) -> Tuple[pd.DataFrame, Dict[str, float]]:
+        ...
+
+    def evaluate(
+        self,
+        df: pd.DataFrame,
+        col_labels: Optional[Dict[int, object]] = None,
+        now: Optional[datetime] = None,
+        names: Optional[Iterable[str]] = None,
+        return_stats: bool = False,
+    ):
+        """Avalia as regras e devolve a tabela de problemas (rule, row, value).
+
+        ``rule`` é categórica (nomes das regras), ``row`` é o rótulo da linha
+        no DataFrame e ``value`` o valor original da coluna da regra.
+        ``names`` restringe a avaliação a essas regras (na ordem de registro).
+        Com ``return_stats=True`` devolve ``(problemas, estatísticas)``, com
+        linhas, regras, problemas, tempo e throughput (linhas/s) desta chamada.
+        """
+        start = time.perf_counter()
+        ctx = RuleContext(df, col_labels, now)
+        rules = self.rules
+        if names is not None:
+            wanted = set(names)
+            unknown = wanted.difference(self._rules)
+            if unknown:
+                raise ValueError(f"Regra(s) desconhecida(s): {', '.join(sorted(unknown))}")
+            rules = [r for r in rules if r.name in wanted]
+        masks = np.zeros((len(rules), ctx.n), dtype=bool)
+        for i, rule in enumerate(rules):
+            masks[i] = rule.mask(ctx)
+        rule_idx, positions = np.nonzero(masks)
+
+        values = np.empty(len(positions), dtype=object)
+        for i, rule in enumerate(rules):
+            sel = rule_idx == i
+            if sel.any():
+                values[sel] = ctx.raw(rule.column)[positions[sel]]
+        issues = pd.DataFrame(
+            {
+                "rule": pd.Categorical.from_codes(rule_idx, categories=[r.name for r in rules]),
+                "row": df.index.to_numpy()[positions],
+                "value": values,
+            },
+            columns=ISSUE_COLUMNS,
+        )
+
+        if not return_stats:
+            return issues
+        elapsed = time.perf_counter() - start
+        stats = {
+            "rows": ctx.n,
+            "rules": len(rules),
+            "issues": len(issues),
+            "seconds": elapsed,
+            "rows_per_second": ctx.n / elapsed if elapsed > 0 else float("inf"),
+        }
+        return issues, stats
+
+    def summarize(self, issues: pd.DataFrame) -> Dict[str, int]:
+        """Contagem de problemas por regra (apenas regras com ocorrências)."""
+        counts = issues["rule"].value_counts(sort=False)
+        return {name: int(c) for name, c in counts.items() if c > 0}
+
+    def format_summary(self, issues: pd.DataFrame) -> str:
+        """Resumo legível: '<n> <descrição>; ...'."""
+        return "; ".join(
+            f"{count} {self.describe(name)}" for name, count in self.summarize(issues).items()
+        )
+
+
+# -----------------------
+# Regras padrão
+# -----------------------
+DEFAULT_RULES = RuleRegistry()
+
+
+def _required(idx: int):
+    return lambda ctx: ctx.text(idx) == ""
+
+
+for _idx, _name in (
+    (SSAColumns.NUMERO_SSA, "numero_vazio"),
+    (SSAColumns.SITUACAO, "situacao_vazia"),
+    (SSAColumns.GRAU_PRIORIDADE_EMISSAO, "prioridade_vazia"),
+):
+    DEFAULT_RULES.register(
+        ValidationRule(
+            _name,
+            _idx,
+            f"{SSAColumns.get_name(_idx)} vazio(s)",
+            _required(_idx),
+            severity="error",
+        )
+    )
+
+
+@DEFAULT_RULES.rule("data_invalida", SSAColumns.EMITIDA_EM, "data(s) de emissão inválida(s)")
+def _data_invalida(ctx: RuleContext) -> np.ndarray:
+    return np.asarray(ctx.dates(SSAColumns.EMITIDA_EM).isna())
+
+
+@DEFAULT_RULES.rule("data_futura", SSAColumns.EMITIDA_EM, "data(s) de emissão no futuro")
+def _data_futura(ctx: RuleContext) -> np.ndarray:
+    return np.asarray(ctx.dates(SSAColumns.EMITIDA_EM) > pd.Timestamp(ctx.now))
+
+
+@DEFAULT_RULES.rule(
+    "responsavel_sem_setor",
+    SSAColumns.RESPONSAVEL_EXECUCAO,
+    "SSA(s) com responsável mas sem setor executor",
+)
+def _responsavel_sem_setor(ctx: RuleContext) -> np.ndarray:
+    com_resp = ctx.per_value(
+        SSAColumns.RESPONSAVEL_EXECUCAO, lambda v: v.upper() not in _EMPTY_RESPONSAVEL
+    )
+    return com_resp & (ctx.text(SSAColumns.SETOR_EXECUTOR) == "")
+
+
+@DEFAULT_RULES.rule("numero_duplicado", SSAColumns.NUMERO_SSA, "número(s) de SSA duplicado(s)")
+def _numero_duplicado(ctx: RuleContext) -> np.ndarray:
+    numeros = ctx.text(SSAColumns.NUMERO_SSA)
+    return pd.Series(numeros).duplicated(keep=False).to_numpy() & (numeros != "")
+
+
+def _week_rule(idx: int):
+    return lambda ctx: ctx.per_value(idx, lambda v: v != "" and not _WEEK_RE.match(v))
+
+
+DEFAULT_RULES.register(
+    ValidationRule(
+        "semana_cadastro_invalida",
+        SSAColumns.SEMANA_CADASTRO,
+        "semana(s) de cadastro fora do formato AAAASS",
+        _week_rule(SSAColumns.SEMANA_CADASTRO),
+    )
+)
+DEFAULT_RULES.register(
+    ValidationRule(
+        "semana_programada_invalida",
+        SSAColumns.SEMANA_PROGRAMADA,
+        "semana(s) programada(s) fora do formato AAAASS",
+        _week_rule(SSAColumns.SEMANA_PROGRAMADA),
+    )
+)
+
+
+@DEFAULT_RULES.rule("situacao_desconhecida", SSAColumns.SITUACAO, "situação(ões) desconhecida(s)")
+def _situacao_desconhecida(ctx: RuleContext) -> np.ndarray:
+    known = SSAColumns.STATE_DESCRIPTIONS
+    return ctx.per_value(SSAColumns.SITUACAO, lambda v: v != "" and v.upper() not in known)
+
+
+def evaluate_rules(
+    df: pd.DataFrame,
+    col_labels: Optional[Dict[int, object]] = None,
+    registry: Optional[RuleRegistry] = None,
+) -> pd.DataFrame:
+    """Atalho: avalia as regras padrão (ou ``registry``) sobre ``df``."""
+    return (registry or DEFAULT_RULES).evaluate(df, col_labels)
@@ -8,7 +8,7 @@ from dash import Dash, dcc, html, Input, Output, State, MATCH, ALL, dash_table
 import dash_bootstrap_components as dbc
 import logging
 from dash import dash_table
-from typing import Union, Tuple
+from typing import Callable, Union, Tuple
 from typing import Dict, List, Optional
 import dash
 import warnings
@@ -21,6 +21,15 @@ import timedelta
 import zipfile
 import shutil
 
+build_table_records: Optional[Callable[..., List[Dict]]]
+try:
+    from .Class.src.dashboard.table_records import build_table_records
+except ImportError:
+    try:
+        from Class.src.dashboard.table_records import build_table_records  # type: ignore[import-not-found,no-redef]
+    except ImportError:
+        build_table_records = None
+
 # Depois de todos os imports
 warnings.filterwarnings("ignore")
 
@@ -487,6 +496,17 @@ class SSAColumns:
         return cls.COLUMN_NAMES.get(index, f"Coluna {index}")
 
 
+# Colunas da ssa-table do dashboard legado
+LEGACY_TABLE_COLUMNS = {
+    "numero": SSAColumns.NUMERO_SSA,
+    "estado": SSAColumns.SITUACAO,
+    "resp_prog": SSAColumns.RESPONSAVEL_PROGRAMACAO,
+    "resp_exec": SSAColumns.RESPONSAVEL_EXECUCAO,
+    "semana_prog": SSAColumns.SEMANA_PROGRAMADA,
+    "prioridade": SSAColumns.GRAU_PRIORIDADE_EMISSAO,
+}
+
+
 @dataclass
 class WeekInfo:
     """Represents ISO week information for calculations."""
@@ -3028,20 +3048,6 @@ class SSADashboard:
         }
         return state_colors.get(state, "#6c757d")  # Cinza como cor padrão
 
-    def _prepare_table_data(self):
-        """Prepara dados para a tabela."""
-        return [
-            {
-                "numero": row.iloc[SSAColumns.NUMERO_SSA],
-                "estado": row.iloc[SSAColumns.SITUACAO],
-                "resp_prog": row.iloc[SSAColumns.RESPONSAVEL_PROGRAMACAO],
-                "resp_exec": row.iloc[SSAColumns.RESPONSAVEL_EXECUCAO],
-                "semana_prog": row.iloc[SSAColumns.SEMANA_PROGRAMADA],
-                "prioridade": row.iloc[SSAColumns.GRAU_PRIORIDADE_EMISSAO],
-            }
-            for idx, row in self.df.iterrows()
-        ]
-
     def _create_resp_prog_chart(self, df):
         """Cria o gráfico de responsáveis na programação."""
         resp_prog_counts = df.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO].value_counts()
@@ -3219,6 +3225,8 @@ class SSADashboard:
         """Prepara dados para a tabela."""
         if df is None:
             df = self.df
+        if build_table_records is not None:
+            return build_table_records(df, LEGACY_TABLE_COLUMNS, link_columns=(), date_columns=())
         return [
             {
                 "numero": row.iloc[SSAColumns.NUMERO_SSA],
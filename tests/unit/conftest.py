@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    """Roda cada teste num diretório temporário.
+
+    SSADashboard (via LogManager) grava dashboard_activity.log no diretório
+    atual; sem isso, os testes escreveriam na raiz do repositório.
+    """
+    monkeypatch.chdir(tmp_path)
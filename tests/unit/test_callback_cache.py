@@ -0,0 +1,76 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.dashboard.callback_cache import CallbackCache
+
+
+def test_lru_eviction_respects_memory_budget():
+    cache = CallbackCache(max_bytes=100, sizeof=lambda v: 40)
+    for key in "abc":
+        cache.get_or_compute(key, lambda: key.upper())
+    # Cabem 2 entradas de 40 bytes; "a" (menos recente) foi descartada
+    assert "a" not in cache and "b" in cache and "c" in cache
+    cache.get_or_compute("b", lambda: "?")  # hit: "b" passa a ser o mais recente
+    cache.get_or_compute("d", lambda: "D")
+    assert "c" not in cache and "b" in cache
+    stats = cache.stats()
+    assert stats["bytes"] == 80 and stats["evictions"] == 2
+    assert stats["hits"] == 1 and stats["misses"] == 4 and stats["hit_ratio"] == 0.2
+
+
+def test_concurrent_misses_compute_once():
+    cache = CallbackCache(sizeof=lambda v: 1)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return "figs"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["figs"] * 8 and len(calls) == 1
+
+
+def test_dashboard_memoizes_outputs_per_dataset_version():
+    from test_filter_index import _canonical
+    from src.dashboard.Class.src.dashboard.ssa_dashboard import (
+        ALL_OUTPUTS,
+        OUTPUT_GROUPS,
+        SSADashboard,
+    )
+
+    app = SSADashboard(_canonical(60))
+    first = app._compute_all_outputs("ANA", None, "", None)
+    second = app._compute_all_outputs("ANA", "", None, None)
+    # Saídas dos grupos vêm do cache; a página da tabela é remontada (30 linhas)
+    table = ALL_OUTPUTS.index(("ssa-table", "data"))
+    assert all(a is b for i, (a, b) in enumerate(zip(first, second)) if i != table)
+    assert first[table] == second[table]
+    # Seleção filtrada compartilhada, um cálculo por grupo e o motor da tabela
+    assert app.callback_cache.stats()["misses"] == 2 + len(OUTPUT_GROUPS)
+
+    # Novo snapshot: nova versão, saídas recalculadas
+    app.df = _canonical(60, seed=3)
+    assert app._compute_all_outputs("ANA", None, None, None)[1] is not first[1]
+    # Seleção, grupos e índices de drill-down dos 4 grupos com gráficos clicáveis
+    assert app.data_version == 1 and len(app.callback_cache) == 2 + len(OUTPUT_GROUPS) + 4
+
+    payload = app.app.server.test_client().get("/_diagnostics/cache").get_json()
+    assert payload["data_version"] == 1
+    assert payload["filter_callbacks"]["misses"] == 2 * (2 + len(OUTPUT_GROUPS))
+    assert payload["filter_callbacks"]["bytes"] > 0
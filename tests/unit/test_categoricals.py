@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+import pandas as pd
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.data.categoricals import (
+    CATEGORICAL_COLUMNS,
+    drop_unused_categories,
+)
+from src.dashboard.Class.src.data.data_loader import DataLoader
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+
+
+def _write_export(path):
+    df = pd.DataFrame(
+        {
+            "Número da SSA": ["SSA-1", "SSA-2", "SSA-3", "SSA-4"],
+            "Situação": ["AAD", "APL", "AAD", "ADM"],
+            "Emitida Em": ["01/09/2025 10:00:00"] * 4,
+            "Setor Executor": ["SX1", "SX2", "SX1", "SX3"],
+            "Grau de Prioridade Emissão": ["s3.7", "S2", "S2", "S1"],
+            "Responsável na execução": ["ana", "", "bia", "ana"],
+        }
+    )
+    with pd.ExcelWriter(path) as xw:
+        df.to_excel(xw, index=False)
+
+
+def test_categorical_load_matches_object_load(tmp_path):
+    excel = tmp_path / "cat.xlsx"
+    _write_export(excel)
+    cache_dir = str(tmp_path / "cache")
+
+    plain_loader = DataLoader(str(excel), cache_dir=cache_dir)
+    plain = plain_loader.load_data()
+    loader = DataLoader(str(excel), cache_dir=cache_dir, categorical=True)
+    cat = loader.load_data()
+    assert not loader.loaded_from_cache
+
+    for idx in CATEGORICAL_COLUMNS:
+        assert isinstance(cat[idx].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(cat.astype({i: object for i in CATEGORICAL_COLUMNS}), plain)
+    assert loader.ssa_objects.materialize() == plain_loader.ssa_objects.materialize()
+    # Snapshot separado e restaurado com os dtypes categóricos
+    again = DataLoader(str(excel), cache_dir=cache_dir, categorical=True)
+    pd.testing.assert_frame_equal(again.load_data(), cat)
+    assert again.loaded_from_cache
+
+
+def test_filtered_views_drop_unused_categories(tmp_path):
+    excel = tmp_path / "cat.xlsx"
+    _write_export(excel)
+    df = DataLoader(str(excel), categorical=True).load_data()
+
+    sub = drop_unused_categories(df[df[C.SETOR_EXECUTOR] == "SX1"])
+    assert sub[C.SITUACAO].value_counts().to_dict() == {"AAD": 2}
+    assert list(df[C.SITUACAO].cat.categories) == ["AAD", "ADM", "APL"]
+
+    from src.dashboard.Class.src.dashboard.ssa_dashboard import SSADashboard
+
+    stats = SSADashboard(df)._get_initial_stats()
+    assert stats["total"] == 4
+    assert stats["responsaveis"]["execucao"] == 2
@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from test_filter_index import _canonical
+from src.dashboard.Class.src.dashboard.chart_aggregates import CHART_KEYS, ChartAggregates
+from src.dashboard.Class.src.data.categoricals import to_categorical
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+
+
+def _legacy(df, chart_type, cat, trace_name=None):
+    column, as_str, by_priority = CHART_KEYS[chart_type]
+    mask = df.iloc[:, column] == (str(cat) if as_str else cat)
+    if by_priority and trace_name:
+        mask = mask & (df.iloc[:, C.GRAU_PRIORIDADE_EMISSAO] == trace_name)
+    return df[mask].iloc[:, C.NUMERO_SSA].astype(str).tolist()
+
+
+def test_ssas_match_per_category_masks():
+    for df in (_canonical(), to_categorical(_canonical())):
+        cases = {
+            "resp_prog": ["ANA", "BIA", "", "ninguem"],
+            "resp_exec": ["CAIO", "EVA"],
+            "state": ["AAD", "ADM"],
+            "week_registration": [202530, "202534", 202599],
+        }
+        for chart_type, categories in cases.items():
+            aggregates = ChartAggregates(df, chart_type)
+            assert aggregates.supported
+            for cat in categories:
+                for trace_name in (None, "S1", "S3.7", "S9"):
+                    assert aggregates.ssas(cat, trace_name) == _legacy(df, chart_type, cat, trace_name)
+
+
+def test_unknown_chart_type_is_unsupported():
+    aggregates = ChartAggregates(_canonical(10), "week_detail")
+    assert not aggregates.supported
+    assert aggregates.ssas("ANA") == [] and aggregates.ssas(202530, "S1") == []
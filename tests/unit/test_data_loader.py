@@ -77,3 +77,165 @@ def test_dashboard_instantiation_with_synthetic_df():
 
     app = SSADashboard(df)
     assert app is not None
+
+
+def test_load_data_parses_workbook_once(tmp_path, monkeypatch):
+    # Headerless sheet: previously required probe + header read + positional re-read
+    rows = [
+        ["SSA-1", "AAD", "", "L1", "", "", 202534, "01/09/2025 10:00:00"],
+        ["SSA-2", "APL", "", "L2", "", "", 202535, "02/09/2025 11:00:00"],
+    ]
+    excel = tmp_path / "noheader.xlsx"
+    with pd.ExcelWriter(excel) as xw:
+        pd.DataFrame(rows).to_excel(xw, header=False, index=False)
+
+    calls = []
+    real_read_excel = pd.read_excel
+
+    def counting_read_excel(*args, **kwargs):
+        calls.append(kwargs)
+        return real_read_excel(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_excel", counting_read_excel)
+    out = DataLoader(str(excel)).load_data()
+
+    assert len(calls) == 1
+    assert list(out.iloc[:, C.NUMERO_SSA]) == ["SSA-1", "SSA-2"]
+    assert out.iloc[:, C.EMITIDA_EM].notna().all()
+
+
+def test_frame_from_grid_matches_read_excel(tmp_path):
+    data = [["junk", None, None], ["a", None, "a"], [1, "x", 2.5], [2, "y", 3]]
+    excel = tmp_path / "grid.xlsx"
+    with pd.ExcelWriter(excel) as xw:
+        pd.DataFrame(data).to_excel(xw, header=False, index=False)
+
+    loader = DataLoader(str(excel))
+    grid = loader._read_raw_grid()
+    for header in (1, None):
+        pd.testing.assert_frame_equal(
+            loader._frame_from_grid(grid, header), pd.read_excel(excel, header=header)
+        )
+
+
+def test_streaming_matches_eager_load(tmp_path):
+    # Cabeçalho após linhas de lixo, SSA vazia no meio e coluna numérica com vazios
+    n = 7
+    proper = pd.DataFrame(
+        {
+            "Número da SSA": [f"SSA-{i}" if i != 3 else None for i in range(n)],
+            "Situação": ["AAD"] * n,
+            "Derivada de": [202400000 + i if i % 2 else None for i in range(n)],
+            "Semana de Cadastro": [202534] * n,
+            "Emitida Em": ["01/09/2025 10:00:00"] * (n - 1) + ["invalida"],
+            "Setor Executor": ["SX1"] * n,
+            "Grau de Prioridade Emissão": ["s3.7"] * n,
+            "Responsável na execução": [None, "ana"] * 3 + [None],
+        }
+    )
+    junk = pd.DataFrame([{"Número da SSA": "Relatório"}])
+    header = pd.DataFrame([list(proper.columns)], columns=proper.columns)
+    excel = tmp_path / "stream.xlsx"
+    with pd.ExcelWriter(excel) as xw:
+        pd.concat([junk, header, proper]).to_excel(xw, header=False, index=False)
+
+    eager = DataLoader(str(excel)).load_data()
+    for chunk_rows in (2, 50_000):
+        streamed = DataLoader(str(excel), streaming=True, chunk_rows=chunk_rows).load_data()
+        pd.testing.assert_frame_equal(eager, streamed)
+    assert "SSA-3" not in set(eager.iloc[:, C.NUMERO_SSA])
+    assert list(eager.iloc[:, C.DERIVADA])[:2] == ["", "202400001"]
+
+
+def test_streaming_headerless_sheet_uses_positional_mapping(tmp_path):
+    rows = [
+        ["SSA-1", "AAD", "", "L1", "", "", 202534, "01/09/2025 10:00:00"],
+        ["SSA-2", "APL", "", "L2", "", "", 202535, "02/09/2025 11:00:00"],
+        ["SSA-3", "APL", "", "L3", "", "", 202536, "03/09/2025 12:00:00"],
+    ]
+    excel = tmp_path / "noheader.xlsx"
+    with pd.ExcelWriter(excel) as xw:
+        pd.DataFrame(rows).to_excel(xw, header=False, index=False)
+
+    eager = DataLoader(str(excel)).load_data()
+    streamed = DataLoader(str(excel), streaming=True, chunk_rows=2).load_data()
+    pd.testing.assert_frame_equal(eager, streamed)
+    assert list(streamed.iloc[:, C.NUMERO_SSA]) == ["SSA-1", "SSA-2", "SSA-3"]
+
+
+def test_convert_to_objects_matches_validating_constructor(caplog):
+    from src.dashboard.Class.src.data.ssa_data import SSAData
+
+    df = pd.DataFrame({idx: [""] * 3 for idx in C.COLUMN_NAMES})
+    df[C.EMITIDA_EM] = pd.to_datetime(["2025-09-01 10:00", None, "2025-09-03 12:00"])
+    df[C.NUMERO_SSA] = ["SSA-1", "SSA-2", "SSA-3"]
+    df[C.SITUACAO] = ["AAD", " APL ", ""]
+    df[C.GRAU_PRIORIDADE_EMISSAO] = ["s3.7", "S2", "S1"]
+    df[C.RESPONSAVEL_EXECUCAO] = [" ana ", "nan", "bia"]
+    df[C.SEMANA_PROGRAMADA] = ["", "202536", ""]
+    df.index = [10, 11, 12]
+
+    loader = DataLoader("<memoria>")
+    loader.df = df
+    loader._col_labels = {idx: idx for idx in C.COLUMN_NAMES}
+    with caplog.at_level("ERROR"):
+        assert loader._convert_to_objects() == 2
+
+    # Linha sem situação é rejeitada e reportada pelo índice original
+    assert "Erro ao converter linha 12: Situação não pode ser vazia" in caplog.text
+    first, second = loader.ssa_objects
+    expected = SSAData(
+        numero="SSA-2", situacao="APL", derivada=None, localizacao="",
+        desc_localizacao="", equipamento="", semana_cadastro="", emitida_em=None,
+        descricao="", setor_emissor="", setor_executor="", solicitante="",
+        servico_origem="", prioridade_emissao="S2", prioridade_planejamento=None,
+        execucao_simples="", responsavel_programacao=None, semana_programada="202536",
+        responsavel_execucao=None, descricao_execucao=None, sistema_origem="",
+        anomalia=None,
+    )
+    assert second.to_ssa_data() == expected
+    assert loader.ssa_objects.materialize()[1] == expected
+    assert first.prioridade_emissao == "S3.7" and first.responsavel_execucao == "ANA"
+    assert first.emitida_em == pd.Timestamp("2025-09-01 10:00")
+
+
+def test_column_mapping_cache_skips_detection_for_known_layout(tmp_path, monkeypatch):
+    def export(name, ssas, header=True):
+        df = pd.DataFrame(
+            {
+                "Número da SSA": ssas,
+                "Situação": ["AAD"] * len(ssas),
+                "Emitida Em": ["01/09/2025 10:00:00"] * len(ssas),
+                "Setor Executor": ["SX1"] * len(ssas),
+                "Grau de Prioridade Emissão": ["S2"] * len(ssas),
+            }
+        )
+        path = tmp_path / name
+        with pd.ExcelWriter(path) as xw:
+            df.to_excel(xw, index=False, header=header)
+        return str(path)
+
+    cache_dir = str(tmp_path / "cache")
+    first = DataLoader(export("a.xlsx", ["SSA-1", "SSA-2"]), cache_dir=cache_dir)
+    first.load_data()
+    assert first.mapping_cache.stats["writes"] == 1
+
+    # Mesmo layout, outro conteúdo: detecção e mapeamento não rodam
+    def fail(*args, **kwargs):
+        raise AssertionError("detecção não deveria rodar")
+
+    with monkeypatch.context() as m:
+        m.setattr(DataLoader, "_detect_header_row", fail)
+        m.setattr(DataLoader, "_build_column_mapping", fail)
+        for streaming in (False, True):
+            ssas = [f"SSA-{i}" for i in range(3 + streaming)]
+            loader = DataLoader(export(f"b{streaming}.xlsx", ssas), cache_dir=cache_dir, streaming=streaming)
+            out = loader.load_data()
+            assert list(out.iloc[:, C.NUMERO_SSA]) == ssas
+            assert loader.mapping_cache.stats["hits"] == 1
+
+    # Planilha sem cabeçalho: a inferência por dados roda só na primeira vez
+    DataLoader(export("c.xlsx", ["SSA-6"], header=False), cache_dir=cache_dir).load_data()
+    monkeypatch.setattr(DataLoader, "_infer_columns_from_data", fail)
+    out = DataLoader(export("d.xlsx", ["SSA-7", "SSA-8"], header=False), cache_dir=cache_dir).load_data()
+    assert list(out.iloc[:, C.NUMERO_SSA]) == ["SSA-7", "SSA-8"]
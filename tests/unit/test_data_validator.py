@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+import pandas as pd
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+from src.dashboard.Class.src.data.ssa_table import SSATable
+from src.dashboard.Class.src.utils.data_validator import SSADataValidator
+
+
+def _frame():
+    df = pd.DataFrame({idx: [""] * 5 for idx in C.COLUMN_NAMES})
+    df[C.EMITIDA_EM] = pd.to_datetime(["2025-09-01", "2099-01-01", None, "2025-09-02", "2025-09-03"])
+    df[C.NUMERO_SSA] = ["SSA-1", "SSA-2", "SSA-1", "SSA-3", "SSA-3"]
+    df[C.SITUACAO] = ["AAD"] * 5
+    df[C.GRAU_PRIORIDADE_EMISSAO] = ["S2"] * 5
+    df[C.SETOR_EXECUTOR] = ["SX1", "", "SX2", "SX1", ""]
+    df[C.RESPONSAVEL_EXECUCAO] = ["bia", "ana", "", "bia", ""]
+    return df
+
+
+def test_validator_results_match_for_frame_table_and_objects():
+    df = _frame()
+    table = SSATable(df)
+    validator = SSADataValidator()
+
+    for source in (df, table, table.materialize()):
+        result = validator.validate_data_consistency(source)
+        assert result.issues == ["SSA SSA-2 tem responsável mas não tem setor executor"]
+        assert result.statistics["resp_counts"] == {"BIA": 2, "ANA": 1}
+        assert result.statistics["ssas_sem_responsavel"] == 2
+        assert result.statistics["setores_executores"] == 2
+
+        report = validator.verify_data_integrity(source)
+        assert report["total_records"] == 5
+        assert report["warnings"] == [
+            "SSAs com datas futuras: SSA-2",
+            "SSAs duplicadas encontradas: SSA-1, SSA-3",
+        ]
+        assert report["checks"]["duplicates_found"] == 2
@@ -0,0 +1,57 @@
+import sys
+from datetime import date, datetime
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.utils.date_utils import diagnose_dates, parse_sam_datetimes
+
+
+def test_diagnose_dates_classifies_mixed_column():
+    values = [
+        "01/09/2025 10:00:00", "invalida", None, np.nan, pd.Timestamp("1900-01-01"),
+        datetime(2025, 1, 1), date(2025, 1, 1), 5, "", "32/13/2025", "invalida",
+    ]
+    df = pd.DataFrame({"n": range(len(values)), "d": values}, index=range(10, 10 + len(values)))
+
+    report = diagnose_dates(df, 1)
+
+    assert report["error_details"] == {
+        "null_count": 2, "format_errors": 3, "type_errors": 2, "range_errors": 1, "other_errors": 0,
+    }
+    assert report["error_count"] == 8 and not report["truncated"]
+    rows = report["problematic_rows"]
+    assert [r["index"] for r in rows] == [11, 12, 13, 14, 16, 17, 19, 20]
+    assert rows[0]["reason"].startswith("Erro na conversão") and rows[0]["row_data"] == {"n": 1, "d": "invalida"}
+    assert rows[3]["reason"] == "Data fora do intervalo esperado"
+    assert rows[4]["reason"] == f"Tipo inválido: {date}"
+
+
+def test_diagnose_dates_caps_row_payload_but_counts_everything():
+    dates = pd.Series(pd.to_datetime(["2025-09-01"] * 5 + [None] * 300 + ["1800-01-01"]))
+    report = diagnose_dates(pd.DataFrame({"d": dates}), 0, max_rows=10)
+
+    assert report["error_count"] == 301 and report["truncated"]
+    assert len(report["problematic_rows"]) == 10
+    assert report["error_details"]["null_count"] == 300
+    assert report["error_details"]["range_errors"] == 1
+
+
+def test_parse_sam_datetimes_matches_general_parser():
+    values = [
+        "01/09/2025 10:00:00", "29/02/2024 23:59:59", "29/02/2025 10:00:00", "1/9/2025 10:00:00",
+        "2025-09-01 10:00:00", "01/13/2025 10:00:00", "01/09/2025 24:00:00", "01/09/1500 10:00:00",
+        None, "", pd.Timestamp("2024-01-01 05:00"), 5,
+    ]
+    s = pd.Series(values, index=range(3, 3 + len(values)))
+    expected = pd.to_datetime(
+        s, format="%d/%m/%Y %H:%M:%S", errors="coerce", dayfirst=True
+    ).astype("datetime64[ns]")
+
+    pd.testing.assert_series_equal(parse_sam_datetimes(s), expected)
+    assert parse_sam_datetimes(s)[4] == pd.Timestamp("2024-02-29 23:59:59")
@@ -0,0 +1,53 @@
+import logging
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.data.data_loader import DataLoader
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+from src.dashboard.Class.src.utils.diagnostics import Diagnostics
+
+
+def _loader(diagnostics):
+    n = 6
+    df = pd.DataFrame({idx: [""] * n for idx in C.COLUMN_NAMES})
+    df[C.NUMERO_SSA] = [f"SSA-{i}" for i in range(n)]
+    df[C.SITUACAO] = "AAD"
+    df[C.GRAU_PRIORIDADE_EMISSAO] = "S2"
+    df[C.RESPONSAVEL_EXECUCAO] = ["ana", "bia", "ana", "", "ana", "bia"]
+    df[C.EMITIDA_EM] = pd.to_datetime(["2025-09-01"] * n)
+    loader = DataLoader("<memoria>", diagnostics=diagnostics)
+    loader.df = df
+    loader._col_labels = {idx: idx for idx in C.COLUMN_NAMES}
+    return loader
+
+
+@pytest.mark.parametrize("level", ["off", "summary", "full"])
+def test_levels_control_log_volume_and_detail_file(level, tmp_path, caplog):
+    path = tmp_path / "diag" / "ssa.log"
+    loader = _loader(Diagnostics(level, str(path)))
+    with caplog.at_level(logging.INFO):
+        loader._convert_to_objects()
+    loader.diagnostics.close()
+
+    # Nenhuma linha por SSA vai para o log; o resumo vem de um único value_counts
+    assert "SSA-0" not in caplog.text
+    assert ("Responsáveis Execução (2): ANA: 3, BIA: 2" in caplog.text) == (level != "off")
+    # O arquivo de detalhe só existe no nível full
+    assert path.exists() == (level == "full")
+    if level == "full":
+        text = path.read_text(encoding="utf-8")
+        assert "Responsável Execução: 'ANA' - Total SSAs: 3" in text
+        assert "  - SSA SSA-4: AAD" in text
+
+
+def test_invalid_level_is_rejected():
+    with pytest.raises(ValueError):
+        Diagnostics("verbose")
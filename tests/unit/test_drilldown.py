@@ -0,0 +1,111 @@
+import json
+import sys
+from pathlib import Path
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from test_filter_callbacks import FILTER_IDS
+from test_filter_index import _canonical, _legacy
+from src.dashboard.Class.src.dashboard.drilldown import DrilldownIndex
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+
+
+def test_index_checks_bar_id_and_label():
+    df = _canonical(20)
+    index = DrilldownIndex(df)
+    assert index.add("state", "AAD", [3, 1]) == 0
+    assert index.add("state", "ADM", []) == 1
+    assert index.ssas("state", 0, "AAD") == ["SSA-3", "SSA-1"]
+    assert index.ssas("state", 1) == []
+    assert index.ssas("state", 0, "ADM") is None
+    assert index.ssas("state", -1) is None and index.ssas("resp_prog", 0) is None
+    assert index.nbytes > 0
+
+
+def test_figures_carry_bar_ids_resolved_on_the_server():
+    from src.dashboard.Class.src.dashboard.ssa_dashboard import SSADashboard
+
+    df = _canonical(80)
+    app = SSADashboard(df)
+    filters = (None, "EVA", None, "X1")
+    outputs = app._compute_all_outputs(*filters)
+    expected = _legacy(df, resp_exec="EVA", setor_executor="X1")
+
+    trace = outputs[1].data[0]  # SSAs por programador
+    assert all(isinstance(bar, int) for bar in trace.customdata)
+    for bar, x in zip(trace.customdata, trace.x):
+        numbers = expected[expected.iloc[:, C.RESPONSAVEL_PROGRAMACAO] == x].iloc[:, C.NUMERO_SSA]
+        assert app._drilldown_ssas("resp_prog", bar, x, filters) == numbers.tolist()
+
+    # Índice fora do cache: reconstruído com os mesmos ids
+    bar, x = trace.customdata[0], trace.x[0]
+    first = app._drilldown_ssas("resp_prog", bar, x, filters)
+    app.callback_cache.clear()
+    assert app._drilldown_ssas("resp_prog", bar, x, ("", "EVA", "", "X1")) == first
+    assert app._drilldown_ssas("resp_prog", bar, "outro", filters) == []
+
+
+def _dispatch(app, outputs, inputs, state, changed):
+    names = [f"{i}.{p}" for i, p in outputs]
+    specs = [{"id": i, "property": p} for i, p in outputs]
+    body = {
+        "output": names[0] if len(names) == 1 else "..{}..".format("...".join(names)),
+        "outputs": specs[0] if len(specs) == 1 else specs,
+        "inputs": [{"id": i, "property": p, "value": v} for i, p, v in inputs],
+        "state": [{"id": i, "property": p, "value": v} for i, p, v in state],
+        "changedPropIds": [changed],
+    }
+    response = app.app.server.test_client().post(
+        "/_dash-update-component", data=json.dumps(body), content_type="application/json"
+    )
+    assert response.status_code == 200
+    return response.get_json()["response"]
+
+
+def test_modal_sends_first_page_and_fetches_the_rest_on_demand():
+    from src.dashboard.Class.src.dashboard.ssa_dashboard import SSADashboard
+
+    df = _canonical(200)
+    app = SSADashboard(df, ssa_list_page_size=10)
+    filters = (None, None, "E1", None)
+    trace = app._compute_all_outputs(*filters)[1].data[0]
+    bar, label = trace.customdata[0], trace.x[0]
+    expected = _legacy(df, setor_emissor="E1")
+    expected = expected[expected.iloc[:, C.RESPONSAVEL_PROGRAMACAO] == label].iloc[:, C.NUMERO_SSA].tolist()
+    assert len(expected) > 20
+
+    charts = ["weeks-in-state-chart", "resp-prog-chart", "resp-exec-chart", "programmed-week-chart",
+              "registration-week-chart", "detail-state-chart", "detail-week-chart"]
+    inputs = [(c, "clickData", None) for c in charts] + [("close-modal", "n_clicks", None)]
+    inputs[1] = ("resp-prog-chart", "clickData", {"points": [{"x": label, "customdata": bar}]})
+    state = [("ssa-modal", "is_open", False)] + [(f, "value", v) for f, v in zip(FILTER_IDS, filters)]
+    modal = _dispatch(
+        app,
+        [("ssa-modal", "is_open"), ("ssa-modal-body", "children"), ("ssa-modal-title", "children"),
+         ("ssa-modal-store", "data")],
+        inputs, state, "resp-prog-chart.clickData",
+    )
+    ref = modal["ssa-modal-store"]["data"]
+    body = json.dumps(modal["ssa-modal-body"]["children"])
+    # Só a primeira página vai no corpo do modal, sem a lista completa escondida
+    assert body.count('"copy-button"') == 10 and expected[10] not in body
+    assert f"Copiar todas ({len(expected)})" in body
+
+    more = _dispatch(
+        app,
+        [("ssa-list-items", "children"), ("ssa-list-more", "children"), ("ssa-list-more", "style")],
+        [("ssa-list-more", "n_clicks", 1)], [("ssa-modal-store", "data", ref)], "ssa-list-more.n_clicks",
+    )
+    patch = more["ssa-list-items"]["children"]
+    assert patch["__dash_patch_update"] and len(json.dumps(patch).split('"copy-button"')) == 11
+    assert expected[10] in json.dumps(patch) and expected[20] not in json.dumps(patch)
+    assert more["ssa-list-more"]["children"] == f"Carregar mais ({len(expected) - 20} restantes)"
+
+    copied = _dispatch(
+        app, [("ssa-copy-data", "data")], [("copy-all-ssas", "n_clicks", 1)],
+        [("ssa-modal-store", "data", ref)], "copy-all-ssas.n_clicks",
+    )
+    assert copied["ssa-copy-data"]["data"]["text"] == ",".join(expected)
@@ -0,0 +1,66 @@
+import json
+import sys
+from pathlib import Path
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from test_filter_index import _canonical
+from src.dashboard.Class.src.dashboard import ssa_visualizer
+from src.dashboard.Class.src.dashboard.ssa_dashboard import (
+    ALL_OUTPUTS,
+    OUTPUT_GROUPS,
+    SSADashboard,
+)
+
+FILTER_IDS = ["resp-prog-filter", "resp-exec-filter", "setor-emissor-filter", "setor-executor-filter"]
+
+
+def _post(app, outputs, values, extra_inputs=(), changed="resp-prog-filter.value"):
+    body = {
+        "output": "..{}..".format("...".join(f"{i}.{p}" for i, p in outputs)),
+        "outputs": [{"id": i, "property": p} for i, p in outputs],
+        "inputs": [{"id": i, "property": "value", "value": v} for i, v in zip(FILTER_IDS, values)]
+        + [{"id": i, "property": p, "value": v} for i, p, v in extra_inputs],
+        "changedPropIds": [changed],
+        "state": [],
+    }
+    response = app.app.server.test_client().post(
+        "/_dash-update-component", data=json.dumps(body), content_type="application/json"
+    )
+    assert response.status_code == 200
+    return response.get_json()["response"]
+
+
+def test_one_callback_per_output_group():
+    app = SSADashboard(_canonical(60))
+    by_filters = [
+        key for key, spec in app.app.callback_map.items()
+        if [i["id"] for i in spec["inputs"]] == FILTER_IDS
+    ]
+    # Grupos de saídas + histórico do usuário (a tabela tem callback próprio)
+    assert len(by_filters) == len(OUTPUT_GROUPS) + 1
+    grouped = [o for outputs in OUTPUT_GROUPS.values() for o in outputs]
+    assert sorted(grouped + [("ssa-table", "data")]) == sorted(ALL_OUTPUTS)
+
+    response = _post(app, OUTPUT_GROUPS["summary"], ["ANA", None, None, "X1"])
+    assert list(response) == ["resp-summary-cards", "detail-section"]
+    assert response["detail-section"]["style"] == {"display": "block"}
+
+
+def test_week_analysis_shared_between_groups(monkeypatch):
+    calls = []
+    original = ssa_visualizer.WeekAnalyzer._analyze_weeks
+
+    def counting(self, use_programmed=True):
+        calls.append(use_programmed)
+        return original(self, use_programmed)
+
+    monkeypatch.setattr(ssa_visualizer.WeekAnalyzer, "_analyze_weeks", counting)
+    app = SSADashboard(_canonical(60))
+    calls.clear()
+    app._compute_all_outputs(None, "EVA", None, None)
+    # "weeks" e "detail" usam a mesma análise das semanas programadas
+    assert sorted(calls) == [False, True]
@@ -0,0 +1,66 @@
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.dashboard.filter_index import FILTER_COLUMNS, FilterIndex
+from src.dashboard.Class.src.data.categoricals import to_categorical
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+
+
+def _canonical(n=300, seed=7):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({idx: [""] * n for idx in C.COLUMN_NAMES})
+    df[C.NUMERO_SSA] = [f"SSA-{i}" for i in range(n)]
+    df[C.SITUACAO] = rng.choice(["AAD", "APL", "ADM"], n)
+    df[C.GRAU_PRIORIDADE_EMISSAO] = rng.choice(["S1", "S2", "S3.7"], n)
+    df[C.RESPONSAVEL_PROGRAMACAO] = rng.choice(["ANA", "BIA", ""], n)
+    df[C.RESPONSAVEL_EXECUCAO] = rng.choice(["CAIO", "DANI", "EVA", ""], n)
+    df[C.SETOR_EMISSOR] = rng.choice(["E1", "E2"], n)
+    df[C.SETOR_EXECUTOR] = rng.choice(["X1", "X2", "X3"], n)
+    df[C.SEMANA_CADASTRO] = rng.choice(["202530", "202534", "202536"], n)
+    df[C.EMITIDA_EM] = pd.Timestamp(2025, 9, 1)
+    df.index = df.index + 1000
+    return df
+
+
+def _legacy(df, **filters):
+    out = df.copy()
+    for name, value in filters.items():
+        if value:
+            out = out[out.iloc[:, FILTER_COLUMNS[name]] == value]
+    return out
+
+
+def test_select_matches_boolean_masks():
+    for df in (_canonical(), to_categorical(_canonical())):
+        index = FilterIndex(df)
+        assert index.select() is None and index.filter() is df
+        choices = {
+            "resp_prog": [None, "ANA", "BIA"],
+            "resp_exec": [None, "EVA", "ninguem"],
+            "setor_emissor": [None, "E2"],
+            "setor_executor": [None, "X1", "X3"],
+        }
+        for combo in itertools.product(*choices.values()):
+            filters = dict(zip(choices, combo))
+            pd.testing.assert_frame_equal(index.filter(**filters), _legacy(df, **filters))
+
+
+def test_dashboard_outputs_use_index_without_copy():
+    from src.dashboard.Class.src.dashboard.ssa_dashboard import SSADashboard
+
+    df = _canonical(60)
+    app = SSADashboard(df)
+    index = app._get_filter_index()
+    outputs = app._compute_all_outputs("ANA", None, None, "X1")
+    expected = app._prepare_table_data(_legacy(df, resp_prog="ANA", setor_executor="X1"))
+    assert outputs[8] == expected
+    assert app._get_filter_index() is index
@@ -0,0 +1,75 @@
+import sys
+import os
+import time
+from pathlib import Path
+import pandas as pd
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.data.data_loader import DataLoader
+from src.dashboard.Class.src.data.snapshot_cache import SnapshotCache
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+
+
+def _write_excel(path, n=3):
+    df = pd.DataFrame(
+        {
+            "Número da SSA": [f"SSA-{i}" for i in range(n)],
+            "Situação": ["AAD"] * n,
+            "Emitida Em": ["01/09/2025 10:00:00"] * n,
+            "Setor Executor": ["SX1"] * n,
+            "Grau de Prioridade Emissão": ["s3.7"] * n,
+        }
+    )
+    with pd.ExcelWriter(path) as xw:
+        df.to_excel(xw, index=False)
+
+
+def test_cache_hit_returns_same_canonical_frame(tmp_path):
+    excel = tmp_path / "a.xlsx"
+    _write_excel(excel)
+    cache_dir = tmp_path / "cache"
+
+    first = DataLoader(str(excel), cache_dir=str(cache_dir))
+    df1 = first.load_data()
+    assert not first.loaded_from_cache
+    assert first.cache.stats["misses"] == 1 and first.cache.stats["writes"] == 1
+
+    second = DataLoader(str(excel), cache_dir=str(cache_dir))
+    df2 = second.load_data()
+    assert second.loaded_from_cache
+    assert second.cache.stats["hits"] == 1
+    pd.testing.assert_frame_equal(df1, df2)
+    assert str(df2.iloc[:, C.EMITIDA_EM].dtype) == "datetime64[ns]"
+    # Problemas de qualidade também são avaliados num hit (iguais aos da carga)
+    pd.testing.assert_frame_equal(second.validation_issues, first.validation_issues)
+    # Objetos continuam disponíveis sob demanda após um hit
+    assert [s.numero for s in second.get_ssa_objects()] == ["SSA-0", "SSA-1", "SSA-2"]
+
+
+def test_cache_key_is_content_addressed(tmp_path):
+    a = tmp_path / "a.xlsx"
+    _write_excel(a)
+    b = tmp_path / "b.xlsx"
+    b.write_bytes(a.read_bytes())
+    cache = SnapshotCache(str(tmp_path / "cache"))
+    assert cache.make_key(str(a), "1") == cache.make_key(str(b), "1")
+    assert cache.make_key(str(a), "1") != cache.make_key(str(a), "2")
+
+
+def test_eviction_keeps_directory_bounded(tmp_path):
+    cache = SnapshotCache(str(tmp_path / "cache"), max_bytes=1)
+    df = pd.DataFrame({0: ["x"] * 10})
+    cache.put("old", df)
+    old_path = cache._path_for("old")
+    past = time.time() - 60
+    os.utime(old_path, (past, past))
+    cache.put("new", df)
+    assert not old_path.exists()
+    assert cache._path_for("new").exists()
+    assert cache.stats["evictions"] == 1
+    assert cache.get("old") is None
+    assert cache.get_stats()["entries"] == 1
@@ -0,0 +1,47 @@
+import sys
+import pickle
+from pathlib import Path
+from datetime import datetime
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.data.ssa_data import SSAData
+
+
+def _fields(**overrides):
+    base = dict(
+        numero="SSA-1", situacao="AAD", derivada=None, localizacao="L1",
+        desc_localizacao="", equipamento="", semana_cadastro="202534",
+        emitida_em=datetime(2025, 9, 1), descricao="desc", setor_emissor="SE",
+        setor_executor="SX1", solicitante="", servico_origem="",
+        prioridade_emissao="S3.7", prioridade_planejamento=None,
+        execucao_simples="", responsavel_programacao="ANA",
+        semana_programada=None, responsavel_execucao=None,
+        descricao_execucao=None, sistema_origem="", anomalia=None,
+    )
+    base.update(overrides)
+    return base
+
+
+def test_slotted_and_interned():
+    # Strings montadas em tempo de execução: objetos distintos com o mesmo valor
+    setor_a = "".join(["SX", "9 "])
+    setor_b = "".join([" SX", "9"])
+    a = SSAData(**_fields(setor_executor=setor_a, responsavel_programacao="".join(["B", "IA"])))
+    b = SSAData(**_fields(setor_executor=setor_b, responsavel_programacao="".join(["BI", "A"])))
+
+    assert not hasattr(a, "__dict__")
+    assert a.setor_executor == "SX9"
+    assert a.setor_executor is b.setor_executor
+    assert a.responsavel_programacao is b.responsavel_programacao
+    assert a.is_critical() and a.to_display_dict()["Setor Executor"] == "SX9"
+
+
+def test_from_trusted_equals_validating_constructor():
+    values = _fields()
+    trusted = SSAData.from_trusted(*values.values())
+    assert trusted == SSAData(**values)
+    assert pickle.loads(pickle.dumps(trusted)) == trusted
@@ -0,0 +1,82 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.data.categoricals import to_categorical
+from src.dashboard.Class.src.data.data_loader import DataLoader
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+
+
+def _canonical(n=60):
+    df = pd.DataFrame({idx: [""] * n for idx in C.COLUMN_NAMES})
+    df[C.NUMERO_SSA] = [f"SSA-{i}" if i % 17 else "" for i in range(n)]
+    df[C.SITUACAO] = "AAD"
+    df[C.SETOR_EXECUTOR] = [[" sx1", "SX2 ", "", "Sx1"][i % 4] for i in range(n)]
+    df[C.GRAU_PRIORIDADE_EMISSAO] = [["s3.7", "S2", "S1"][i % 3] for i in range(n)]
+    days = pd.to_timedelta([(i * 7) % 45 for i in range(n)], unit="D")
+    df[C.EMITIDA_EM] = (pd.Timestamp(2025, 1, 1) + days).where([i % 11 != 0 for i in range(n)])
+    return df
+
+
+def _linear(ssas, setor=None, prioridade=None, data_inicio=None, data_fim=None):
+    """Varredura linear com a semântica do filtro original."""
+    out = list(ssas)
+    if setor:
+        out = [s for s in out if s.setor_executor and s.setor_executor.strip().upper() == setor.strip().upper()]
+    if prioridade:
+        out = [s for s in out if s.prioridade_emissao and s.prioridade_emissao.strip().upper() == prioridade.strip().upper()]
+    if data_inicio:
+        out = [s for s in out if s.emitida_em and s.emitida_em >= data_inicio]
+    if data_fim:
+        out = [s for s in out if s.emitida_em and s.emitida_em <= data_fim]
+    return [s.numero for s in out]
+
+
+def _loader(df):
+    loader = DataLoader("<memoria>")
+    loader.df = df
+    loader._col_labels = {idx: idx for idx in C.COLUMN_NAMES}
+    return loader
+
+
+def test_indexed_filter_matches_linear_scan():
+    for df in (_canonical(), to_categorical(_canonical())):
+        loader = _loader(df)
+        ssas = list(loader.get_ssa_objects())
+        cases = [
+            {},
+            {"setor": "SX1"},
+            {"setor": " sx2", "prioridade": "S2"},
+            {"setor": "nao-existe"},
+            {"prioridade": "S3.7", "data_inicio": datetime(2025, 1, 10)},
+            {"data_inicio": datetime(2025, 1, 8), "data_fim": datetime(2025, 1, 29)},
+            {"setor": "sx1", "data_fim": datetime(2025, 1, 15)},
+            {"data_inicio": datetime(2026, 1, 1)},
+        ]
+        for kwargs in cases:
+            filtered, _ = loader.filter_ssas(diagnose=False, **kwargs)
+            assert [s.numero for s in filtered] == _linear(ssas, **kwargs), kwargs
+
+
+def test_index_built_once_per_dataset():
+    loader = _loader(_canonical())
+    index = loader.get_ssa_index()
+    loader.filter_ssas(setor="SX1")
+    assert loader.get_ssa_index() is index
+    assert set(index.by_setor) == {"SX1", "SX2"}
+
+    _, diagnostico = loader.filter_ssas(setor="SX1", diagnose=False)
+    assert diagnostico is None
+
+    # Nova sequência de SSAs (nova carga) -> índices reconstruídos
+    loader.df = _canonical(30)
+    loader.ssa_objects = None
+    assert loader.get_ssa_index() is not index
+    assert len(loader.get_ssa_index()) == len(loader.get_ssa_objects())
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.data.data_loader import DataLoader
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+from src.dashboard.Class.src.data.ssa_table import SSATable
+from src.dashboard.Class.src.utils.data_validator import SSADataValidator
+
+
+def _canonical(n=4):
+    df = pd.DataFrame({idx: [""] * n for idx in C.COLUMN_NAMES})
+    df[C.EMITIDA_EM] = pd.to_datetime(["2025-09-01 10:00"] * n)
+    df[C.NUMERO_SSA] = [f"SSA-{i}" for i in range(n)]
+    df[C.SITUACAO] = ["AAD"] * n
+    df[C.GRAU_PRIORIDADE_EMISSAO] = ["s3.7", "S2"] * (n // 2)
+    df[C.SETOR_EXECUTOR] = ["SX1", "SX2"] * (n // 2)
+    df[C.RESPONSAVEL_EXECUCAO] = ["ana", ""] * (n // 2)
+    return df
+
+
+def test_table_is_a_lazy_sequence_of_row_views():
+    df = _canonical()
+    df.loc[2, C.SITUACAO] = ""
+    table = SSATable(df)
+
+    assert len(table) == 3
+    assert [r.numero for r in table] == ["SSA-0", "SSA-1", "SSA-3"]
+    assert table[-1].numero == "SSA-3"
+    assert [r.numero for r in table[:2]] == ["SSA-0", "SSA-1"]
+    assert table.invalid_rows == [(2, "Situação não pode ser vazia")]
+
+    first = table[0]
+    assert first.prioridade_emissao == "S3.7"
+    assert first.responsavel_execucao == "ANA"
+    assert first.derivada is None
+    assert first.is_critical() and first.has_responsible()
+    assert first.to_dict() == first.to_ssa_data().to_dict()
+    # Views leem direto das colunas do DataFrame
+    assert np.shares_memory(table._columns["numero"], df[C.NUMERO_SSA].to_numpy())
+
+
+def test_validator_and_filters_accept_the_table():
+    loader = DataLoader("<memoria>")
+    loader.df = _canonical()
+    loader._col_labels = {idx: idx for idx in C.COLUMN_NAMES}
+
+    table = loader.get_ssa_objects()
+    assert isinstance(table, SSATable)
+    result = SSADataValidator().validate_data_consistency(table)
+    assert result.statistics["total_ssas"] == 4
+    assert result.statistics["ssas_com_responsavel"] == 2
+
+    filtered, _ = loader.filter_ssas(setor="sx1", prioridade="S3.7")
+    assert [s.numero for s in filtered] == ["SSA-0", "SSA-2"]
+
+
+def test_empty_table_is_built_once():
+    loader = DataLoader("<memoria>")
+    assert loader.ssa_objects is None
+    loader.df = _canonical()
+    loader.df[C.SITUACAO] = ""
+    loader._col_labels = {idx: idx for idx in C.COLUMN_NAMES}
+
+    table = loader.get_ssa_objects()
+    assert len(table) == 0
+    assert loader.get_ssa_objects() is table
@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from test_filter_callbacks import FILTER_IDS, _post
+from test_filter_index import _canonical
+from src.dashboard.Class.src.dashboard.table_query import TableQuery, parse_filter_query
+from src.dashboard.Class.src.data.categoricals import to_categorical
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+
+
+def _frame(n=200):
+    df = _canonical(n)
+    days = np.random.default_rng(1).integers(0, 30, n)
+    df[C.EMITIDA_EM] = pd.Timestamp(2025, 9, 1) + pd.to_timedelta(days, unit="D")
+    df.iloc[3, C.EMITIDA_EM] = pd.NaT
+    return df
+
+
+def test_parse_filter_query():
+    assert parse_filter_query("") == []
+    assert parse_filter_query('{estado} scontains AAD && {resp_prog} i= "ana maria"') == [
+        [("estado", "contains", "AAD", True), ("resp_prog", "eq", "ana maria", False)]
+    ]
+    assert parse_filter_query("{prioridade} is blank or {numero} >= 'SSA-5'") == [
+        [("prioridade", "blank", None, True)],
+        [("numero", "ge", "SSA-5", True)],
+    ]
+    for invalid in (
+        "{nada} = 1",
+        "{estado} ~ 1",
+        "{estado} =",
+        "&& {estado} = A",
+        "{estado} contains AAD and",
+        "{estado} = A && && {numero} = B",
+        "{estado} = A || && {numero} = B",
+        "{estado} = A && || {numero} = B",
+        "{estado} = A ||",
+    ):
+        with pytest.raises(ValueError):
+            parse_filter_query(invalid)
+
+
+def test_page_matches_pandas_reference():
+    for df in (_frame(), to_categorical(_frame())):
+        query = TableQuery(df)
+        sort_by = [
+            {"column_id": "resp_exec", "direction": "desc"},
+            {"column_id": "data_emissao", "direction": "asc"},
+        ]
+        rows, page_count, current = query.page(
+            1, 20, sort_by, "{estado} ne AAD && {data_emissao} >= 10/09/2025"
+        )
+        ref = df[(df[C.SITUACAO] != "AAD") & (df[C.EMITIDA_EM] >= pd.Timestamp(2025, 9, 10))]
+        ref = ref.sort_values(
+            [C.RESPONSAVEL_EXECUCAO, C.EMITIDA_EM], ascending=[False, True], kind="stable"
+        )
+        assert page_count == -(-len(ref) // 20) and current == 1
+        assert list(rows.index) == list(ref.index[20:40])
+
+        # Página além do fim é limitada à última
+        assert query.page(99, 20, sort_by)[2] == query.page(0, 20)[1] - 1
+        # Sem caixa / blank
+        assert query.select("{resp_prog} icontains an").sum() == (
+            df[C.RESPONSAVEL_PROGRAMACAO] == "ANA"
+        ).sum()
+        assert query.select("{resp_exec} is blank").sum() == (df[C.RESPONSAVEL_EXECUCAO] == "").sum()
+
+
+def test_table_callback_returns_only_the_visible_page():
+    from src.dashboard.Class.src.dashboard.ssa_dashboard import SSADashboard
+
+    df = _frame(120)
+    app = SSADashboard(df)
+    outputs = [("ssa-table", "data"), ("ssa-table", "page_count"), ("ssa-table", "page_current")]
+    extra = [
+        ("ssa-table", "page_current", 1),
+        ("ssa-table", "page_size", 30),
+        ("ssa-table", "sort_by", [{"column_id": "numero", "direction": "asc"}]),
+        ("ssa-table", "filter_query", "{setor_emissor} = E1 && {estado} bogus"),
+    ]
+    response = _post(app, outputs, [None] * len(FILTER_IDS), extra, "ssa-table.page_current")
+    table = response["ssa-table"]
+    # Filtro inválido é ignorado: 120 linhas em 4 páginas, página 1 mantida
+    assert table["page_count"] == 4 and table["page_current"] == 1
+    expected = df.sort_values(C.NUMERO_SSA, kind="stable").iloc[30:60]
+    assert table["data"] == app._prepare_table_data(expected)
+
+    # Mudança de filtro volta para a primeira página
+    extra[3] = ("ssa-table", "filter_query", "{setor_emissor} = E1")
+    response = _post(app, outputs, [None] * len(FILTER_IDS), extra, "ssa-table.filter_query")
+    assert response["ssa-table"]["page_current"] == 0
+    assert len(response["ssa-table"]["data"]) == min(30, (df[C.SETOR_EMISSOR] == "E1").sum())
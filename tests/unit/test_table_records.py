@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from test_table_query import _frame
+from src.dashboard.Class.src.dashboard.table_records import build_table_records
+from src.dashboard.Class.src.data.categoricals import to_categorical
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+
+
+def _iterrows_records(df):
+    return [
+        {
+            "numero": f"[{row.iloc[C.NUMERO_SSA]}](https://osprd.itaipu/SAM_SMA/SSAPublicView.aspx?SerialNumber={row.iloc[C.NUMERO_SSA]}&language=pt)",
+            "estado": row.iloc[C.SITUACAO],
+            "setor_emissor": row.iloc[C.SETOR_EMISSOR],
+            "setor_executor": row.iloc[C.SETOR_EXECUTOR],
+            "resp_prog": row.iloc[C.RESPONSAVEL_PROGRAMACAO],
+            "resp_exec": row.iloc[C.RESPONSAVEL_EXECUCAO],
+            "semana_prog": row.iloc[C.SEMANA_PROGRAMADA],
+            "prioridade": row.iloc[C.GRAU_PRIORIDADE_EMISSAO],
+            "data_emissao": (
+                row.iloc[C.EMITIDA_EM].strftime("%d/%m/%Y %H:%M")
+                if pd.notnull(row.iloc[C.EMITIDA_EM])
+                else ""
+            ),
+            "descricao": row.iloc[C.DESC_SSA],
+        }
+        for _, row in df.iterrows()
+    ]
+
+
+def test_records_match_iterrows_builder():
+    for df in (_frame(), to_categorical(_frame())):
+        records = build_table_records(df)
+        assert records == _iterrows_records(df)
+        assert records[3]["data_emissao"] == ""
+        assert build_table_records(df.iloc[:0]) == []
+
+    # Subconjunto de colunas sem link/data (dashboard legado)
+    legacy = build_table_records(
+        df.iloc[:5], {"numero": C.NUMERO_SSA, "estado": C.SITUACAO}, link_columns=(), date_columns=()
+    )
+    assert legacy == [
+        {"numero": n, "estado": s} for n, s in zip(df.iloc[:5, C.NUMERO_SSA], df.iloc[:5, C.SITUACAO])
+    ]
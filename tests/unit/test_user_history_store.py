@@ -0,0 +1,68 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from test_filter_index import _canonical
+from src.dashboard.Class.src.dashboard import user_history
+from src.dashboard.Class.src.dashboard.user_history import UserHistory
+
+
+def test_ring_buffer_expiry_and_batched_persistence(tmp_path, monkeypatch):
+    db = tmp_path / "history.db"
+    history = UserHistory(size=3, idle_seconds=60, db_path=str(db), flush_every=4)
+    for i in range(5):
+        history.add("a", f"acao {i}")
+    history.add("b", "outra sessão", "filter")
+
+    # Só as últimas 3 ações de "a", sem misturar com "b"
+    assert [item["action"] for item in history.items("a")] == ["acao 2", "acao 3", "acao 4"]
+    assert [item["action"] for item in history.recent("a", 2)] == ["acao 4", "acao 3"]
+    assert history.count("b") == 1 and history.recent("nenhuma", 5) == []
+
+    # Um lote de 4 gravado; o resto só no flush
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM user_history").fetchone()[0] == 4
+    history.flush()
+    with sqlite3.connect(db) as conn:
+        rows = conn.execute("SELECT session, type, action FROM user_history").fetchall()
+    assert len(rows) == 6 and rows[-1] == ("b", "filter", "outra sessão")
+
+    # Sessão ociosa some na próxima escrita
+    now = user_history.time.monotonic()
+    monkeypatch.setattr(user_history.time, "monotonic", lambda: now + 61)
+    history.add("c", "nova")
+    assert len(history) == 1 and history.items("a") == []
+
+
+def test_dashboard_keeps_one_history_per_browser_session():
+    from src.dashboard.Class.src.dashboard.ssa_dashboard import SSADashboard
+
+    app = SSADashboard(_canonical(30))
+    first, second = app.app.server.test_client(), app.app.server.test_client()
+    first.get("/")
+    first.get("/_dash-layout")
+    second.get("/")
+    session_id = first.get_cookie("ssa_history_session").value
+    assert session_id != second.get_cookie("ssa_history_session").value
+
+    # Rotas internas do Dash não entram no histórico
+    assert [item["action"] for item in app.user_history.items(session_id)] == ["Acessou: /"]
+    assert len(app.user_history) == 2
+
+
+def test_flush_failure_is_logged_not_raised(tmp_path, caplog):
+    blocker = tmp_path / "afile"
+    blocker.write_text("")
+    history = UserHistory(db_path=str(blocker / "sub" / "h.db"), flush_every=1)
+
+    history.add("s", "x")  # makedirs falha (NotADirectoryError) sem propagar
+
+    assert [item["action"] for item in history.items("s")] == ["x"]
+    assert "1 ações descartadas" in caplog.text
+    history.add("s", "y")
+    assert history.count("s") == 2
@@ -0,0 +1,70 @@
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+import pandas as pd
+
+REPO = Path(__file__).resolve().parents[2]
+SCRIPT = REPO / "scripts" / "validate_excels.py"
+
+
+def _write_exports(folder, sizes):
+    for name, n in sizes:
+        df = pd.DataFrame(
+            {
+                "Número da SSA": [f"SSA-{i}" for i in range(n)],
+                "Situação": ["AAD"] * n,
+                "Emitida Em": ["01/09/2025 10:00:00"] * n,
+                "Grau de Prioridade Emissão": ["S2"] * n,
+            }
+        )
+        with pd.ExcelWriter(folder / name) as xw:
+            df.to_excel(xw, index=False)
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), *map(str, args), "--no-cache"],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def test_parallel_validation_writes_sorted_report(tmp_path):
+    _write_exports(tmp_path, (("b.xlsx", 2), ("a.xlsx", 3), ("c.xlsx", 1)))
+    (tmp_path / "broken.xlsx").write_bytes(b"not an excel file")
+
+    out = tmp_path / "report.md"
+    proc = _run(tmp_path, "--jobs", 2, "--out", out, "--state", tmp_path / "state.json")
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.count("[") >= 4
+
+    report = out.read_text(encoding="utf-8")
+    sections = [line[3:] for line in report.splitlines() if line.startswith("## ")]
+    assert sections == ["a.xlsx", "b.xlsx", "broken.xlsx", "c.xlsx"]
+    assert "Files scanned: 4 | OK: 3 | FAIL: 1" in report
+    assert "Jobs: 2" in report and report.count("- Time: ") == 4
+    assert "- Rows: 3" in report
+
+
+def test_unchanged_and_duplicate_files_are_not_revalidated(tmp_path):
+    data = tmp_path / "downloads"
+    data.mkdir()
+    _write_exports(data, (("a.xlsx", 2), ("b.xlsx", 3)))
+    shutil.copy(data / "a.xlsx", data / "a_copy.xlsx")
+    out, state = tmp_path / "report.md", tmp_path / "state.json"
+
+    assert _run(data, "--out", out, "--state", state).returncode == 0
+    first = json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+    assert first["summary"]["validated"] == 2 and first["summary"]["aliases"] == 1
+    alias = next(f for f in first["files"] if f["file"] == "a_copy.xlsx")
+    assert alias["alias_of"] == "a.xlsx" and alias["rows"] == 2
+
+    proc = _run(data, "--out", out, "--state", state)
+    second = json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+    assert "[" not in proc.stdout  # nada foi re-validado
+    assert second["summary"]["reused"] == 2 and second["summary"]["validated"] == 0
+    assert [f["rows"] for f in second["files"]] == [2, 2, 3]
+    assert "Alias of: a.xlsx" in out.read_text(encoding="utf-8")
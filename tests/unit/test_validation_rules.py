@@ -0,0 +1,105 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Ensure repo root on path
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from src.dashboard.Class.src.data.categoricals import to_categorical
+from src.dashboard.Class.src.data.ssa_columns import SSAColumns as C
+from src.dashboard.Class.src.utils.validation_rules import (
+    DEFAULT_RULES,
+    RuleRegistry,
+    ValidationRule,
+)
+
+NOW = datetime(2025, 9, 10)
+
+
+def _frame():
+    n = 6
+    df = pd.DataFrame({idx: [""] * n for idx in C.COLUMN_NAMES}, index=[10, 11, 12, 13, 14, 15])
+    df[C.NUMERO_SSA] = ["SSA-1", "SSA-2", "SSA-2", "", "SSA-5", "SSA-6"]
+    df[C.SITUACAO] = ["AAD", "APL", "XYZ", "AAD", "", "ADM"]
+    df[C.GRAU_PRIORIDADE_EMISSAO] = ["S1", "S2", "S2", "S1", "S1", ""]
+    df[C.EMITIDA_EM] = pd.to_datetime(
+        ["2025-09-01", "2025-09-02", None, "2025-12-01", "2025-09-03", "2025-09-04"]
+    )
+    df[C.SETOR_EXECUTOR] = ["SX1", "", "SX1", "SX2", "", "SX3"]
+    df[C.RESPONSAVEL_EXECUCAO] = ["ana", "bia", "", "", "nan", ""]
+    df[C.SEMANA_CADASTRO] = ["202536", "202554", "202536", "2025", "202536", "202501"]
+    df[C.SEMANA_PROGRAMADA] = ["", "202537", "abc", "", "", ""]
+    return df
+
+
+EXPECTED = {
+    ("numero_vazio", 13),
+    ("situacao_vazia", 14),
+    ("prioridade_vazia", 15),
+    ("data_invalida", 12),
+    ("data_futura", 13),
+    ("responsavel_sem_setor", 11),
+    ("numero_duplicado", 11),
+    ("numero_duplicado", 12),
+    ("semana_cadastro_invalida", 11),
+    ("semana_cadastro_invalida", 13),
+    ("semana_programada_invalida", 12),
+    ("situacao_desconhecida", 12),
+}
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_default_rules_issue_table(categorical):
+    df = _frame()
+    if categorical:
+        df = to_categorical(df)
+    issues, stats = DEFAULT_RULES.evaluate(df, now=NOW, return_stats=True)
+
+    assert list(issues.columns) == ["rule", "row", "value"]
+    assert set(zip(issues["rule"].astype(str), issues["row"])) == EXPECTED
+    # Ordenada por regra (ordem de registro) e linha; valor original da coluna
+    dup = issues[issues["rule"] == "numero_duplicado"]
+    assert dup["row"].tolist() == [11, 12] and dup["value"].tolist() == ["SSA-2", "SSA-2"]
+    assert DEFAULT_RULES.summarize(issues)["semana_cadastro_invalida"] == 2
+    assert stats["rows"] == 6 and stats["issues"] == len(issues)
+    assert stats["rows_per_second"] > 0
+    assert not hasattr(DEFAULT_RULES, "last_stats")
+
+    # Subconjunto de regras: mesma tabela, só com as regras pedidas
+    subset = DEFAULT_RULES.evaluate(df, now=NOW, names=["numero_duplicado", "numero_vazio"])
+    assert list(subset["rule"].cat.categories) == ["numero_vazio", "numero_duplicado"]
+    assert set(zip(subset["rule"].astype(str), subset["row"])) == {
+        pair for pair in EXPECTED if pair[0] in ("numero_vazio", "numero_duplicado")
+    }
+    with pytest.raises(ValueError):
+        DEFAULT_RULES.evaluate(df, names=["nao_existe"])
+
+
+def test_registry_custom_rule_and_labels():
+    registry = RuleRegistry()
+
+    @registry.rule("setor_curto", C.SETOR_EXECUTOR, "setor curto")
+    def _setor_curto(ctx):
+        return ctx.per_value(C.SETOR_EXECUTOR, lambda v: len(v) == 1)
+
+    with pytest.raises(ValueError):
+        registry.register(ValidationRule("setor_curto", C.SETOR_EXECUTOR, "x", lambda ctx: None))
+
+    df = pd.DataFrame({"Setor Executor": ["A", " SX1 ", None]})
+    issues = registry.evaluate(df, {C.SETOR_EXECUTOR: "Setor Executor"})
+    assert issues["row"].tolist() == [0]
+    assert registry.format_summary(issues) == "1 setor curto"
+
+
+def test_dashboard_reuses_loader_issue_table():
+    from src.dashboard.Class.src.dashboard.ssa_dashboard import SSADashboard
+
+    df = _frame()
+    issues = DEFAULT_RULES.evaluate(df, now=NOW)
+    app = SSADashboard(df, history_db=None, validation_issues=issues)
+    assert app.validation_issues is issues